@@ -0,0 +1,151 @@
+import logging
+from typing import AsyncIterator
+
+from app.application.api.books.schemas import (
+    CreateBookScheme,
+    DeleteBookScheme,
+    ReadAllBookScheme,
+    ReadBookScheme,
+    UpdateBookScheme,
+)
+from app.domain.entities.books import Book
+from app.exceptions import ApplicationException
+from app.infrastructure.container import AsyncContainer
+from app.infrastructure.message_bus import AsyncMessageBus
+from app.infrastructure.uow.books.factory import get_async_books_unit_of_work
+from app.logic.commands.books import (
+    CreateBookCommand,
+    DeleteBookCommand,
+    GetBookByIdCommand,
+    StreamAllBooksCommand,
+    UpdateBookCommand,
+)
+from app.logic.handlers import (
+    ASYNC_COMMANDS_HANDLERS_FOR_INJECTION,
+    ASYNC_EVENTS_HANDLERS_FOR_INJECTION,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Async versions of functions from app/application/api/books/dependecies for asyncio applications,
+# storage operations run in a thread pool, so they do not block the event loop
+container: AsyncContainer = AsyncContainer(
+    uow_factory=get_async_books_unit_of_work,
+    events_handlers_for_injection=ASYNC_EVENTS_HANDLERS_FOR_INJECTION,
+    commands_handlers_for_injection=ASYNC_COMMANDS_HANDLERS_FOR_INJECTION,
+)
+
+
+async def create(book_data: CreateBookScheme) -> Book:
+    """
+    Function which creates a book, it must be called using dependency injection.
+    For example: it can be called using Depends from FastAPI.
+    """
+    try:
+        messagebus: AsyncMessageBus = container.get_async_messagebus()
+
+        await messagebus.handle(CreateBookCommand(**book_data.model_dump()))
+
+        logger.info("Successfully created book [ %s ]", messagebus.command_result)
+
+        return messagebus.command_result
+
+    except ApplicationException as e:
+        logger.error(e.message)
+        # If it were possible to use FastAPI, then HTTP Exception would be thrown here
+        return  # type: ignore
+
+
+async def read(book_data: ReadBookScheme) -> Book:
+    """
+    Function which finds book, it must be called using dependency injection.
+    For example: it can be called using Depends from FastAPI.
+    """
+    try:
+        messagebus: AsyncMessageBus = container.get_async_messagebus()
+
+        await messagebus.handle(GetBookByIdCommand(**book_data.model_dump()))
+
+        logger.info("Successfully find book [ %s ]", messagebus.command_result)
+
+        return messagebus.command_result
+
+    except ApplicationException as e:
+        logger.error(e.message)
+        # If it were possible to use FastAPI, then HTTP Exception would be thrown here
+        return  # type: ignore
+
+
+async def read_all(_: ReadAllBookScheme) -> AsyncIterator[Book]:
+    """
+    Function which return all books in library, it must be called using dependency injection.
+    For example: it can be called using Depends from FastAPI with StreamingResponse.
+    Books are read page by page, while the result is iterated, so the whole library is never in memory at once.
+    """
+    try:
+        messagebus: AsyncMessageBus = container.get_async_messagebus()
+
+        await messagebus.handle(StreamAllBooksCommand())
+
+        logger.info("Successfully started reading of all books")
+
+        return _stop_on_error(messagebus.command_result)
+
+    except ApplicationException as e:
+        logger.error(e.message)
+        # If it were possible to use FastAPI, then HTTP Exception would be thrown here
+        return  # type: ignore
+
+
+async def _stop_on_error(books: AsyncIterator[Book]) -> AsyncIterator[Book]:
+    """
+    Later pages are read, while the result of 'read_all' is iterated, so their errors are raised outside
+    of its try block. They are logged and iteration stops.
+    """
+    try:
+        async for book in books:
+            yield book
+
+    except ApplicationException as e:
+        logger.error(e.message)
+
+
+async def update(book_data: UpdateBookScheme) -> Book:
+    """
+    Function which updates a book, it must be called using dependency injection.
+    For example: it can be called using Depends from FastAPI.
+    """
+    try:
+        messagebus: AsyncMessageBus = container.get_async_messagebus()
+
+        await messagebus.handle(UpdateBookCommand(**book_data.model_dump()))
+
+        logger.info("Successfully updated book [ %s ]", messagebus.command_result)
+
+        return messagebus.command_result
+
+    except ApplicationException as e:
+        logger.error(e.message)
+        # If it were possible to use FastAPI, then HTTP Exception would be thrown here
+        return  # type: ignore
+
+
+async def delete(book_data: DeleteBookScheme) -> None:
+    """
+    Function which deletes a book, it must be called using dependency injection.
+    For example: it can be called using Depends from FastAPI.
+    """
+    try:
+        messagebus: AsyncMessageBus = container.get_async_messagebus()
+
+        await messagebus.handle(DeleteBookCommand(**book_data.model_dump()))
+
+        logger.info("Successfully deleted book")
+
+        return messagebus.command_result
+
+    except ApplicationException as e:
+        logger.error(e.message)
+        # If it were possible to use FastAPI, then HTTP Exception would be thrown here
+        return  # type: ignore
@@ -1,23 +1,37 @@
 import logging
-from typing import List
+from typing import (
+    Final,
+    Iterator,
+    List,
+)
 
 from app.application.api.books.schemas import (
     CreateBookScheme,
     DeleteBookScheme,
+    ImportBooksScheme,
     ReadAllBookScheme,
     ReadBookScheme,
+    ReadBooksPageScheme,
+    SearchBooksScheme,
+    SuggestBooksScheme,
     UpdateBookScheme,
 )
 from app.domain.entities.books import Book
 from app.exceptions import ApplicationException
-from app.infrastructure.bootstrap import Bootstrap
+from app.infrastructure.container import Container
 from app.infrastructure.message_bus import MessageBus
-from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.services.importing import ImportReport
+from app.infrastructure.services.pagination import Page
+from app.infrastructure.uow.books.factory import get_books_unit_of_work
 from app.logic.commands.books import (
     CreateBookCommand,
     DeleteBookCommand,
-    GetAllBooksCommand,
     GetBookByIdCommand,
+    GetBooksPageCommand,
+    ImportBooksCommand,
+    SearchBooksCommand,
+    StreamAllBooksCommand,
+    SuggestBooksCommand,
     UpdateBookCommand,
 )
 from app.logic.handlers import (
@@ -28,6 +42,16 @@ from app.logic.handlers import (
 
 logger = logging.getLogger(__name__)
 
+# Feed may have thousands of rejected rows, so only the first ones are logged
+MAX_LOGGED_REJECTED_ROWS: Final[int] = 20
+
+# Handlers are inspected once per process, every call gets its own message bus and unit of work
+container: Container = Container(
+    uow_factory=get_books_unit_of_work,
+    events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
+    commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION,
+)
+
 
 def create(book_data: CreateBookScheme) -> Book:
     """
@@ -35,13 +59,7 @@ def create(book_data: CreateBookScheme) -> Book:
     For example: it can be called using Depends from FastAPI.
     """
     try:
-        bootstrap: Bootstrap = Bootstrap(
-            uow=JsonBooksUnitOfWork(),
-            events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-            commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION,
-        )
-
-        messagebus: MessageBus = bootstrap.get_messagebus()
+        messagebus: MessageBus = container.get_messagebus()
 
         messagebus.handle(CreateBookCommand(**book_data.model_dump()))
 
@@ -62,13 +80,7 @@ def read(book_data: ReadBookScheme) -> Book:
     For example: it can be called using Depends from FastAPI.
     """
     try:
-        bootstrap: Bootstrap = Bootstrap(
-            uow=JsonBooksUnitOfWork(),
-            events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-            commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION,
-        )
-
-        messagebus: MessageBus = bootstrap.get_messagebus()
+        messagebus: MessageBus = container.get_messagebus()
 
         messagebus.handle(GetBookByIdCommand(**book_data.model_dump()))
 
@@ -83,23 +95,73 @@ def read(book_data: ReadBookScheme) -> Book:
         return  # type: ignore
 
 
-def read_all(_: ReadAllBookScheme) -> List[Book]:
+def read_all(_: ReadAllBookScheme) -> Iterator[Book]:
     """
     Function which return all books in library, it must be called using dependency injection.
+    For example: it can be called using Depends from FastAPI with StreamingResponse.
+    Books are read page by page, while the result is iterated, so the whole library is never in memory at once.
+    """
+    try:
+        messagebus: MessageBus = container.get_messagebus()
+
+        messagebus.handle(StreamAllBooksCommand())
+
+        logger.info("Successfully started reading of all books")
+
+        return _stop_on_error(messagebus.command_result)
+
+    except ApplicationException as e:
+        logger.error(e.message)
+        # This is done so that the console application does not go down.
+        # If it were possible to use FastAPI, then HTTP Exception would be thrown here
+        return  # type: ignore
+
+
+def _stop_on_error(books: Iterator[Book]) -> Iterator[Book]:
+    """
+    Later pages are read, while the result of 'read_all' is iterated, so their errors (for example, lock timeout)
+    are raised outside of its try block. They are logged and iteration stops, so the console application
+    does not go down.
+    """
+    try:
+        yield from books
+
+    except ApplicationException as e:
+        logger.error(e.message)
+
+
+def read_page(page_data: ReadBooksPageScheme) -> Page[Book]:
+    """
+    Function which returns one page of books and cursor of the next page, it must be called using dependency injection.
     For example: it can be called using Depends from FastAPI.
     """
     try:
-        bootstrap: Bootstrap = Bootstrap(
-            uow=JsonBooksUnitOfWork(),
-            events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-            commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION,
-        )
+        messagebus: MessageBus = container.get_messagebus()
+
+        messagebus.handle(GetBooksPageCommand(**page_data.model_dump()))
+
+        logger.info("Successfully read page of books [ %s ]", messagebus.command_result.items)
+
+        return messagebus.command_result
+
+    except ApplicationException as e:
+        logger.error(e.message)
+        # This is done so that the console application does not go down.
+        # If it were possible to use FastAPI, then HTTP Exception would be thrown here
+        return  # type: ignore
 
-        messagebus: MessageBus = bootstrap.get_messagebus()
 
-        messagebus.handle(GetAllBooksCommand())
+def search(search_data: SearchBooksScheme) -> List[Book]:
+    """
+    Function which finds books by words of title and author, it must be called using dependency injection.
+    For example: it can be called using Depends from FastAPI.
+    """
+    try:
+        messagebus: MessageBus = container.get_messagebus()
+
+        messagebus.handle(SearchBooksCommand(**search_data.model_dump()))
 
-        logger.info("Successfully read all books [ %s ]", messagebus.command_result)
+        logger.info("Successfully found books [ %s ]", messagebus.command_result)
 
         return messagebus.command_result
 
@@ -110,15 +172,30 @@ def read_all(_: ReadAllBookScheme) -> List[Book]:
         return  # type: ignore
 
 
-def update(book_data: UpdateBookScheme) -> Book:
+def suggest(suggest_data: SuggestBooksScheme) -> List[Book]:
+    """
+    Function which completes the prefix by titles and authors of books, it must be called using dependency injection.
+    For example: it can be called using Depends from FastAPI.
+    """
     try:
-        bootstrap: Bootstrap = Bootstrap(
-            uow=JsonBooksUnitOfWork(),
-            events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-            commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION,
-        )
+        messagebus: MessageBus = container.get_messagebus()
+
+        messagebus.handle(SuggestBooksCommand(**suggest_data.model_dump()))
 
-        messagebus: MessageBus = bootstrap.get_messagebus()
+        logger.info("Successfully suggested books [ %s ]", messagebus.command_result)
+
+        return messagebus.command_result
+
+    except ApplicationException as e:
+        logger.error(e.message)
+        # This is done so that the console application does not go down.
+        # If it were possible to use FastAPI, then HTTP Exception would be thrown here
+        return  # type: ignore
+
+
+def update(book_data: UpdateBookScheme) -> Book:
+    try:
+        messagebus: MessageBus = container.get_messagebus()
 
         messagebus.handle(UpdateBookCommand(**book_data.model_dump()))
 
@@ -139,13 +216,7 @@ def delete(book_data: DeleteBookScheme) -> None:
     For example: it can be called using Depends from FastAPI.
     """
     try:
-        bootstrap: Bootstrap = Bootstrap(
-            uow=JsonBooksUnitOfWork(),
-            events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-            commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION,
-        )
-
-        messagebus: MessageBus = bootstrap.get_messagebus()
+        messagebus: MessageBus = container.get_messagebus()
 
         messagebus.handle(DeleteBookCommand(**book_data.model_dump()))
 
@@ -158,3 +229,30 @@ def delete(book_data: DeleteBookScheme) -> None:
         # This is done so that the console application does not go down.
         # If it were possible to use FastAPI, then HTTP Exception would be thrown here
         return  # type: ignore
+
+
+def import_file(import_data: ImportBooksScheme) -> ImportReport:
+    """
+    Function which imports books from CSV or JSONL file, it must be called using dependency injection.
+    For example: it can be called using Depends from FastAPI.
+    """
+    try:
+        messagebus: MessageBus = container.get_messagebus()
+
+        messagebus.handle(ImportBooksCommand(**import_data.model_dump()))
+
+        report: ImportReport = messagebus.command_result
+        logger.info(
+            "Successfully imported %s of %s rows in %.1f s (%.0f rows/s), rejected %s rows",
+            report.imported, report.read, report.elapsed, report.throughput, len(report.rejected),
+        )
+        for row in report.rejected[:MAX_LOGGED_REJECTED_ROWS]:
+            logger.warning("Rejected row on line %s: %s", row.line, row.reason)
+
+        return report
+
+    except ApplicationException as e:
+        logger.error(e.message)
+        # This is done so that the console application does not go down.
+        # If it were possible to use FastAPI, then HTTP Exception would be thrown here
+        return  # type: ignore
@@ -14,15 +14,21 @@ But the problem is that I wrote my code in sync mode, because application must b
 from app.application.api.books.dependecies import (
     create,
     delete,
+    import_file,
     read,
-    read_all,
+    read_page,
+    search,
+    suggest,
     update,
 )
 from app.application.api.books.schemas import (
     CreateBookScheme,
     DeleteBookScheme,
-    ReadAllBookScheme,
+    ImportBooksScheme,
     ReadBookScheme,
+    ReadBooksPageScheme,
+    SearchBooksScheme,
+    SuggestBooksScheme,
     UpdateBookScheme,
 )
 
@@ -81,6 +87,39 @@ def read_book() -> None:
 
 def read_all_books() -> None:
     """
-    Function that associated with handler read all books
+    Function that associated with handler read all books, books are shown page by page
     """
-    read_all(ReadAllBookScheme())
+    page = read_page(ReadBooksPageScheme())
+
+    while page is not None and page.next_cursor is not None:
+        if input("Show the next page? (y/n): ").strip().lower() != "y":
+            return
+
+        page = read_page(ReadBooksPageScheme(cursor=page.next_cursor))
+
+
+def search_books() -> None:
+    """
+    Function that associated with handler search books (finds books by words of title and author)
+    """
+    query = input("Please write words of the title or author: ")
+
+    search(SearchBooksScheme(query=query))
+
+
+def suggest_books() -> None:
+    """
+    Function that associated with handler suggest books (completes the start of a word of title or author)
+    """
+    prefix = input("Please write the start of the title or author: ")
+
+    suggest(SuggestBooksScheme(prefix=prefix))
+
+
+def import_books() -> None:
+    """
+    Function that associated with handler import books (loads books from CSV or JSONL file)
+    """
+    path = input("Please write path to CSV or JSONL file: ")
+
+    import_file(ImportBooksScheme(path=path))
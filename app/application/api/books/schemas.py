@@ -28,6 +28,7 @@ class UpdateBookScheme(BaseScheme):
     author: str
     year: int
     status: str
+    version: Optional[int] = None
 
 
 @dataclass(frozen=True)
@@ -43,3 +44,23 @@ class DeleteBookScheme(BaseScheme):
 @dataclass(frozen=True)
 class ReadAllBookScheme(BaseScheme):
     ...
+
+
+@dataclass(frozen=True)
+class ReadBooksPageScheme(BaseScheme):
+    cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SearchBooksScheme(BaseScheme):
+    query: str
+
+
+@dataclass(frozen=True)
+class SuggestBooksScheme(BaseScheme):
+    prefix: str
+
+
+@dataclass(frozen=True)
+class ImportBooksScheme(BaseScheme):
+    path: str
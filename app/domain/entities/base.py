@@ -1,34 +1,66 @@
 from abc import ABC
+from copy import deepcopy
 from dataclasses import (
-    asdict,
     dataclass,
     field,
+    Field,
+    fields,
+    MISSING,
 )
 from typing import (
     Any,
+    Callable,
     Dict,
+    Final,
     get_type_hints,
+    Iterable,
+    Iterator,
+    List,
     Optional,
+    Self,
     Set,
+    Tuple,
+    Type,
 )
 from uuid import uuid4
 
 from app.domain.exceptions import CastException
+from app.domain.values.base import BaseValueObject
 
 
-@dataclass(eq=False)
+# Fields of the entity class with their types, which must be cast on creation of the entity
+CoercionPlan = Tuple[Tuple[str, type], ...]
+# Generated function, which converts entity into dictionary of primitives
+Serializer = Callable[[Any], Dict[str, Any]]
+# Generated function, which creates entity from dictionary of primitives without validation
+Deserializer = Callable[[Dict[str, Any]], Any]
+
+# Types of fields, which are immutable, so they are put into dictionary as is
+PRIMITIVE_TYPES: Final[Tuple[type, ...]] = (str, int, float, bool, type(None))
+
+_coercion_plans: Dict[type, CoercionPlan] = {}
+_serializers: Dict[type, Serializer] = {}
+_deserializers: Dict[type, Deserializer] = {}
+
+
+@dataclass(eq=False, slots=True)
 class BaseEntity(ABC):
     """
     Base entity, from which any domain model should be inherited.
+
+    'version' is the number of stored changes of the entity. Repositories save the entity only if the stored
+    version is still the same as the version of the entity, and increase it, so concurrent changes are detected.
     """
 
     oid: str = field(default_factory=lambda: str(uuid4()), kw_only=True)
+    version: int = field(default=0, kw_only=True)
 
     def __post_init__(self) -> None:
-        for field_name, field_type in get_type_hints(self).items():
-            if field_name == 'oid':
-                continue
+        plan: Optional[CoercionPlan] = _coercion_plans.get(type(self))
+        if plan is None:
+            plan = self.__build_coercion_plan()
 
+        for field_name, field_type in plan:
             value = getattr(self, field_name, None)
             if not isinstance(value, field_type):
                 try:
@@ -36,6 +68,115 @@ class BaseEntity(ABC):
                 except (ValueError, TypeError):
                     raise CastException(f"'{field_name}' with value '{value}' to {field_type}")
 
+    def __build_coercion_plan(self) -> CoercionPlan:
+        """
+        Resolves type hints of the entity class once, every next instance of the class uses cached plan.
+        """
+        plan: CoercionPlan = tuple(
+            (field_name, field_type) for field_name, field_type in get_type_hints(self).items() if field_name != 'oid'
+        )
+        _coercion_plans[type(self)] = plan
+        return plan
+
+    @classmethod
+    def restore(cls, data: Dict[str, Any]) -> Self:
+        """
+        Creates entity from data, which has been validated before, for example, read from own storage
+        with matching checksum. Casts and validation of value objects are skipped.
+        """
+        deserializer: Optional[Deserializer] = _deserializers.get(cls)
+        if deserializer is None:
+            deserializer = cls.__build_deserializer()
+
+        return deserializer(data)  # type: ignore[no-any-return]
+
+    @classmethod
+    def iter_dicts(cls, entities: Iterable[Self]) -> Iterator[Dict[str, Any]]:
+        """
+        Converts entities of the class into dictionaries one by one, as 'to_dict' without arguments does.
+        Serializer is looked up once for all of them, so it's the way to serialize the whole catalog.
+        """
+        serializer: Optional[Serializer] = _serializers.get(cls)
+        if serializer is None:
+            serializer = cls.__build_serializer()
+
+        return map(serializer, entities)
+
+    @classmethod
+    def __build_serializer(cls) -> Serializer:
+        """
+        Generates the function, which builds the dictionary in one pass: value objects are unwrapped,
+        primitives are put as is, and only other values are deep-copied, like 'dataclasses.asdict' does.
+        """
+        namespace: Dict[str, Any] = {"deepcopy": deepcopy}
+        items: List[str] = []
+
+        for entity_field, value_object_type, field_type in cls.__fields_with_types():
+            field_name: str = entity_field.name
+            if value_object_type is not None:
+                items.append(f"{field_name!r}: entity.{field_name}.value")
+            elif field_type in PRIMITIVE_TYPES:
+                items.append(f"{field_name!r}: entity.{field_name}")
+            else:
+                items.append(f"{field_name!r}: deepcopy(entity.{field_name})")
+
+        serializer: Serializer = _compile("to_dict", "entity", [f"return {{{', '.join(items)}}}"], namespace)
+        _serializers[cls] = serializer
+        return serializer
+
+    @classmethod
+    def __build_deserializer(cls) -> Deserializer:
+        """
+        Generates the function, which sets fields of the new entity from data: value objects are restored
+        without validation, missing fields get default values.
+        """
+        namespace: Dict[str, Any] = {"cls": cls}
+        lines: List[str] = ["entity = cls.__new__(cls)"]
+
+        for entity_field, value_object_type, _ in cls.__fields_with_types():
+            field_name: str = entity_field.name
+            value: str = f"data[{field_name!r}]"
+            if value_object_type is not None:
+                namespace[f"type_{field_name}"] = value_object_type
+                value = f"type_{field_name}.restore({value})"
+
+            lines.append(f"if {field_name!r} in data:")
+            lines.append(f"    entity.{field_name} = {value}")
+            lines.append("else:")
+
+            if entity_field.default_factory is not MISSING:
+                namespace[f"factory_{field_name}"] = entity_field.default_factory
+                lines.append(f"    entity.{field_name} = factory_{field_name}()")
+            elif entity_field.default is not MISSING:
+                namespace[f"default_{field_name}"] = entity_field.default
+                lines.append(f"    entity.{field_name} = default_{field_name}")
+            else:
+                message: str = f"{cls.__name__} missing required field '{field_name}'"
+                lines.append(f"    raise TypeError({message!r})")
+
+        lines.append("return entity")
+
+        deserializer: Deserializer = _compile("restore", "data", lines, namespace)
+        _deserializers[cls] = deserializer
+        return deserializer
+
+    @classmethod
+    def __fields_with_types(cls) -> List[Tuple[Field[Any], Optional[Type[BaseValueObject[Any]]], Any]]:
+        """
+        :return: every field with value object type (if any) and type hint of the field
+        """
+        type_hints: Dict[str, Any] = get_type_hints(cls)
+        result: List[Tuple[Field[Any], Optional[Type[BaseValueObject[Any]]], Any]] = []
+
+        for entity_field in fields(cls):
+            field_type: Any = type_hints[entity_field.name]
+            value_object_type: Optional[Type[BaseValueObject[Any]]] = (
+                field_type if isinstance(field_type, type) and issubclass(field_type, BaseValueObject) else None
+            )
+            result.append((entity_field, value_object_type, field_type))
+
+        return result
+
     def to_dict(
             self, exclude: Optional[Set[str]] = None, include: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -46,12 +187,11 @@ class BaseEntity(ABC):
         include: set of model fields, which should be included into dictionary representation.
         """
 
-        data: Dict[str, Any] = asdict(self)
+        serializer: Optional[Serializer] = _serializers.get(type(self))
+        if serializer is None:
+            serializer = type(self).__build_serializer()
 
-        # Process nested dictionaries
-        for key, value in data.items():
-            if isinstance(value, dict) and "value" in value:
-                data[key] = value["value"]
+        data: Dict[str, Any] = serializer(self)
 
         # Handle exclude set
         if exclude:
@@ -71,3 +211,9 @@ class BaseEntity(ABC):
 
     def __hash__(self) -> int:
         return hash(self.oid)
+
+
+def _compile(name: str, argument: str, lines: List[str], namespace: Dict[str, Any]) -> Callable[..., Any]:
+    source: str = f"def {name}({argument}):\n" + "".join(f"    {line}\n" for line in lines)
+    exec(source, namespace)
+    return namespace[name]  # type: ignore[no-any-return]
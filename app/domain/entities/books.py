@@ -5,6 +5,7 @@ from dataclasses import (
 )
 
 from app.domain.entities.base import BaseEntity
+from app.domain.utils.enums import BookStatusEnum
 from app.domain.values.books import (
     Author,
     Status,
@@ -13,7 +14,7 @@ from app.domain.values.books import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Book(BaseEntity):
     """
     Domain object, which represents a book.
@@ -28,10 +29,11 @@ class Book(BaseEntity):
     title: Title
     author: Author
     year: Year
-    status: Status = field(default_factory=lambda: Status("in stock"))
+    status: Status = field(default_factory=lambda: Status.shared(BookStatusEnum.IN_STOCK))
 
     def __post_init__(self) -> None:
-        super().__post_init__()
+        BaseEntity.__post_init__(self)
+        self.status = Status.shared(self.status.value)
         logging.debug("Successfully initialized Book instance [ %s ]", self)
 
     __hash__ = BaseEntity.__hash__
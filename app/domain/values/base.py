@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import (
     Any,
     Generic,
+    Self,
     TypeVar,
 )
 
@@ -13,10 +14,13 @@ from typing import (
 T = TypeVar("T", bound=Any)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseValueObject(ABC, Generic[T]):
     """
     Base value object, from which any domain value object should be inherited.
+
+    Value objects are slotted, because every book holds several of them. Slotted dataclasses are recreated
+    by the decorator, so methods of subclasses must call methods of bases explicitly instead of super().
     """
 
     value: T
@@ -24,6 +28,16 @@ class BaseValueObject(ABC, Generic[T]):
     def __post_init__(self) -> None:
         self.validate()
 
+    @classmethod
+    def restore(cls, value: T) -> Self:
+        """
+        Creates value object without validation. Must be used only for values,
+        which have been validated before, for example, read from own storage with matching checksum.
+        """
+        value_object: Self = cls.__new__(cls)
+        object.__setattr__(value_object, "value", value)
+        return value_object
+
     @abstractmethod
     def validate(self) -> None:
         """
@@ -1,9 +1,13 @@
 import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import (
+    Dict,
     Final,
+    Optional,
     override,
+    Self,
 )
 
 from app.domain.exceptions import (
@@ -16,17 +20,12 @@ from app.domain.exceptions import (
 )
 from app.domain.utils.enums import BookStatusEnum
 from app.domain.values.base import BaseValueObject
+from app.domain.values.obscenity import obscenity_filter
 
 
-RUSSIAN_SWEAR_WORDS_PATTERN: Final[str] = (
-    r"(?iu)(?<![а-яё])(?:(?:(?:у|[нз]а|(?:хитро|не)?вз?[ыьъ]|с[ьъ]|(?:и|ра)[зс]ъ?|(?:о[тб]|п[оа]д)[ьъ]?|"
-    r"(?:\S(?=[а-яё]))+?[оаеи-])-?)?(?:[её](?:б(?!о[рй]|рач)|п[уа](?:ц|тс))|и[пб][ае][тцд][ьъ]).*?|(?:(?"
-    r":н[иеа]|(?:ра|и)[зс]|[зд]?[ао](?:т|дн[оа])?|с(?:м[еи])?|а[пб]ч|в[ъы]?|пр[еи])-?)?ху(?:[яйиеёю]|л+и(?!ган))"
-    r".*?|бл(?:[эя]|еа?)(?:[дт][ьъ]?)?|\S*?(?:п(?:[иеё]зд|ид[аое]?р|ед(?:р(?!о)|[аое]р|ик)|охую)|бля(?:[дбц]|тс)|"
-    r"[ое]ху[яйиеё]|хуйн).*?|(?:о[тб]?|про|на|вы)?м(?:анд(?:[ауеыи](?:л(?:и[сзщ])?[ауеиы])?|ой|[ао]в.*?|юк(?:ов|"
-    r"[ауи])?|е[нт]ь|ища)|уд(?:[яаиое].+?|е?н(?:[ьюия]|ей))|[ао]л[ао]ф[ьъ](?:[яиюе]|[еёо]й))|елд[ауые].*?|ля[тд]ь|"
-    r"(?:[нз]а|по)х)(?![а-яё])"
-)
+# Version of validation rules of book values. It must be increased when rules are changed,
+# so books, which have been stored and trusted before, are validated again
+VALIDATORS_VERSION: Final[int] = 1
 
 AUTHOR_FULL_NAME_PATTERN: Final[str] = (
     r"^([А-ЯЁ][а-яё]+(-[А-ЯЁ][а-яё]+)?\s+([А-ЯЁ][а-яё]+(-[А-ЯЁ][а-яё]+)?)(\s+[А-ЯЁ][а-яё]+(-[А-ЯЁ][а-яё]+)?)"
@@ -34,7 +33,7 @@ AUTHOR_FULL_NAME_PATTERN: Final[str] = (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Title(BaseValueObject[str]):
     """
     Value object which associated with the book name
@@ -49,7 +48,7 @@ class Title(BaseValueObject[str]):
         if len(self.value) > 100:
             raise ValueTooLongException(self.value)
 
-        if re.match(RUSSIAN_SWEAR_WORDS_PATTERN, self.value):
+        if obscenity_filter.is_obscene(self.value):
             raise ObsceneTextException(self.value)
 
     @override
@@ -57,7 +56,7 @@ class Title(BaseValueObject[str]):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Author(BaseValueObject[str]):
     """
     Value object which associated with the book author
@@ -75,12 +74,22 @@ class Author(BaseValueObject[str]):
         if not re.match(AUTHOR_FULL_NAME_PATTERN, self.value):
             raise BadNameFormatException(self.value)
 
+    def __post_init__(self) -> None:
+        BaseValueObject.__post_init__(self)
+        # Many books are written by the same author, so they share one string of the name
+        object.__setattr__(self, "value", sys.intern(self.value))
+
+    @classmethod
+    @override
+    def restore(cls, value: str) -> Self:
+        return super(Author, cls).restore(sys.intern(value))
+
     @override
     def as_generic_type(self) -> str:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Year(BaseValueObject[int]):
     """
     Value object which associated with the year of writing the book
@@ -97,13 +106,28 @@ class Year(BaseValueObject[int]):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Status(BaseValueObject[str]):
     """
-    Value object which associated with the book status
+    Value object which associated with the book status.
+    There are only few statuses, so books share instances of them instead of holding own ones.
     """
     value: str
 
+    @classmethod
+    def shared(cls, value: str) -> "Status":
+        """
+        Returns the shared instance of the status. Unknown status is validated as usual.
+        """
+        status: Optional[Status] = _SHARED_STATUSES.get(value)
+        return status if status is not None else cls(value)
+
+    @classmethod
+    @override
+    def restore(cls, value: str) -> Self:
+        status: Optional[Status] = _SHARED_STATUSES.get(value)
+        return status if status is not None else super(Status, cls).restore(value)  # type: ignore[return-value]
+
     @override
     def validate(self) -> None:
         if not self.value:
@@ -115,3 +139,6 @@ class Status(BaseValueObject[str]):
     @override
     def as_generic_type(self) -> str:
         return self.value
+
+
+_SHARED_STATUSES: Final[Dict[str, Status]] = {status.value: Status(status.value) for status in BookStatusEnum}
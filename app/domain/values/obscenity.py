@@ -0,0 +1,89 @@
+import re
+from typing import (
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+
+RUSSIAN_SWEAR_WORDS_PATTERN: Final[str] = (
+    r"(?iu)(?<![а-яё])(?:(?:(?:у|[нз]а|(?:хитро|не)?вз?[ыьъ]|с[ьъ]|(?:и|ра)[зс]ъ?|(?:о[тб]|п[оа]д)[ьъ]?|"
+    r"(?:\S(?=[а-яё]))+?[оаеи-])-?)?(?:[её](?:б(?!о[рй]|рач)|п[уа](?:ц|тс))|и[пб][ае][тцд][ьъ]).*?|(?:(?"
+    r":н[иеа]|(?:ра|и)[зс]|[зд]?[ао](?:т|дн[оа])?|с(?:м[еи])?|а[пб]ч|в[ъы]?|пр[еи])-?)?ху(?:[яйиеёю]|л+и(?!ган))"
+    r".*?|бл(?:[эя]|еа?)(?:[дт][ьъ]?)?|\S*?(?:п(?:[иеё]зд|ид[аое]?р|ед(?:р(?!о)|[аое]р|ик)|охую)|бля(?:[дбц]|тс)|"
+    r"[ое]ху[яйиеё]|хуйн).*?|(?:о[тб]?|про|на|вы)?м(?:анд(?:[ауеыи](?:л(?:и[сзщ])?[ауеиы])?|ой|[ао]в.*?|юк(?:ов|"
+    r"[ауи])?|е[нт]ь|ища)|уд(?:[яаиое].+?|е?н(?:[ьюия]|ей))|[ао]л[ао]ф[ьъ](?:[яиюе]|[еёо]й))|елд[ауые].*?|ля[тд]ь|"
+    r"(?:[нз]а|по)х)(?![а-яё])"
+)
+
+# Every match of the pattern contains one of these roots. Roots of alternatives of the pattern in order:
+# [её]б, [её]п, и[пб] | ху | бл | п[иеё]зд, пид, пед, похую, бля, [ое]ху, хуйн |
+# манд, муд, [ао]л[ао]ф | елд | ля[тд] | нах, зах, пох
+RUSSIAN_SWEAR_WORDS_ROOTS: Final[Tuple[str, ...]] = (
+    "еб", "ёб", "еп", "ёп", "ип", "иб", "ху", "бл", "зд", "пид", "пед",
+    "манд", "муд", "лаф", "лоф", "елд", "лят", "ляд", "нах", "зах", "пох",
+)
+
+# Case-insensitive matching of 're' treats these letters as the same as 'в', 'д', 'о', 'с', 'т' and others,
+# but str.lower() does not, so text with them is always checked by the pattern
+_CASE_FIXED_LETTERS_START: Final[str] = "ᲀ"
+
+
+class ObscenityFilter:
+    """
+    Checks texts by the pattern, which is matched at the start of the text like re.match does.
+
+    The pattern is slow, so it's run only for texts, which may match it:
+    the match starts at the first character and never contains whitespace before the obscene root,
+    so the root must be in the first word of the text. The word is lowercased and searched for the roots,
+    and texts without any of them are clean. Results are exactly the same as results of the pattern.
+    """
+
+    def __init__(self, pattern: str, roots: Iterable[str]) -> None:
+        self._match: Callable[[str], Optional[re.Match[str]]] = re.compile(pattern).match
+        self._search_root: Callable[[str], Optional[re.Match[str]]] = re.compile(
+            "|".join(re.escape(root.lower()) for root in roots)
+        ).search
+
+    def is_obscene(self, text: str) -> bool:
+        if not self._may_match(text):
+            return False
+
+        return self._match(text) is not None
+
+    def is_obscene_many(self, texts: Iterable[str]) -> List[bool]:
+        """
+        Checks many texts at once. Repeated texts are checked only once.
+        :return: flags in the same order as texts
+        """
+        checked: Dict[str, bool] = {}
+        flags: List[bool] = []
+
+        for text in texts:
+            flag: Optional[bool] = checked.get(text)
+            if flag is None:
+                flag = checked[text] = self.is_obscene(text)
+            flags.append(flag)
+
+        return flags
+
+    def _may_match(self, text: str) -> bool:
+        if not text or text[0].isspace():
+            return False
+
+        # Roots are russian, so they are never found in ascii text
+        word: str = text.split(maxsplit=1)[0]
+        if word.isascii():
+            return False
+
+        if max(word) >= _CASE_FIXED_LETTERS_START:
+            return True
+
+        return self._search_root(word.lower()) is not None
+
+
+obscenity_filter: ObscenityFilter = ObscenityFilter(RUSSIAN_SWEAR_WORDS_PATTERN, RUSSIAN_SWEAR_WORDS_ROOTS)
@@ -32,8 +32,8 @@ class Bootstrap:
     def __init__(
             self,
             uow: AbstractUnitOfWork,
-            events_handlers_for_injection: Dict[Type[ET], List[Type[AbstractEventHandler[ET]]]],
-            commands_handlers_for_injection: Dict[Type[CT], Type[AbstractCommandHandler[CT]]],
+            events_handlers_for_injection: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler[Any]]]],
+            commands_handlers_for_injection: Dict[Type[AbstractCommand], Type[AbstractCommandHandler[Any]]],
             dependencies: Optional[Dict[str, Any]] = None,
     ) -> None:
         self._uow = uow
@@ -0,0 +1,162 @@
+import inspect
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from app.infrastructure.message_bus import (
+    AsyncMessageBus,
+    MessageBus,
+)
+from app.infrastructure.uow.base import (
+    AbstractUnitOfWork,
+    AsyncUnitOfWork,
+)
+from app.logic.commands.base import AbstractCommand
+from app.logic.events.base import AbstractEvent
+from app.logic.handlers.base import (
+    AbstractAsyncCommandHandler,
+    AbstractAsyncEventHandler,
+    AbstractCommandHandler,
+    AbstractEventHandler,
+    AbstractHandler,
+)
+
+
+# Unit of work, which handlers of the container take
+UT = TypeVar("UT", AbstractUnitOfWork, AsyncUnitOfWork)
+# Command handler and event handler, which the container creates
+CH = TypeVar("CH", bound=AbstractHandler)
+EH = TypeVar("EH", bound=AbstractHandler)
+HT = TypeVar("HT", bound=AbstractHandler)
+
+# Handler class with names of dependencies, which its constructor takes
+InjectionPlan = Tuple[Type[HT], Tuple[str, ...]]
+
+# Name of the dependency, which is created for every message bus
+UOW_DEPENDENCY: Final[str] = "uow"
+
+
+class BaseContainer(Generic[UT, CH, EH]):
+    """
+    Long-lived container for Dependencies Injection purposes, which is created once per process
+    instead of Bootstrap per command.
+
+    Signatures of handlers are inspected once, when container is created, and every handler gets its injection plan:
+    names of dependencies, which it takes. Every message bus gets its own unit of work from the factory,
+    and handlers are created only for messages, which the message bus handles.
+    """
+
+    def __init__(
+            self,
+            uow_factory: Callable[[], UT],
+            events_handlers_for_injection: Dict[Type[AbstractEvent], List[Type[EH]]],
+            commands_handlers_for_injection: Dict[Type[AbstractCommand], Type[CH]],
+            dependencies: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self._uow_factory: Callable[[], UT] = uow_factory
+        self._dependencies: Dict[str, Any] = dict(dependencies or {})
+        self._events_plans: Dict[Type[AbstractEvent], List[InjectionPlan[EH]]] = {
+            event_type: [self._plan(handler) for handler in event_handlers]
+            for event_type, event_handlers in events_handlers_for_injection.items()
+        }
+        self._commands_plans: Dict[Type[AbstractCommand], InjectionPlan[CH]] = {
+            command_type: self._plan(handler) for command_type, handler in commands_handlers_for_injection.items()
+        }
+
+    def create_command_handler(self, command_type: Type[AbstractCommand], uow: UT) -> CH:
+        return self._create(self._commands_plans[command_type], uow)
+
+    def create_event_handlers(self, event_type: Type[AbstractEvent], uow: UT) -> List[EH]:
+        return [self._create(plan, uow) for plan in self._events_plans[event_type]]
+
+    def _plan(self, handler: Type[HT]) -> InjectionPlan[HT]:
+        params: Dict[str, inspect.Parameter] = dict(inspect.signature(handler).parameters)
+        names: Tuple[str, ...] = tuple(name for name in (UOW_DEPENDENCY, *self._dependencies) if name in params)
+        return handler, names
+
+    def _create(self, plan: InjectionPlan[HT], uow: UT) -> HT:
+        handler, names = plan
+        kwargs: Dict[str, Any] = {
+            name: uow if name == UOW_DEPENDENCY else self._dependencies[name] for name in names
+        }
+        return handler(**kwargs)
+
+
+class Container(BaseContainer[AbstractUnitOfWork, AbstractCommandHandler[Any], AbstractEventHandler[Any]]):
+    """
+    Container of synchronous handlers, which creates message bus for every request.
+    """
+
+    def get_messagebus(self) -> MessageBus:
+        """
+        Creates message bus for one request with its own unit of work.
+        """
+        uow: AbstractUnitOfWork = self._uow_factory()
+
+        return MessageBus(
+            uow=uow,
+            event_handlers=_EventHandlers(self, uow),
+            command_handlers=_CommandHandlers(self, uow),
+        )
+
+
+class AsyncContainer(
+    BaseContainer[AsyncUnitOfWork, AbstractAsyncCommandHandler[Any], AbstractAsyncEventHandler[Any]]
+):
+    """
+    Container of async handlers, which takes the factory of async units of work and creates async message bus
+    for every request.
+    """
+
+    def get_async_messagebus(self) -> AsyncMessageBus:
+        """
+        Creates async message bus for one request with its own async unit of work.
+        """
+        uow: AsyncUnitOfWork = self._uow_factory()
+
+        return AsyncMessageBus(
+            uow=uow,
+            event_handlers=_EventHandlers(self, uow),
+            command_handlers=_CommandHandlers(self, uow),
+        )
+
+
+class _CommandHandlers(Dict[Type[AbstractCommand], CH], Generic[UT, CH]):
+    """
+    Command handlers of one message bus, every handler is created on the first command of its type.
+    """
+
+    def __init__(self, container: BaseContainer[UT, CH, Any], uow: UT) -> None:
+        super().__init__()
+        self._container: BaseContainer[UT, CH, Any] = container
+        self._uow: UT = uow
+
+    def __missing__(self, command_type: Type[AbstractCommand]) -> CH:
+        handler: CH = self._container.create_command_handler(command_type, self._uow)
+        self[command_type] = handler
+        return handler
+
+
+class _EventHandlers(Dict[Type[AbstractEvent], List[EH]], Generic[UT, EH]):
+    """
+    Event handlers of one message bus, handlers are created on the first event of their type.
+    """
+
+    def __init__(self, container: BaseContainer[UT, Any, EH], uow: UT) -> None:
+        super().__init__()
+        self._container: BaseContainer[UT, Any, EH] = container
+        self._uow: UT = uow
+
+    def __missing__(self, event_type: Type[AbstractEvent]) -> List[EH]:
+        handlers: List[EH] = self._container.create_event_handlers(event_type, self._uow)
+        self[event_type] = handlers
+        return handlers
@@ -1,6 +1,9 @@
 from abc import ABC
 from dataclasses import dataclass
-from typing import Any
+from typing import (
+    Any,
+    Optional,
+)
 
 from app.exceptions import ApplicationException
 
@@ -28,6 +31,29 @@ class BookNotFoundException(InfrastructureException):
         return f"Book {self.value} not found"
 
 
+@dataclass(eq=False)
+class BookOidAlreadyExistsException(InfrastructureException):
+    oid: str
+
+    @property
+    def message(self) -> str:
+        return f"Book with oid {self.oid} already exists"
+
+
+@dataclass(eq=False)
+class BookVersionConflictException(InfrastructureException):
+    oid: str
+    expected_version: int
+    actual_version: Optional[int]
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Book {self.oid} has been changed concurrently: "
+            f"expected version {self.expected_version}, stored version {self.actual_version}"
+        )
+
+
 @dataclass(eq=False)
 class InstanceException(InfrastructureException):
     value: Any
@@ -35,3 +61,77 @@ class InstanceException(InfrastructureException):
     @property
     def message(self) -> str:
         return f"{self.value}"
+
+
+@dataclass(eq=False)
+class UnknownDatabaseBackendException(InfrastructureException):
+    value: str
+
+    @property
+    def message(self) -> str:
+        return f"Unknown database backend: {self.value}"
+
+
+@dataclass(eq=False)
+class LockTimeoutException(InfrastructureException):
+    value: str
+
+    @property
+    def message(self) -> str:
+        return f"Timed out waiting for lock {self.value}, database is busy"
+
+
+@dataclass(eq=False)
+class UnknownStorageFormatException(InfrastructureException):
+    value: str
+
+    @property
+    def message(self) -> str:
+        return f"Unknown storage format or compression: {self.value}"
+
+
+@dataclass(eq=False)
+class CorruptedStorageException(InfrastructureException):
+    value: str
+    reason: str
+
+    @property
+    def message(self) -> str:
+        return f"Database file {self.value} is corrupted, it's not read or overwritten until repaired: {self.reason}"
+
+
+@dataclass(eq=False)
+class UnknownSortKeyException(InfrastructureException):
+    value: str
+
+    @property
+    def message(self) -> str:
+        return f"Unknown sort key of books: {self.value}"
+
+
+@dataclass(eq=False)
+class InvalidCursorException(InfrastructureException):
+    value: str
+
+    @property
+    def message(self) -> str:
+        return f"Invalid cursor of the page: {self.value}"
+
+
+@dataclass(eq=False)
+class UnknownImportFormatException(InfrastructureException):
+    value: str
+
+    @property
+    def message(self) -> str:
+        return f"Unknown format of the imported file, it must be .csv or .jsonl: {self.value}"
+
+
+@dataclass(eq=False)
+class ImportFileException(InfrastructureException):
+    value: str
+    reason: str
+
+    @property
+    def message(self) -> str:
+        return f"Imported file {self.value} can't be read: {self.reason}"
@@ -1,18 +1,29 @@
-from queue import Queue
+import asyncio
+from collections import deque
+from functools import partial
 from typing import (
     Any,
+    Awaitable,
+    Callable,
+    Deque,
     Dict,
     List,
+    Mapping,
     Type,
     TypeVar,
     Union,
 )
 
 from app.infrastructure.exceptions import MessageBusMessageException
-from app.infrastructure.uow.base import AbstractUnitOfWork
+from app.infrastructure.uow.base import (
+    AbstractUnitOfWork,
+    AsyncUnitOfWork,
+)
 from app.logic.commands.base import AbstractCommand
 from app.logic.events.base import AbstractEvent
 from app.logic.handlers.base import (
+    AbstractAsyncCommandHandler,
+    AbstractAsyncEventHandler,
     AbstractCommandHandler,
     AbstractEventHandler,
     AbstractHandler,
@@ -22,42 +33,155 @@ from app.logic.handlers.base import (
 ET = TypeVar("ET", bound=AbstractEvent)
 CT = TypeVar("CT", bound=AbstractCommand)
 HT = TypeVar("HT", bound=AbstractHandler)
+H = TypeVar("H")
+
+Message = Union[AbstractEvent, AbstractCommand]
+
+
+def resolve_command_handler(command_handlers: Mapping[Type[Any], H], command_type: Type[AbstractCommand]) -> H:
+    """
+    Finds the handler of the command by its class, or by the nearest base class of it, which has a handler.
+    Handlers are looked up by key, so mappings, which create handlers on the first lookup, create only this one.
+    :return: handler of the command, raises KeyError, if neither the command nor its base classes have a handler
+    """
+    for message_type in command_type.__mro__:
+        try:
+            return command_handlers[message_type]
+        except KeyError:
+            continue
+
+    raise KeyError(command_type)
+
+
+def resolve_event_handlers(
+        event_handlers: Mapping[Type[Any], List[H]], event_type: Type[AbstractEvent]
+) -> List[H]:
+    """
+    Finds handlers of the event and of all its base classes, so handlers of the base event receive its subclasses.
+    :return: handlers in order of MRO, raises KeyError, if neither the event nor its base classes have handlers
+    """
+    handlers: List[H] = []
+    registered: bool = False
+
+    for message_type in event_type.__mro__:
+        try:
+            handlers.extend(event_handlers[message_type])
+        except KeyError:
+            continue
+        registered = True
+
+    if not registered:
+        raise KeyError(event_type)
+    return handlers
+
 
 class MessageBus:
+    """
+    Handles commands and events, which they raise, one by one in a single thread.
+
+    Messages wait in a deque, and every type of message is routed once: its handlers are resolved by MRO and
+    the route is kept in the dispatch table, so next messages of the type are dispatched by one lookup.
+    """
+
     def __init__(
         self,
         uow: AbstractUnitOfWork,
-        event_handlers: Dict[Type[ET], List[AbstractEventHandler[ET]]],
-        command_handlers: Dict[Type[CT], AbstractCommandHandler[CT]],
+        event_handlers: Dict[Type[AbstractEvent], List[AbstractEventHandler[Any]]],
+        command_handlers: Dict[Type[AbstractCommand], AbstractCommandHandler[Any]],
     ) -> None:
         self._uow = uow
         self._event_handlers = event_handlers
         self._command_handlers = command_handlers
-        self._queue: Queue = Queue()
+        self._queue: Deque[Message] = deque()
+        self._routes: Dict[Type[Any], Callable[[Any], None]] = {}
         self._command_result: Any = None
 
-    def handle(self, message: Union[AbstractEvent, AbstractCommand]) -> None:
-        self._queue.put(message)
-        while not self._queue.empty():
-            message = self._queue.get()
-            if isinstance(message, AbstractEvent):
-                self._handle_event(event=message)
-            elif isinstance(message, AbstractCommand):
-                self._handle_command(command=message)
-            else:
-                raise MessageBusMessageException()
-
-    def _handle_event(self, event: ET) -> None:
-        for handler in self._event_handlers[type(event)]:
+    def handle(self, message: Message) -> None:
+        queue: Deque[Message] = self._queue
+        routes: Dict[Type[Any], Callable[[Any], None]] = self._routes
+
+        queue.append(message)
+        while queue:
+            message = queue.popleft()
+            route: Callable[[Any], None] = routes.get(type(message)) or self._route(type(message))
+            route(message)
+
+    def _route(self, message_type: Type[Any]) -> Callable[[Any], None]:
+        route: Callable[[Any], None]
+
+        if issubclass(message_type, AbstractEvent):
+            route = partial(self._handle_event, resolve_event_handlers(self._event_handlers, message_type))
+        elif issubclass(message_type, AbstractCommand):
+            route = partial(self._handle_command, resolve_command_handler(self._command_handlers, message_type))
+        else:
+            raise MessageBusMessageException()
+
+        self._routes[message_type] = route
+        return route
+
+    def _handle_event(self, handlers: List[AbstractEventHandler[Any]], event: AbstractEvent) -> None:
+        for handler in handlers:
             handler(event)
-            for event in self._uow.get_events():
-                self._queue.put_nowait(event)
+            self._queue.extend(self._uow.get_events())
 
-    def _handle_command(self, command: CT) -> None:
-        handler: AbstractCommandHandler = self._command_handlers[type(command)]
+    def _handle_command(self, handler: AbstractCommandHandler[Any], command: AbstractCommand) -> None:
         self._command_result = handler(command)
-        for event in self._uow.get_events():
-            self._queue.put_nowait(event)
+        self._queue.extend(self._uow.get_events())
+
+    @property
+    def command_result(self) -> Any:
+        return self._command_result
+
+
+class AsyncMessageBus:
+    """
+    Message bus for asyncio applications. Commands and events are handled one by one like in MessageBus,
+    but all handlers of one event run concurrently, and events, which they raise, are handled after all of them.
+    """
+
+    def __init__(
+        self,
+        uow: AsyncUnitOfWork,
+        event_handlers: Dict[Type[AbstractEvent], List[AbstractAsyncEventHandler[Any]]],
+        command_handlers: Dict[Type[AbstractCommand], AbstractAsyncCommandHandler[Any]],
+    ) -> None:
+        self._uow = uow
+        self._event_handlers = event_handlers
+        self._command_handlers = command_handlers
+        self._queue: Deque[Message] = deque()
+        self._routes: Dict[Type[Any], Callable[[Any], Awaitable[None]]] = {}
+        self._command_result: Any = None
+
+    async def handle(self, message: Message) -> None:
+        queue: Deque[Message] = self._queue
+        routes: Dict[Type[Any], Callable[[Any], Awaitable[None]]] = self._routes
+
+        queue.append(message)
+        while queue:
+            message = queue.popleft()
+            route: Callable[[Any], Awaitable[None]] = routes.get(type(message)) or self._route(type(message))
+            await route(message)
+
+    def _route(self, message_type: Type[Any]) -> Callable[[Any], Awaitable[None]]:
+        route: Callable[[Any], Awaitable[None]]
+
+        if issubclass(message_type, AbstractEvent):
+            route = partial(self._handle_event, resolve_event_handlers(self._event_handlers, message_type))
+        elif issubclass(message_type, AbstractCommand):
+            route = partial(self._handle_command, resolve_command_handler(self._command_handlers, message_type))
+        else:
+            raise MessageBusMessageException()
+
+        self._routes[message_type] = route
+        return route
+
+    async def _handle_event(self, handlers: List[AbstractAsyncEventHandler[Any]], event: AbstractEvent) -> None:
+        await asyncio.gather(*(handler(event) for handler in handlers))
+        self._queue.extend(self._uow.get_events())
+
+    async def _handle_command(self, handler: AbstractAsyncCommandHandler[Any], command: AbstractCommand) -> None:
+        self._command_result = await handler(command)
+        self._queue.extend(self._uow.get_events())
 
     @property
     def command_result(self) -> Any:
@@ -0,0 +1,114 @@
+from bisect import (
+    bisect_left,
+    bisect_right,
+    insort,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+
+from app.domain.entities.books import Book
+from app.infrastructure.repositories.books.query import (
+    AUTHOR,
+    BooksQuery,
+    QueryPlan,
+    SCAN,
+    STATUS,
+    YEAR,
+)
+
+
+class AttributesIndex:
+    """
+    Secondary indexes over year, status and author of books, which give candidates of queries of books.
+    Distinct years are kept sorted, so books of the range of years are found by bisect,
+    statuses and authors are hashed. Every index maps its value to the set of oids of books with it.
+
+    Sets are changed in place by a writer, so readers copy them.
+    """
+
+    def __init__(self) -> None:
+        self._years: List[int] = []
+        self._by_year: Dict[int, Set[str]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_author: Dict[str, Set[str]] = {}
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, book: Book) -> None:
+        year: int = book.year.as_generic_type()
+        if year not in self._by_year:
+            self._by_year[year] = set()
+            insort(self._years, year)
+
+        self._by_year[year].add(book.oid)
+        self._by_status.setdefault(book.status.as_generic_type(), set()).add(book.oid)
+        self._by_author.setdefault(book.author.as_generic_type(), set()).add(book.oid)
+        self._size += 1
+
+    def remove(self, book: Book) -> None:
+        year: int = book.year.as_generic_type()
+        if self._discard(self._by_year, year, book.oid):
+            del self._years[bisect_left(self._years, year)]
+
+        self._discard(self._by_status, book.status.as_generic_type(), book.oid)
+        self._discard(self._by_author, book.author.as_generic_type(), book.oid)
+        self._size = max(self._size - 1, 0)
+
+    def plan(self, query: BooksQuery) -> QueryPlan:
+        """
+        Picks the index, which gives the least candidates of the query. Amounts of candidates are known exactly,
+        so the plan never reads more books than scan does.
+        """
+        plans: List[QueryPlan] = [QueryPlan(SCAN, self._size)]
+
+        if query.has_year_range:
+            plans.append(QueryPlan(YEAR, sum(len(self._by_year[year]) for year in self._years_of(query))))
+        if query.status is not None:
+            plans.append(QueryPlan(STATUS, len(self._by_status.get(query.status, ()))))
+        if query.author is not None:
+            plans.append(QueryPlan(AUTHOR, len(self._by_author.get(query.author, ()))))
+
+        return min(plans, key=lambda plan: plan.estimated)
+
+    def candidates(self, query: BooksQuery) -> Optional[List[str]]:
+        """
+        :return: oids of books, which may match the query, or None, if all books must be scanned
+        """
+        plan: QueryPlan = self.plan(query)
+
+        if plan.index == YEAR:
+            return [oid for year in self._years_of(query) for oid in tuple(self._by_year.get(year, ()))]
+        if plan.index == STATUS:
+            return list(self._by_status.get(query.status, ()))  # type: ignore[arg-type]
+        if plan.index == AUTHOR:
+            return list(self._by_author.get(query.author, ()))  # type: ignore[arg-type]
+
+        return None
+
+    def _years_of(self, query: BooksQuery) -> List[int]:
+        start: int = bisect_left(self._years, query.year_from) if query.year_from is not None else 0
+        end: int = bisect_right(self._years, query.year_to) if query.year_to is not None else len(self._years)
+        return self._years[start:end]
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], key: Any, oid: str) -> bool:
+        """
+        :return: whether the last oid of the key has been removed
+        """
+        oids: Optional[Set[str]] = index.get(key)
+        if oids is None:
+            return False
+
+        oids.discard(oid)
+        if oids:
+            return False
+
+        del index[key]
+        return True
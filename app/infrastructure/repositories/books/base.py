@@ -10,6 +10,7 @@ from typing import (
 from app.domain.entities.base import BaseEntity
 from app.domain.entities.books import Book
 from app.infrastructure.repositories.base import AbstractRepository
+from app.infrastructure.repositories.books.query import BooksQuery
 
 
 class BooksRepository(AbstractRepository[Book], ABC):
@@ -27,6 +28,53 @@ class BooksRepository(AbstractRepository[Book], ABC):
     def get_by_title_and_author(self, title: str, author: str) -> Optional[Book]:
         raise NotImplementedError
 
+    @abstractmethod
+    def search(self, query: str, limit: int) -> List[Book]:
+        """
+        Finds books by words of title and author in any form and case, 'ё' and 'е' are the same letter.
+        :return: at most 'limit' books, the most relevant first
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_similar_title(self, title: str, limit: int, threshold: float) -> List[Book]:
+        """
+        Finds books by title with misspelled words. Words are compared by their trigrams, russian and latin spelling
+        of the word are almost the same. Title is scored by the average similarity of words of the query
+        to the most similar words of the title, words with similarity less than 'threshold' are not similar.
+        :param threshold: minimum similarity of words and minimum score of titles, from 0 to 1
+        :return: at most 'limit' books, the most similar first
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_similar_author(self, author: str, limit: int, threshold: float) -> List[Book]:
+        """
+        Finds books by author with misspelled words, authors are scored like titles by 'find_by_similar_title'.
+        :return: at most 'limit' books, the most similar first
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def suggest(self, prefix: str, limit: int) -> List[Book]:
+        """
+        Completes the prefix by titles and authors: books, which title or author has a word starting with the last
+        word of the prefix after other words of the prefix, for example, 'дост' and 'Fedor Dost' complete
+        'Фёдор Достоевский'. Words are compared like by 'find_by_similar_title', only the first words of long names
+        are completed.
+        :return: at most 'limit' books in alphabetical order of their completions
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def query(self, query: BooksQuery) -> List[Book]:
+        """
+        Finds books, which match all predicates of the query, by the most selective index instead of scanning
+        all books, when there is such index.
+        :return: at most 'limit' books in order of the query
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def add(self, model: Book) -> Book:
         raise NotImplementedError
@@ -37,12 +85,29 @@ class BooksRepository(AbstractRepository[Book], ABC):
 
     @abstractmethod
     def update(self, oid: str, model: Book) -> Book:
+        """
+        Replaces the stored book, if its version is the same as version of the model. Version of the model is increased.
+        Raises BookVersionConflictException if the book has been changed since it was read.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, oid: str) -> None:
+    def delete(self, oid: str, version: Optional[int] = None) -> None:
+        """
+        Deletes the book. If version is provided, raises BookVersionConflictException when stored version differs.
+        """
         raise NotImplementedError
 
     @abstractmethod
     def list(self) -> List[Book]:
         raise NotImplementedError
+
+    @abstractmethod
+    def list_page(self, after: Optional[str], limit: int) -> List[Book]:
+        """
+        Reads books by pages in order of oids, so the next page continues after the last book of the previous one,
+        even if books have been added or deleted between pages.
+        :param after: oid of the last book of the previous page, None reads the first page
+        :return: at most 'limit' books, which oids are greater than 'after', in order of oids
+        """
+        raise NotImplementedError
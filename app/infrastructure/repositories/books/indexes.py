@@ -0,0 +1,386 @@
+import threading
+from bisect import (
+    bisect_left,
+    bisect_right,
+    insort,
+)
+from contextlib import contextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Self,
+    Tuple,
+)
+
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import BookVersionConflictException
+from app.infrastructure.repositories.books.attributes import AttributesIndex
+from app.infrastructure.repositories.books.query import (
+    BooksQuery,
+    QueryPlan,
+)
+from app.infrastructure.repositories.identity_map import IdentityMap
+from app.infrastructure.search.analysis import analyze
+from app.infrastructure.search.inverted_index import (
+    InvertedIndex,
+    term_weights,
+    TermWeights,
+)
+from app.infrastructure.search.prefixes import PrefixIndex
+from app.infrastructure.search.trigrams import NamesIndex
+
+
+# Words of the title describe the book better than words of the author's name
+TITLE_WEIGHT: Final[float] = 2.0
+AUTHOR_WEIGHT: Final[float] = 1.0
+
+
+class BooksIndex:
+    """
+    Hash indexes over books by title and by title with author, which are used by in-memory repositories
+    instead of scanning the whole session, full-text index over words of title and author,
+    trigram indexes over titles and authors for lookups with misspelled words and prefix index over both of them
+    for autocompletion, secondary indexes over year, status and author for queries of books
+    and sorted oids for pages of books.
+    Index stores only oids of books, books itself must be taken from session.
+
+    Buckets are immutable tuples, so somebody who has got a bucket never sees it changing.
+    All indexes except hash ones are built on the first lookup, so loading of the catalog
+    does not pay for them.
+    """
+
+    def __init__(self) -> None:
+        self._by_title: Dict[str, Tuple[str, ...]] = {}
+        self._by_title_and_author: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._words: Optional[InvertedIndex] = None
+        self._titles: Optional[NamesIndex] = None
+        self._authors: Optional[NamesIndex] = None
+        self._prefixes: Optional[PrefixIndex] = None
+        self._attributes: Optional[AttributesIndex] = None
+        self._oids: Optional[List[str]] = None
+        self._words_lock: threading.RLock = threading.RLock()
+
+    @classmethod
+    def build(cls, books: Iterable[Book]) -> Self:
+        index: Self = cls()
+        for book in books:
+            index.add(book)
+        return index
+
+    def replace_with(self, other: "BooksIndex") -> None:
+        with self.changing():
+            self._by_title = other._by_title
+            self._by_title_and_author = other._by_title_and_author
+            self._words = other._words
+            self._titles = other._titles
+            self._authors = other._authors
+            self._prefixes = other._prefixes
+            self._attributes = other._attributes
+            self._oids = other._oids
+
+    @contextmanager
+    def changing(self) -> Iterator[None]:
+        """
+        Books of the index must be changed under this lock together with the index,
+        so index, which is being built from the books at the moment,
+        does not miss the change.
+        """
+        with self._words_lock:
+            yield
+
+    def add(self, book: Book) -> None:
+        title: str = book.title.as_generic_type()
+        title_and_author: Tuple[str, str] = (title, book.author.as_generic_type())
+
+        self._by_title[title] = (*self._by_title.get(title, ()), book.oid)
+        self._by_title_and_author[title_and_author] = (*self._by_title_and_author.get(title_and_author, ()), book.oid)
+        if self._words is not None:
+            self._words.add(book.oid, self.words_of(book))
+        if self._titles is not None:
+            self._titles.add(title, book.oid)
+        if self._authors is not None:
+            self._authors.add(book.author.as_generic_type(), book.oid)
+        if self._prefixes is not None:
+            self._prefixes.add(title, book.oid)
+            self._prefixes.add(book.author.as_generic_type(), book.oid)
+        if self._attributes is not None:
+            self._attributes.add(book)
+        if self._oids is not None:
+            insort(self._oids, book.oid)
+
+    def remove(self, book: Book) -> None:
+        title: str = book.title.as_generic_type()
+        title_and_author: Tuple[str, str] = (title, book.author.as_generic_type())
+
+        self._discard(self._by_title, title, book.oid)
+        self._discard(self._by_title_and_author, title_and_author, book.oid)
+        if self._words is not None:
+            self._words.remove(book.oid, self.words_of(book))
+        if self._titles is not None:
+            self._titles.remove(title, book.oid)
+        if self._authors is not None:
+            self._authors.remove(book.author.as_generic_type(), book.oid)
+        if self._prefixes is not None:
+            self._prefixes.remove(title, book.oid)
+            self._prefixes.remove(book.author.as_generic_type(), book.oid)
+        if self._attributes is not None:
+            self._attributes.remove(book)
+        if self._oids is not None:
+            position: int = bisect_left(self._oids, book.oid)
+            if position < len(self._oids) and self._oids[position] == book.oid:
+                del self._oids[position]
+
+    def find_all_by_title(self, title: str) -> Tuple[str, ...]:
+        """
+        :return: oids of books with such title in order of adding
+        """
+        return self._by_title.get(title, ())
+
+    def find_all_by_title_and_author(self, title: str, author: str) -> Tuple[str, ...]:
+        """
+        :return: oids of books with such title and author in order of adding
+        """
+        return self._by_title_and_author.get((title, author), ())
+
+    def search(self, query: str, books: Iterable[Book]) -> Dict[str, float]:
+        """
+        :param books: all books of the index, full-text index is built from them on the first search
+        :return: scores of books, which have at least one word of the query in title or author
+        """
+        return self._words_of_books(books).search(analyze(query))
+
+    def score(self, book: Book, query: str, books: Iterable[Book]) -> float:
+        """
+        Scores the book, which is not in the index, for example, changed in the unit of work, as if it was there.
+        """
+        return self._words_of_books(books).score(self.words_of(book), analyze(query))
+
+    def find_similar_titles(
+            self, title: str, threshold: float, limit: int, books: Iterable[Book]
+    ) -> Iterator[Tuple[str, float]]:
+        """
+        :param books: all books of the index, trigram index is built from them on the first lookup
+        :return: oids of books with at most 'limit' the most similar titles and similarity of their titles
+        """
+        return self._find_similar(self._titles_of_books(books), title, threshold, limit)
+
+    def find_similar_authors(
+            self, author: str, threshold: float, limit: int, books: Iterable[Book]
+    ) -> Iterator[Tuple[str, float]]:
+        """
+        :param books: all books of the index, trigram index is built from them on the first lookup
+        :return: oids of books of at most 'limit' the most similar authors and similarity of their authors
+        """
+        return self._find_similar(self._authors_of_books(books), author, threshold, limit)
+
+    def suggest(self, prefix: str, limit: int, books: Iterable[Book]) -> Iterator[Tuple[str, str]]:
+        """
+        :param books: all books of the index, prefix index is built from them on the first lookup
+        :return: oids of books with at most 'limit' titles or authors, which complete the prefix,
+            and their completion of the prefix, in order of completions. Book may be returned twice
+        """
+        prefixes: PrefixIndex = self._prefixes_of_books(books)
+
+        for completion, name in prefixes.complete(prefix, limit):
+            for oid in prefixes.documents(name):
+                yield completion, oid
+
+    def plan(self, query: BooksQuery, books: Iterable[Book]) -> QueryPlan:
+        """
+        :param books: all books of the index, secondary indexes are built from them on the first query
+        :return: index, which gives the least candidates of the query
+        """
+        return self._attributes_of_books(books).plan(query)
+
+    def query_candidates(self, query: BooksQuery, books: Iterable[Book]) -> Optional[List[str]]:
+        """
+        :param books: all books of the index, secondary indexes are built from them on the first query
+        :return: oids of books, which may match the query, from the most selective index,
+            or None, if all books must be scanned
+        """
+        return self._attributes_of_books(books).candidates(query)
+
+    def oids_after(self, after: Optional[str], limit: int, books: Iterable[Book]) -> List[str]:
+        """
+        :param after: oid, after which oids are taken, None takes them from the first one
+        :param books: all books of the index, sorted oids are built from them on the first page
+        :return: at most 'limit' oids, which are greater than 'after', in sorted order
+        """
+        oids: List[str] = self._oids_of_books(books)
+        # Writer changes oids in place under the lock, so position must not move until the slice is taken
+        with self._words_lock:
+            start: int = bisect_right(oids, after) if after is not None else 0
+            return oids[start:start + limit]
+
+    @staticmethod
+    def words_of(book: Book) -> TermWeights:
+        return term_weights((
+            (analyze(book.title.as_generic_type()), TITLE_WEIGHT),
+            (analyze(book.author.as_generic_type()), AUTHOR_WEIGHT),
+        ))
+
+    def _words_of_books(self, books: Iterable[Book]) -> InvertedIndex:
+        words: Optional[InvertedIndex] = self._words
+        if words is not None:
+            return words
+
+        with self._words_lock:
+            if self._words is None:
+                words = InvertedIndex()
+                for book in books:
+                    words.add(book.oid, self.words_of(book))
+                self._words = words
+
+            return self._words
+
+    def _titles_of_books(self, books: Iterable[Book]) -> NamesIndex:
+        titles: Optional[NamesIndex] = self._titles
+        if titles is not None:
+            return titles
+
+        with self._words_lock:
+            if self._titles is None:
+                titles = NamesIndex()
+                for book in books:
+                    titles.add(book.title.as_generic_type(), book.oid)
+                self._titles = titles
+
+            return self._titles
+
+    def _authors_of_books(self, books: Iterable[Book]) -> NamesIndex:
+        authors: Optional[NamesIndex] = self._authors
+        if authors is not None:
+            return authors
+
+        with self._words_lock:
+            if self._authors is None:
+                authors = NamesIndex()
+                for book in books:
+                    authors.add(book.author.as_generic_type(), book.oid)
+                self._authors = authors
+
+            return self._authors
+
+    def _prefixes_of_books(self, books: Iterable[Book]) -> PrefixIndex:
+        prefixes: Optional[PrefixIndex] = self._prefixes
+        if prefixes is not None:
+            return prefixes
+
+        with self._words_lock:
+            if self._prefixes is None:
+                self._prefixes = PrefixIndex.build(
+                    (name, book.oid)
+                    for book in books
+                    for name in (book.title.as_generic_type(), book.author.as_generic_type())
+                )
+
+            return self._prefixes
+
+    def _attributes_of_books(self, books: Iterable[Book]) -> AttributesIndex:
+        attributes: Optional[AttributesIndex] = self._attributes
+        if attributes is not None:
+            return attributes
+
+        with self._words_lock:
+            if self._attributes is None:
+                attributes = AttributesIndex()
+                for book in books:
+                    attributes.add(book)
+                self._attributes = attributes
+
+            return self._attributes
+
+    def _oids_of_books(self, books: Iterable[Book]) -> List[str]:
+        oids: Optional[List[str]] = self._oids
+        if oids is not None:
+            return oids
+
+        with self._words_lock:
+            if self._oids is None:
+                self._oids = sorted(book.oid for book in books)
+
+            return self._oids
+
+    @staticmethod
+    def _find_similar(names: NamesIndex, query: str, threshold: float, limit: int) -> Iterator[Tuple[str, float]]:
+        found: List[Tuple[str, float]] = names.find_similar(query, threshold, limit)
+
+        for name, similarity in found:
+            # Oids are copied, because writer changes them in place
+            for oid in tuple(names.documents(name)):
+                yield oid, similarity
+
+    @staticmethod
+    def _discard(bucket_index: Dict[Any, Tuple[str, ...]], key: Any, oid: str) -> None:
+        oids: Tuple[str, ...] = tuple(existing_oid for existing_oid in bucket_index.get(key, ()) if existing_oid != oid)
+
+        if oids:
+            bucket_index[key] = oids
+        else:
+            bucket_index.pop(key, None)
+
+
+@dataclass(frozen=True)
+class BooksCatalog:
+    """
+    Committed books of one storage by their oids in order of loading and addition, together with their indexes.
+    Ordered access by oid goes through the index.
+    Catalogs are cached and shared between units of work, so they are changed only by commits,
+    which apply changes tracked in identity map of the unit of work.
+    """
+
+    books: Dict[str, Book] = field(default_factory=dict)
+    index: BooksIndex = field(default_factory=BooksIndex)
+
+    @classmethod
+    def build(cls, books: Iterable[Book]) -> "BooksCatalog":
+        books_by_oid: Dict[str, Book] = {book.oid: book for book in books}
+        return cls(books=books_by_oid, index=BooksIndex.build(books_by_oid.values()))
+
+    def replace_with(self, other: "BooksCatalog") -> None:
+        """
+        Replaces content of the catalog in place, for example, when storage was changed by another process.
+        Units of work, which hold this catalog, see the new content.
+        """
+        with self.index.changing():
+            self.books.clear()
+            self.books.update(other.books)
+            self.index.replace_with(other.index)
+
+    def check_versions(self, identity_map: IdentityMap[Book]) -> None:
+        """
+        Checks that books changed in the unit of work have not been changed by anybody else since they were read.
+        """
+        for oid, version in identity_map.versions.items():
+            stored_book: Optional[Book] = self.books.get(oid)
+            stored_version: Optional[int] = stored_book.version if stored_book is not None else None
+
+            if stored_version != version:
+                raise BookVersionConflictException(oid, version, stored_version)
+
+    def apply(self, identity_map: IdentityMap[Book]) -> None:
+        """
+        Applies changes of the unit of work. Cost depends only on the amount of changed books.
+        """
+        with self.index.changing():
+            for oid in identity_map.deleted:
+                deleted_book: Optional[Book] = self.books.pop(oid, None)
+                if deleted_book is not None:
+                    self.index.remove(deleted_book)
+
+            for book in identity_map.changed():
+                replaced_book: Optional[Book] = self.books.get(book.oid)
+                if replaced_book is not None:
+                    self.index.remove(replaced_book)
+
+                self.books[book.oid] = book
+                self.index.add(book)
@@ -1,69 +1,300 @@
+import heapq
 from abc import ABC
+from dataclasses import replace
 from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     override,
+    Tuple,
 )
 
 from app.domain.entities.books import Book
-from app.infrastructure.exceptions import BookNotFoundException
+from app.infrastructure.exceptions import (
+    BookNotFoundException,
+    BookOidAlreadyExistsException,
+    BookVersionConflictException,
+)
 from app.infrastructure.repositories.base import (
     AbstractRepository,
     BaseEntityType,
 )
 from app.infrastructure.repositories.books.base import BooksRepository
+from app.infrastructure.repositories.books.indexes import BooksIndex
+from app.infrastructure.repositories.books.query import BooksQuery
+from app.infrastructure.repositories.identity_map import IdentityMap
+from app.infrastructure.search import (
+    prefixes,
+    trigrams,
+)
 
 
 class JsonAbstractRepository(AbstractRepository[BaseEntityType], ABC):
     """
     Repository interface for json, from which should be inherited all other repositories.
+
+    Session is an ordered mapping of committed entities by their oid, it may be shared between units of work,
+    so repository never changes it. All changes are registered in the identity map of the unit of work.
     """
 
-    def __init__(self, session: List[BaseEntityType]) -> None:
+    def __init__(
+            self,
+            session: Dict[str, BaseEntityType],
+            identity_map: Optional[IdentityMap[BaseEntityType]] = None,
+    ) -> None:
         self._session = session
+        self._identity_map: IdentityMap[BaseEntityType] = identity_map if identity_map is not None else IdentityMap()
+
+    def _get(self, oid: str) -> Optional[BaseEntityType]:
+        is_tracked, entity = self._identity_map.get(oid)
+        return entity if is_tracked else self._session.get(oid)
+
+    def _iterate(self) -> Iterator[BaseEntityType]:
+        """
+        Iterates over entities in the order of the session, replacing changed entities and skipping deleted ones.
+        New entities go at the end.
+        """
+        if not self._identity_map:
+            yield from self._session.values()
+            return
+
+        for oid, entity in self._session.items():
+            is_tracked, tracked_entity = self._identity_map.get(oid)
+            if not is_tracked:
+                yield entity
+            elif tracked_entity is not None:
+                yield tracked_entity
+
+        yield from self._identity_map.new.values()
 
 
 class JsonBooksRepository(JsonAbstractRepository[Book], BooksRepository):
+    """
+    Json repository for books. Lookups by oid go directly to the session, lookups by title and by title with author
+    go through hash indexes, which are built once when session is loaded. Only books touched in the unit of work
+    are checked additionally, so lookups never scan the whole session.
+    """
+
     @override
-    def __init__(self, session: List[Book]) -> None:
-        super().__init__(session)
+    def __init__(
+            self,
+            session: Dict[str, Book],
+            index: Optional[BooksIndex] = None,
+            identity_map: Optional[IdentityMap[Book]] = None,
+    ) -> None:
+        super().__init__(session, identity_map)
+        self._index: BooksIndex = index if index is not None else BooksIndex.build(session.values())
 
     @override
     def get_by_title(self, title: str) -> Optional[Book]:
-        return next((book for book in self._session if book.title.as_generic_type() == title), None)
+        for oid in self._index.find_all_by_title(title):
+            book: Optional[Book] = self._get(oid)
+            if book is not None and book.title.as_generic_type() == title:
+                return book
+
+        return next((book for book in self._identity_map.changed() if book.title.as_generic_type() == title), None)
 
     @override
     def get_by_title_and_author(self, title: str, author: str) -> Optional[Book]:
-        return next((book for book in self._session if
-                     book.title.as_generic_type() == title
-                     and
-                     book.author.as_generic_type() == author), None)
+        for oid in self._index.find_all_by_title_and_author(title, author):
+            book: Optional[Book] = self._get(oid)
+            if book is not None and book.title.as_generic_type() == title and book.author.as_generic_type() == author:
+                return book
+
+        return next(
+            (
+                book for book in self._identity_map.changed()
+                if book.title.as_generic_type() == title and book.author.as_generic_type() == author
+            ),
+            None,
+        )
+
+    @override
+    def search(self, query: str, limit: int) -> List[Book]:
+        scores: Dict[str, float] = self._index.search(query, self._session.values())
+
+        # Index knows only committed books, books touched in the unit of work are scored as they are now
+        for oid in self._identity_map.deleted:
+            scores.pop(oid, None)
+
+        for book in self._identity_map.changed():
+            score: float = self._index.score(book, query, self._session.values())
+            if score > 0:
+                scores[book.oid] = score
+            else:
+                scores.pop(book.oid, None)
+
+        best: List[Tuple[str, float]] = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [book for book in (self._get(oid) for oid, _ in best) if book is not None]
+
+    @override
+    def find_by_similar_title(self, title: str, limit: int, threshold: float) -> List[Book]:
+        return self._find_by_similar(
+            self._index.find_similar_titles(title, threshold, self._names_limit(limit), self._session.values()),
+            lambda book: trigrams.score(title, book.title.as_generic_type(), threshold),
+            limit,
+        )
+
+    @override
+    def find_by_similar_author(self, author: str, limit: int, threshold: float) -> List[Book]:
+        return self._find_by_similar(
+            self._index.find_similar_authors(author, threshold, self._names_limit(limit), self._session.values()),
+            lambda book: trigrams.score(author, book.author.as_generic_type(), threshold),
+            limit,
+        )
+
+    @override
+    def suggest(self, prefix: str, limit: int) -> List[Book]:
+        found: Dict[str, Tuple[str, Book]] = {}
+
+        # Book is completed by title and by author, so it may take away two names
+        for completion, oid in self._index.suggest(prefix, 2 * self._names_limit(limit), self._session.values()):
+            if len(found) >= limit:
+                break
+
+            book: Optional[Book] = self._session.get(oid)
+            if book is not None and oid not in self._identity_map and oid not in found:
+                found[oid] = (completion, book)
+
+        for book in self._identity_map.changed():
+            changed_completion: Optional[str] = prefixes.complete(
+                prefix, (book.title.as_generic_type(), book.author.as_generic_type())
+            )
+            if changed_completion is not None:
+                found[book.oid] = (changed_completion, book)
+
+        return [book for _, book in sorted(found.values(), key=lambda item: item[0])[:limit]]
+
+    @override
+    def query(self, query: BooksQuery) -> List[Book]:
+        candidates: Optional[List[str]] = self._index.query_candidates(query, self._session.values())
+        committed: Iterable[Optional[Book]] = (
+            self._session.values() if candidates is None else (self._session.get(oid) for oid in candidates)
+        )
+
+        # Index knows only committed books, books touched in the unit of work are checked as they are now
+        found: List[Book] = [
+            book for book in committed
+            if book is not None and query.matches(book) and book.oid not in self._identity_map
+        ]
+        found.extend(book for book in self._identity_map.changed() if query.matches(book))
+
+        return query.sort(found)
 
     @override
     def add(self, model: Book) -> Book:
-        self._session.append(model)
+        if self._get(model.oid) is not None:
+            raise BookOidAlreadyExistsException(model.oid)
+
+        # Committed book may have been deleted in this unit of work, then it's replaced with the new one
+        if model.oid in self._session:
+            self._identity_map.register_dirty(model)
+        else:
+            self._identity_map.register_new(model)
         return model
 
     @override
     def get(self, oid: str) -> Optional[Book]:
-        return next((book for book in self._session if book.oid == oid), None)
+        return self._get(oid)
 
     @override
     def update(self, oid: str, model: Book) -> Book:
-        for idx, book in enumerate(self._session):
-            if book.oid == oid:
-                self._session[idx] = model
-                return model
-        raise BookNotFoundException(oid)
+        self._check_version(oid, model.version)
+        if model.oid != oid and self._get(model.oid) is not None:
+            raise BookOidAlreadyExistsException(model.oid)
+
+        # Model may be the committed book itself, returned by 'get', so the catalog is changed only on commit
+        model = replace(model, version=model.version + 1)
+
+        if model.oid != oid:
+            self._identity_map.register_deleted(oid)
+            return self.add(model)
+
+        self._identity_map.register_dirty(model)
+        return model
 
     @override
-    def delete(self, oid: str) -> None:
-        for idx, book in enumerate(self._session):
-            if book.oid == oid:
-                del self._session[idx]
-                return
-        raise BookNotFoundException(oid)
+    def delete(self, oid: str, version: Optional[int] = None) -> None:
+        stored_book: Book = self._check_version(oid, version)
+        self._identity_map.register_deleted(stored_book.oid)
+
+    def _names_limit(self, limit: int) -> int:
+        """
+        Every committed book touched in the unit of work may take away one of found titles or authors,
+        so index is asked for more of them.
+        """
+        return limit + len(self._identity_map.dirty) + len(self._identity_map.deleted)
+
+    def _find_by_similar(
+            self,
+            similar: Iterable[Tuple[str, float]],
+            score: Callable[[Book], float],
+            limit: int,
+    ) -> List[Book]:
+        """
+        :param similar: oids of committed books with their scores, the most similar first
+        :param score: scores book touched in the unit of work, index knows only committed books.
+        Score is 0 for books, which are not similar enough
+        """
+        found: List[Tuple[float, Book]] = []
+
+        for oid, similarity in similar:
+            if len(found) >= limit:
+                break
+
+            book: Optional[Book] = self._session.get(oid)
+            if book is not None and oid not in self._identity_map:
+                found.append((similarity, book))
+
+        for book in self._identity_map.changed():
+            similarity = score(book)
+            if similarity > 0:
+                found.append((similarity, book))
+
+        found.sort(key=lambda item: item[0], reverse=True)
+        return [book for _, book in found[:limit]]
+
+    def _check_version(self, oid: str, version: Optional[int]) -> Book:
+        """
+        Checks version of the book, which is seen by this unit of work, and remembers version of the committed book,
+        so unit of work can check it once again on commit.
+        """
+        book: Optional[Book] = self._get(oid)
+
+        if book is None:
+            raise BookNotFoundException(oid)
+
+        if version is not None and book.version != version:
+            raise BookVersionConflictException(oid, version, book.version)
+
+        committed_book: Optional[Book] = self._session.get(oid)
+        if committed_book is not None:
+            self._identity_map.expect_version(oid, committed_book.version)
+
+        return book
 
     @override
     def list(self) -> List[Book]:
-        return self._session
+        return list(self._iterate())
+
+    @override
+    def list_page(self, after: Optional[str], limit: int) -> List[Book]:
+        # Every deleted book may take away one of committed oids, new books are not in the index
+        committed: List[str] = self._index.oids_after(
+            after, limit + len(self._identity_map.deleted), self._session.values()
+        )
+        new: List[str] = sorted(oid for oid in self._identity_map.new if after is None or oid > after)
+
+        page: List[Book] = []
+        for oid in heapq.merge(committed, new):
+            if len(page) >= limit:
+                break
+
+            book: Optional[Book] = self._get(oid)
+            if book is not None:
+                page.append(book)
+
+        return page
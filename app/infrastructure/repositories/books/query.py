@@ -0,0 +1,111 @@
+import heapq
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import UnknownSortKeyException
+
+
+# Values of books, by which they may be sorted. Key with '-' before it sorts in descending order
+SORT_KEYS: Final[Dict[str, Callable[[Book], Any]]] = {
+    "title": lambda book: book.title.as_generic_type(),
+    "author": lambda book: book.author.as_generic_type(),
+    "year": lambda book: book.year.as_generic_type(),
+    "status": lambda book: book.status.as_generic_type(),
+    "oid": lambda book: book.oid,
+}
+
+# Indexes, which the plan may choose, 'scan' reads all books
+SCAN: Final[str] = "scan"
+YEAR: Final[str] = "year"
+STATUS: Final[str] = "status"
+AUTHOR: Final[str] = "author"
+
+
+@dataclass(frozen=True)
+class BooksQuery:
+    """
+    Predicates of books and their order. All given predicates must match, predicates, which are None, match any book.
+
+    - **year_from**, **year_to**: bounds of the year, both are included
+    - **status**, **author**: equal values
+    - **title_prefix**: start of the title, case matters
+    - **order_by**: sort keys from SORT_KEYS, books with equal keys are ordered by oid
+    - **limit**: maximum amount of books, None returns all of them
+    """
+
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    status: Optional[str] = None
+    author: Optional[str] = None
+    title_prefix: Optional[str] = None
+    order_by: Tuple[str, ...] = ()
+    limit: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        for key in self.order_by:
+            if key.removeprefix("-") not in SORT_KEYS:
+                raise UnknownSortKeyException(key)
+
+    @property
+    def has_year_range(self) -> bool:
+        return self.year_from is not None or self.year_to is not None
+
+    @property
+    def sort_keys(self) -> List[Tuple[str, bool]]:
+        """
+        :return: names of sort keys with flags whether they are descending, oid is always the last one
+        """
+        keys: List[Tuple[str, bool]] = [(key.removeprefix("-"), key.startswith("-")) for key in self.order_by]
+        if all(name != "oid" for name, _ in keys):
+            keys.append(("oid", False))
+        return keys
+
+    def matches(self, book: Book) -> bool:
+        year: int = book.year.as_generic_type()
+
+        return (
+            (self.year_from is None or year >= self.year_from)
+            and (self.year_to is None or year <= self.year_to)
+            and (self.status is None or book.status.as_generic_type() == self.status)
+            and (self.author is None or book.author.as_generic_type() == self.author)
+            and (self.title_prefix is None or book.title.as_generic_type().startswith(self.title_prefix))
+        )
+
+    def sort(self, books: Iterable[Book]) -> List[Book]:
+        """
+        Orders matched books and takes at most 'limit' of them.
+        """
+        keys: List[Tuple[str, bool]] = self.sort_keys
+
+        # Keys in one direction are compared as one tuple, so only the first books are selected
+        if self.limit is not None and len({descending for _, descending in keys}) == 1:
+            select = heapq.nlargest if keys[0][1] else heapq.nsmallest
+            return select(self.limit, books, key=lambda book: tuple(SORT_KEYS[name](book) for name, _ in keys))
+
+        # Sort is stable, so books are sorted by the least important key first
+        ordered: List[Book] = list(books)
+        for name, descending in reversed(keys):
+            ordered.sort(key=SORT_KEYS[name], reverse=descending)
+
+        return ordered if self.limit is None else ordered[:self.limit]
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """
+    Index, which gives candidates of the query, and estimated amount of them.
+    Other predicates are checked on every candidate.
+    """
+
+    index: str
+    estimated: int
@@ -0,0 +1,367 @@
+import heapq
+import math
+import sqlite3
+from abc import ABC
+from dataclasses import replace
+from typing import (
+    Dict,
+    Final,
+    FrozenSet,
+    List,
+    Optional,
+    override,
+    Set,
+    Tuple,
+)
+
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import (
+    BookNotFoundException,
+    BookOidAlreadyExistsException,
+    BookVersionConflictException,
+)
+from app.infrastructure.repositories.base import (
+    AbstractRepository,
+    BaseEntityType,
+)
+from app.infrastructure.repositories.books.base import BooksRepository
+from app.infrastructure.repositories.books.indexes import BooksIndex
+from app.infrastructure.repositories.books.query import BooksQuery
+from app.infrastructure.search import (
+    prefixes,
+    trigrams,
+)
+from app.infrastructure.search.analysis import (
+    analyze,
+    fold,
+)
+from app.infrastructure.search.inverted_index import inverse_document_frequency
+
+
+BOOKS_COLUMNS: Final[str] = "oid, title, author, year, status, version"
+
+
+class SqliteAbstractRepository(AbstractRepository[BaseEntityType], ABC):
+    """
+    Repository interface for sqlite, from which should be inherited all other sqlite repositories.
+    Transactions are managed by unit of work, repository only executes statements on the connection.
+    """
+
+    def __init__(self, session: sqlite3.Connection) -> None:
+        self._session = session
+
+
+class SqliteBooksRepository(SqliteAbstractRepository[Book], BooksRepository):
+    @override
+    def __init__(self, session: sqlite3.Connection) -> None:
+        super().__init__(session)
+
+    @override
+    def get_by_title(self, title: str) -> Optional[Book]:
+        row: Optional[sqlite3.Row] = self._session.execute(
+            f"SELECT {BOOKS_COLUMNS} FROM books WHERE title = ? ORDER BY rowid LIMIT 1", (title,)
+        ).fetchone()
+        return self._to_book(row) if row is not None else None
+
+    @override
+    def get_by_title_and_author(self, title: str, author: str) -> Optional[Book]:
+        row: Optional[sqlite3.Row] = self._session.execute(
+            f"SELECT {BOOKS_COLUMNS} FROM books WHERE title = ? AND author = ? ORDER BY rowid LIMIT 1", (title, author)
+        ).fetchone()
+        return self._to_book(row) if row is not None else None
+
+    @override
+    def search(self, query: str, limit: int) -> List[Book]:
+        words: Set[str] = set(analyze(query))
+        if not words:
+            return []
+
+        placeholders: str = ", ".join("?" * len(words))
+        postings: Dict[str, List[Tuple[str, float]]] = {}
+        for row in self._session.execute(
+                f"SELECT word, oid, weight FROM book_words WHERE word IN ({placeholders})", tuple(words)
+        ):
+            postings.setdefault(row["word"], []).append((row["oid"], row["weight"]))
+
+        books_amount: int = self._session.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+        scores: Dict[str, float] = {}
+        for posting in postings.values():
+            idf: float = inverse_document_frequency(books_amount, len(posting))
+            for oid, weight in posting:
+                scores[oid] = scores.get(oid, 0.0) + weight * idf
+
+        best: List[str] = [oid for oid, _ in heapq.nlargest(limit, scores.items(), key=lambda item: item[1])]
+        return self._get_many(best)
+
+    @override
+    def find_by_similar_title(self, title: str, limit: int, threshold: float) -> List[Book]:
+        return self._find_by_similar("title", title, limit, threshold)
+
+    @override
+    def find_by_similar_author(self, author: str, limit: int, threshold: float) -> List[Book]:
+        return self._find_by_similar("author", author, limit, threshold)
+
+    @override
+    def suggest(self, prefix: str, limit: int) -> List[Book]:
+        words: List[str] = prefixes.fold_prefix(prefix).split()
+        if not words or limit <= 0:
+            return []
+
+        if len(words) == 1:
+            # Completions start with the word, so books are read in order of their words until enough are found
+            condition: str = "w.word >= ? AND w.word < ?"
+            parameters: Tuple[str, ...] = (words[0], words[0] + "\U0010ffff")
+        else:
+            # Other words of the prefix are complete, so books with the longest of them are completed and sorted
+            condition = "w.word = ?"
+            parameters = (max(words[:-1], key=len),)
+
+        rows: sqlite3.Cursor = self._session.execute(
+            f"SELECT w.word, b.oid, b.title, b.author, b.year, b.status, b.version "
+            f"FROM book_name_words AS w JOIN books AS b ON b.oid = w.oid WHERE {condition} ORDER BY w.word",
+            parameters,
+        )
+
+        found: Dict[str, Tuple[str, Book]] = {}
+        last_word: Optional[str] = None
+        for row in rows:
+            # Completions by the next words are after completions by already read ones
+            if len(words) == 1 and len(found) >= limit and row["word"] != last_word:
+                break
+            last_word = row["word"]
+
+            completion: Optional[str] = prefixes.complete(prefix, (row["title"], row["author"]))
+            if completion is not None and row["oid"] not in found:
+                found[row["oid"]] = (completion, self._to_book(row))
+
+        return [book for _, book in sorted(found.values(), key=lambda item: item[0])[:limit]]
+
+    @override
+    def query(self, query: BooksQuery) -> List[Book]:
+        # Sqlite picks the most selective of indexes on year, status, author and title by itself
+        conditions: List[str] = []
+        parameters: List[object] = []
+        for condition, value in (
+                ("year >= ?", query.year_from),
+                ("year <= ?", query.year_to),
+                ("status = ?", query.status),
+                ("author = ?", query.author),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+
+        if query.title_prefix is not None:
+            conditions.append("title >= ? AND title < ?")
+            parameters.extend((query.title_prefix, query.title_prefix + "\U0010ffff"))
+
+        where: str = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order_by: str = ", ".join(f"{name} DESC" if descending else name for name, descending in query.sort_keys)
+        limit: str = "LIMIT ?" if query.limit is not None else ""
+        if query.limit is not None:
+            parameters.append(query.limit)
+
+        rows: sqlite3.Cursor = self._session.execute(
+            f"SELECT {BOOKS_COLUMNS} FROM books {where} ORDER BY {order_by} {limit}", parameters
+        )
+        return [self._to_book(row) for row in rows]
+
+    @override
+    def add(self, model: Book) -> Book:
+        try:
+            self._session.execute(
+                f"INSERT INTO books ({BOOKS_COLUMNS}) VALUES (:oid, :title, :author, :year, :status, :version)",
+                model.to_dict(),
+            )
+        except sqlite3.IntegrityError as e:
+            raise BookOidAlreadyExistsException(model.oid) from e
+        self._index_words(model.oid, model)
+        self._index_name_words(model.oid, model)
+        return model
+
+    @override
+    def get(self, oid: str) -> Optional[Book]:
+        row: Optional[sqlite3.Row] = self._session.execute(
+            f"SELECT {BOOKS_COLUMNS} FROM books WHERE oid = ?", (oid,)
+        ).fetchone()
+        return self._to_book(row) if row is not None else None
+
+    @override
+    def update(self, oid: str, model: Book) -> Book:
+        try:
+            cursor: sqlite3.Cursor = self._session.execute(
+                "UPDATE books SET oid = :oid, title = :title, author = :author, year = :year, status = :status, "
+                "version = version + 1 WHERE oid = :old_oid AND version = :version",
+                model.to_dict(include={"old_oid": oid}),
+            )
+        except sqlite3.IntegrityError as e:
+            # Primary key is the only constraint, which values of valid book may break
+            raise BookOidAlreadyExistsException(model.oid) from e
+
+        if cursor.rowcount == 0:
+            self._raise_missing(oid, model.version)
+
+        self._index_words(oid, model)
+        self._index_name_words(oid, model)
+        return replace(model, version=model.version + 1)
+
+    @override
+    def delete(self, oid: str, version: Optional[int] = None) -> None:
+        if version is None:
+            cursor: sqlite3.Cursor = self._session.execute("DELETE FROM books WHERE oid = ?", (oid,))
+        else:
+            cursor = self._session.execute("DELETE FROM books WHERE oid = ? AND version = ?", (oid, version))
+
+        if cursor.rowcount == 0:
+            self._raise_missing(oid, version)
+
+        self._session.execute("DELETE FROM book_words WHERE oid = ?", (oid,))
+        self._session.execute("DELETE FROM book_name_words WHERE oid = ?", (oid,))
+
+    @override
+    def list(self) -> List[Book]:
+        rows: sqlite3.Cursor = self._session.execute(f"SELECT {BOOKS_COLUMNS} FROM books ORDER BY rowid")
+        return [self._to_book(row) for row in rows]
+
+    @override
+    def list_page(self, after: Optional[str], limit: int) -> List[Book]:
+        rows: sqlite3.Cursor = self._session.execute(
+            f"SELECT {BOOKS_COLUMNS} FROM books WHERE oid > ? ORDER BY oid LIMIT ?", (after or "", limit)
+        )
+        return [self._to_book(row) for row in rows]
+
+    def index_missing_words(self) -> None:
+        """
+        Indexes words of books, which have been stored before full-text search appeared.
+        """
+        rows: sqlite3.Cursor = self._session.execute(
+            f"SELECT {BOOKS_COLUMNS} FROM books WHERE oid NOT IN (SELECT oid FROM book_words)"
+        )
+        for row in rows.fetchall():
+            self._index_words(row["oid"], self._to_book(row))
+
+    def _index_words(self, oid: str, model: Book) -> None:
+        """
+        Replaces words of the book, which was stored with 'oid', with words of the model.
+        """
+        self._session.execute("DELETE FROM book_words WHERE oid = ?", (oid,))
+        self._session.executemany(
+            "INSERT INTO book_words (word, oid, weight) VALUES (?, ?, ?)",
+            ((word, model.oid, weight) for word, weight in BooksIndex.words_of(model).items()),
+        )
+
+    def index_missing_name_words(self) -> None:
+        """
+        Indexes words of titles and authors of books, which have been stored before lookups of similar ones appeared.
+        """
+        rows: sqlite3.Cursor = self._session.execute(
+            f"SELECT {BOOKS_COLUMNS} FROM books WHERE oid NOT IN (SELECT oid FROM book_name_words)"
+        )
+        for row in rows.fetchall():
+            self._index_name_words(row["oid"], self._to_book(row))
+
+    def _index_name_words(self, oid: str, model: Book) -> None:
+        """
+        Replaces folded words of title and author of the book, which was stored with 'oid', with words of the model.
+        Trigrams of words are never deleted, words without books are just not found.
+        """
+        self._session.execute("DELETE FROM book_name_words WHERE oid = ?", (oid,))
+
+        for field, name in (("title", model.title.as_generic_type()), ("author", model.author.as_generic_type())):
+            words: List[str] = list(dict.fromkeys(fold(name)))
+            self._session.executemany(
+                "INSERT OR IGNORE INTO book_name_words (field, word, oid) VALUES (?, ?, ?)",
+                ((field, word, model.oid) for word in words),
+            )
+            self._session.executemany(
+                "INSERT OR IGNORE INTO name_word_trigrams (trigram, word) VALUES (?, ?)",
+                ((trigram, word) for word in words for trigram in trigrams.trigrams(word)),
+            )
+
+    def _find_by_similar(self, field: str, query: str, limit: int, threshold: float) -> List[Book]:
+        """
+        Scores books like NamesIndex of in-memory repositories does, but reads all books with similar words.
+        """
+        similar_words: List[Dict[str, float]] = [
+            self._find_similar_words(word, threshold) for word in dict.fromkeys(fold(query))
+        ]
+        words: Set[str] = {word for similar in similar_words for word in similar}
+        if not words:
+            return []
+
+        # The most similar word of the book for every word of the query
+        best_similarities: Dict[str, Dict[int, float]] = {}
+        for row in self._session.execute(
+                f"SELECT oid, word FROM book_name_words WHERE field = ? AND word IN ({', '.join('?' * len(words))})",
+                (field, *words),
+        ):
+            book_similarities: Dict[int, float] = best_similarities.setdefault(row["oid"], {})
+            for position, similar in enumerate(similar_words):
+                similarity: float = similar.get(row["word"], 0.0)
+                if similarity > book_similarities.get(position, 0.0):
+                    book_similarities[position] = similarity
+
+        scores: Dict[str, float] = {
+            oid: sum(book_similarities.values()) / len(similar_words)
+            for oid, book_similarities in best_similarities.items()
+        }
+        best: List[str] = [
+            oid for oid, score in heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            if trigrams.is_similar(score, threshold)
+        ]
+        return self._get_many(best)
+
+    def _find_similar_words(self, word: str, threshold: float) -> Dict[str, float]:
+        """
+        :return: similarity of every indexed word, which shares enough trigrams with the word
+        """
+        word_trigrams: FrozenSet[str] = trigrams.trigrams(word)
+        # One trigram less, so rounding of the threshold never drops a similar word, similarity is checked exactly later
+        min_shared: int = max(math.ceil(threshold * len(word_trigrams)) - 1, 1)
+        rows: sqlite3.Cursor = self._session.execute(
+            f"SELECT word FROM name_word_trigrams WHERE trigram IN ({', '.join('?' * len(word_trigrams))}) "
+            f"GROUP BY word HAVING COUNT(*) >= ?",
+            (*word_trigrams, min_shared),
+        )
+
+        found: Dict[str, float] = {}
+        for row in rows:
+            similarity: float = trigrams.similarity(word_trigrams, trigrams.trigrams(row["word"]))
+            if trigrams.is_similar(similarity, threshold):
+                found[row["word"]] = similarity
+        return found
+
+    def _get_many(self, oids: List[str]) -> List[Book]:
+        """
+        :return: books in order of oids, missing ones are skipped
+        """
+        if not oids:
+            return []
+
+        rows: List[sqlite3.Row] = self._session.execute(
+            f"SELECT {BOOKS_COLUMNS} FROM books WHERE oid IN ({', '.join('?' * len(oids))})", oids
+        ).fetchall()
+        books: Dict[str, Book] = {row["oid"]: self._to_book(row) for row in rows}
+        return [books[oid] for oid in oids if oid in books]
+
+    def _raise_missing(self, oid: str, version: Optional[int]) -> None:
+        """
+        Compare-and-swap statement has not changed anything: either there is no such book or its version differs.
+        """
+        row: Optional[sqlite3.Row] = self._session.execute("SELECT version FROM books WHERE oid = ?", (oid,)).fetchone()
+
+        if row is None:
+            raise BookNotFoundException(oid)
+
+        raise BookVersionConflictException(oid, version, row["version"])  # type: ignore[arg-type]
+
+    @staticmethod
+    def _to_book(row: sqlite3.Row) -> Book:
+        return Book(
+            oid=row["oid"],
+            title=row["title"],
+            author=row["author"],
+            year=row["year"],
+            status=row["status"],
+            version=row["version"],
+        )
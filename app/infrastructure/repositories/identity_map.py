@@ -0,0 +1,89 @@
+from typing import (
+    Dict,
+    Generic,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from app.infrastructure.repositories.base import BaseEntityType
+
+
+class IdentityMap(Generic[BaseEntityType]):
+    """
+    Identity map of the unit of work. It keeps only entities, which were touched in the unit of work:
+
+    - new: entities, which are not in the storage yet;
+    - dirty: entities from the storage, which were replaced;
+    - deleted: oids of entities from the storage, which were deleted;
+    - versions: versions of stored entities, which were read before they were changed or deleted.
+
+    Committed entities are never changed until commit, so rollback is just forgetting the tracked entities.
+    Commit must check that versions in the storage are still the same, otherwise somebody else has changed them.
+    """
+
+    def __init__(self) -> None:
+        self.new: Dict[str, BaseEntityType] = {}
+        self.dirty: Dict[str, BaseEntityType] = {}
+        self.deleted: Set[str] = set()
+        self.versions: Dict[str, int] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.dirty or self.deleted)
+
+    def __contains__(self, oid: str) -> bool:
+        return oid in self.new or oid in self.dirty or oid in self.deleted
+
+    def get(self, oid: str) -> Tuple[bool, Optional[BaseEntityType]]:
+        """
+        :return: flag whether entity is tracked and the tracked entity (None if it was deleted)
+        """
+        if oid in self.deleted:
+            return True, None
+
+        if oid in self.new:
+            return True, self.new[oid]
+
+        if oid in self.dirty:
+            return True, self.dirty[oid]
+
+        return False, None
+
+    def register_new(self, entity: BaseEntityType) -> None:
+        self.new[entity.oid] = entity
+
+    def register_dirty(self, entity: BaseEntityType) -> None:
+        if entity.oid in self.new:
+            self.new[entity.oid] = entity
+            return
+
+        self.deleted.discard(entity.oid)
+        self.dirty[entity.oid] = entity
+
+    def register_deleted(self, oid: str) -> None:
+        if self.new.pop(oid, None) is not None:
+            return
+
+        self.dirty.pop(oid, None)
+        self.deleted.add(oid)
+
+    def expect_version(self, oid: str, version: int) -> None:
+        """
+        Remembers version of the stored entity.
+        Only the first version matters, later ones are made by this unit of work.
+        """
+        self.versions.setdefault(oid, version)
+
+    def changed(self) -> Iterator[BaseEntityType]:
+        """
+        :return: entities which must be saved: dirty ones and then new ones in order of registration
+        """
+        yield from self.dirty.values()
+        yield from self.new.values()
+
+    def clear(self) -> None:
+        self.new.clear()
+        self.dirty.clear()
+        self.deleted.clear()
+        self.versions.clear()
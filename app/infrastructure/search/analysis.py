@@ -0,0 +1,109 @@
+import re
+from typing import (
+    Dict,
+    Final,
+    List,
+    Optional,
+    Tuple,
+)
+
+
+WORD_PATTERN: Final[re.Pattern[str]] = re.compile(r"\w+")
+CYRILLIC_PATTERN: Final[re.Pattern[str]] = re.compile(r"[а-я]")
+
+# Endings are checked from the longest to the shortest, stem keeps at least MIN_STEM_LENGTH letters.
+# There are no 'ов' and 'ев', because they end surnames: 'Булгаков' and 'Булгакова' must give the same stem
+RUSSIAN_ENDINGS: Final[Tuple[str, ...]] = (
+    "иями", "ями", "ами", "ого", "его", "ому", "ему", "ыми", "ими", "ией", "иям", "иях", "ием",
+    "ой", "ей", "ий", "ый", "ая", "яя", "ое", "ее", "ые", "ие", "ом", "ем", "ым", "ам", "ям", "ах", "ях",
+    "ую", "юю", "ия", "ию", "ии",
+    "а", "я", "о", "е", "ы", "и", "у", "ю", "ь", "й",
+)
+MIN_STEM_LENGTH: Final[int] = 3
+
+# Russian letters are spelled by latin ones, so 'Достоевский' and 'Dostoevsky' are written almost the same
+TRANSLITERATION: Final[Dict[int, str]] = str.maketrans({
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e", "ж": "zh", "з": "z", "и": "i",
+    "й": "y", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t",
+    "у": "u", "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch", "ъ": "", "ы": "y", "ь": "",
+    "э": "e", "ю": "yu", "я": "ya",
+})
+
+# Cache of stems of words, vocabulary of the catalog is much smaller than the catalog
+_stems: Dict[str, str] = {}
+_STEMS_CACHE_SIZE: Final[int] = 100_000
+
+
+def normalize(text: str) -> str:
+    """
+    Case-insensitive form of the text, where 'ё' is the same letter as 'е'.
+    """
+    return text.casefold().replace("ё", "е")
+
+
+def transliterate(text: str) -> str:
+    """
+    Spells russian letters of the normalized text by latin ones, other characters are kept as they are.
+    """
+    return text.translate(TRANSLITERATION)
+
+
+def fold(text: str) -> List[str]:
+    """
+    Normalized and transliterated words of the text, so russian and latin spelling of the name are almost the same.
+    """
+    return WORD_PATTERN.findall(transliterate(normalize(text)))
+
+
+def stem(word: str) -> str:
+    """
+    Light stemming of normalized russian or english word: drops the ending of the word,
+    so different forms of the word give the same stem, for example 'войны' and 'война'.
+    """
+    cached: Optional[str] = _stems.get(word)
+    if cached is not None:
+        return cached
+
+    result: str = _stem_russian(word) if CYRILLIC_PATTERN.search(word) else _stem_english(word)
+
+    if len(_stems) >= _STEMS_CACHE_SIZE:
+        _stems.clear()
+    _stems[word] = result
+
+    return result
+
+
+def analyze(text: str) -> List[str]:
+    """
+    Splits the text into words and returns their stems in order of words.
+    """
+    return [stem(word) for word in WORD_PATTERN.findall(normalize(text))]
+
+
+def _stem_russian(word: str) -> str:
+    for ending in RUSSIAN_ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM_LENGTH:
+            return word[:-len(ending)]
+
+    return word
+
+
+def _stem_english(word: str) -> str:
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+
+    if len(word) > 4 and word.endswith("sses"):
+        return word[:-2]
+
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+
+    for suffix in ("ing", "ed"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            word = word[:-len(suffix)]
+            # 'running' and 'run' give the same stem
+            if word[-1] == word[-2] and word[-1] not in "aeioulsz":
+                word = word[:-1]
+            return word
+
+    return word
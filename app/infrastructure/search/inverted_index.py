@@ -0,0 +1,88 @@
+import math
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+)
+
+
+# Weight of every term of the document, terms of more important fields have bigger weights
+TermWeights = Dict[str, float]
+
+
+class InvertedIndex:
+    """
+    Maps every term to documents, which contain it, with weight of the term in the document.
+    Documents are ranked by the sum of weights of query terms multiplied by their inverse document frequency,
+    so rare terms matter more than common ones.
+
+    Index does not store documents, so the caller passes the same terms to 'remove' as it has passed to 'add'.
+    Postings are changed in place by a writer, so readers copy them before iterating.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._documents_amount: int = 0
+
+    def add(self, document_id: str, terms: TermWeights) -> None:
+        for term, weight in terms.items():
+            self._postings.setdefault(term, {})[document_id] = weight
+
+        self._documents_amount += 1
+
+    def remove(self, document_id: str, terms: TermWeights) -> None:
+        for term in terms:
+            posting: Dict[str, float] = self._postings.get(term, {})
+            posting.pop(document_id, None)
+
+            if not posting:
+                self._postings.pop(term, None)
+
+        self._documents_amount = max(self._documents_amount - 1, 0)
+
+    def search(self, query_terms: Iterable[str]) -> Dict[str, float]:
+        """
+        :return: scores of documents, which contain at least one of query terms
+        """
+        scores: Dict[str, float] = {}
+
+        for term in set(query_terms):
+            posting: List[Tuple[str, float]] = list(self._postings.get(term, {}).items())
+            idf: float = inverse_document_frequency(self._documents_amount, len(posting))
+
+            for document_id, weight in posting:
+                scores[document_id] = scores.get(document_id, 0.0) + weight * idf
+
+        return scores
+
+    def score(self, terms: TermWeights, query_terms: Iterable[str]) -> float:
+        """
+        Scores the document, which is not in the index, as if it was there.
+        """
+        return sum(
+            terms[term] * inverse_document_frequency(self._documents_amount + 1, len(self._postings.get(term, ())) + 1)
+            for term in set(query_terms)
+            if term in terms
+        )
+
+
+def inverse_document_frequency(documents_amount: int, documents_with_term: int) -> float:
+    """
+    Smoothed inverse document frequency of BM25, which is always positive.
+    """
+    total: int = max(documents_amount, documents_with_term)
+    return math.log(1 + (total - documents_with_term + 0.5) / (documents_with_term + 0.5))
+
+
+def term_weights(fields: Iterable[Tuple[Iterable[str], float]]) -> TermWeights:
+    """
+    Sums weights of terms of all fields of the document, every field is given as its terms and weight of the field.
+    """
+    weights: TermWeights = {}
+
+    for terms, field_weight in fields:
+        for term in terms:
+            weights[term] = weights.get(term, 0.0) + field_weight
+
+    return weights
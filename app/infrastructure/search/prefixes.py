@@ -0,0 +1,264 @@
+import threading
+from array import array
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from typing import (
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Self,
+    Sequence,
+    Tuple,
+)
+
+from app.infrastructure.search.analysis import fold
+
+
+# Name is completed from the start of each of its first words, so long titles take a bounded amount of entries
+MAX_INDEXED_WORDS: Final[int] = 8
+# Blocks are split, when they become twice longer, so insertion moves at most a few kilobytes
+BLOCK_SIZE: Final[int] = 512
+
+# Entry packs id of the name and offset of its word in the folded name into one integer
+_OFFSET_BITS: Final[int] = 10
+_OFFSET_MASK: Final[int] = (1 << _OFFSET_BITS) - 1
+
+
+def fold_prefix(prefix: str) -> str:
+    """
+    Folded prefix, which is compared with completions, for example, 'Фёдор дост' gives 'fedor dost'.
+    """
+    return " ".join(fold(prefix))
+
+
+def completions(name: str) -> List[str]:
+    """
+    Folded name from the start of each of its first words, which are compared with the folded prefix.
+    """
+    folded: str = fold_prefix(name)
+    return [folded[offset:] for offset in _offsets(folded)]
+
+
+def complete(prefix: str, names: Iterable[str]) -> Optional[str]:
+    """
+    Completes the prefix by names like PrefixIndex does, but without index,
+    for example, by title and author of a book changed in the unit of work.
+    :return: the first completion of any of names, which starts with the folded prefix, or None
+    """
+    folded_prefix: str = fold_prefix(prefix)
+    if not folded_prefix:
+        return None
+
+    return min(
+        (completion for name in names for completion in completions(name) if completion.startswith(folded_prefix)),
+        default=None,
+    )
+
+
+class PrefixIndex:
+    """
+    Completes prefixes of names, titles and other short texts by any of their words,
+    for example, 'дост' and 'Fedor Dost' complete 'Фёдор Достоевский'.
+
+    Index keeps every folded name once and entries, which point at starts of its words, sorted by the folded name
+    from that word. Entries are integers in blocks of arrays, so they take a few bytes per word instead of nodes
+    of a trie, and adding or removing a name moves entries only of one block. Completions of the prefix are
+    the next entries after its position, which is found by binary search.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._folded: List[str] = []
+        self._documents: List[List[str]] = []
+        self._names: List[Optional[str]] = []
+        self._free_ids: List[int] = []
+        self._blocks: List[array[int]] = []
+        # Completion of the last entry of every block
+        self._lasts: List[str] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def build(cls, names: Iterable[Tuple[str, str]]) -> Self:
+        """
+        Builds the index from pairs of name and id of its document at once, which is faster than adding them one by one.
+        """
+        index: Self = cls()
+        entries: List[int] = []
+
+        for name, document_id in names:
+            name_id: Optional[int] = index._ids.get(name)
+            if name_id is not None:
+                index._documents[name_id].append(document_id)
+                continue
+
+            name_id = index._register(name, document_id)
+            entries.extend(name_id << _OFFSET_BITS | offset for offset in _offsets(index._folded[name_id]))
+
+        entries.sort(key=index._completion)
+        for start in range(0, len(entries), BLOCK_SIZE):
+            block: array[int] = array("Q", entries[start:start + BLOCK_SIZE])
+            index._blocks.append(block)
+            index._lasts.append(index._completion(block[-1]))
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, name: str, document_id: str) -> None:
+        with self._lock:
+            name_id: Optional[int] = self._ids.get(name)
+            if name_id is not None:
+                self._documents[name_id].append(document_id)
+                return
+
+            name_id = self._register(name, document_id)
+            for offset in _offsets(self._folded[name_id]):
+                self._insert(name_id << _OFFSET_BITS | offset)
+
+    def remove(self, name: str, document_id: str) -> None:
+        with self._lock:
+            name_id: Optional[int] = self._ids.get(name)
+            if name_id is None:
+                return
+
+            documents: List[str] = self._documents[name_id]
+            if document_id in documents:
+                documents.remove(document_id)
+            if documents:
+                return
+
+            for offset in _offsets(self._folded[name_id]):
+                self._delete(name_id << _OFFSET_BITS | offset)
+
+            del self._ids[name]
+            self._names[name_id] = None
+            self._folded[name_id] = ""
+            self._free_ids.append(name_id)
+
+    def documents(self, name: str) -> Sequence[str]:
+        """
+        :return: ids of documents with the name in order of adding
+        """
+        with self._lock:
+            name_id: Optional[int] = self._ids.get(name)
+            return tuple(self._documents[name_id]) if name_id is not None else ()
+
+    def complete(self, prefix: str, limit: int) -> List[Tuple[str, str]]:
+        """
+        :return: at most 'limit' distinct names, which have a word starting with the prefix, with their completion
+            of the prefix, in order of completions
+        """
+        folded_prefix: str = fold_prefix(prefix)
+        found: Dict[str, str] = {}
+        if not folded_prefix or limit <= 0:
+            return []
+
+        with self._lock:
+            for completion, name in self._completions(folded_prefix):
+                if name not in found:
+                    found[name] = completion
+                    if len(found) >= limit:
+                        break
+
+        return [(completion, name) for name, completion in found.items()]
+
+    def _register(self, name: str, document_id: str) -> int:
+        folded: str = fold_prefix(name)
+
+        if self._free_ids:
+            name_id: int = self._free_ids.pop()
+            self._names[name_id] = name
+            self._folded[name_id] = folded
+            self._documents[name_id] = [document_id]
+        else:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._folded.append(folded)
+            self._documents.append([document_id])
+
+        self._ids[name] = name_id
+        return name_id
+
+    def _completions(self, folded_prefix: str) -> Iterator[Tuple[str, str]]:
+        """
+        :return: completions of the prefix with their names in order of completions
+        """
+        position: int = bisect_left(self._lasts, folded_prefix)
+
+        while position < len(self._blocks):
+            block: array[int] = self._blocks[position]
+            for index in range(bisect_left(block, folded_prefix, key=self._completion), len(block)):
+                completion: str = self._completion(block[index])
+                if not completion.startswith(folded_prefix):
+                    return
+
+                name: Optional[str] = self._names[block[index] >> _OFFSET_BITS]
+                if name is not None:
+                    yield completion, name
+
+            position += 1
+
+    def _completion(self, entry: int) -> str:
+        return self._folded[entry >> _OFFSET_BITS][entry & _OFFSET_MASK:]
+
+    def _insert(self, entry: int) -> None:
+        completion: str = self._completion(entry)
+        if not self._blocks:
+            self._blocks.append(array("Q", (entry,)))
+            self._lasts.append(completion)
+            return
+
+        # Completions after the last one are appended to the last block
+        position: int = min(bisect_left(self._lasts, completion), len(self._blocks) - 1)
+        block: array[int] = self._blocks[position]
+        block.insert(bisect_right(block, completion, key=self._completion), entry)
+        self._lasts[position] = self._completion(block[-1])
+
+        if len(block) >= 2 * BLOCK_SIZE:
+            head: array[int] = block[:BLOCK_SIZE]
+            self._blocks[position:position + 1] = [head, block[BLOCK_SIZE:]]
+            self._lasts.insert(position, self._completion(head[-1]))
+
+    def _delete(self, entry: int) -> None:
+        completion: str = self._completion(entry)
+        position: int = bisect_left(self._lasts, completion)
+
+        # Equal completions of different names may continue in the next blocks
+        while position < len(self._blocks):
+            block: array[int] = self._blocks[position]
+            index: int = bisect_left(block, completion, key=self._completion)
+
+            while index < len(block) and block[index] != entry and self._completion(block[index]) == completion:
+                index += 1
+
+            if index < len(block) and block[index] == entry:
+                del block[index]
+                if block:
+                    self._lasts[position] = self._completion(block[-1])
+                else:
+                    del self._blocks[position]
+                    del self._lasts[position]
+                return
+
+            if index < len(block):
+                return
+
+            position += 1
+
+
+def _offsets(folded: str) -> List[int]:
+    offsets: List[int] = [0] if folded else []
+
+    for offset, character in enumerate(folded):
+        if len(offsets) >= MAX_INDEXED_WORDS or offset >= _OFFSET_MASK:
+            break
+        if character == " ":
+            offsets.append(offset + 1)
+
+    return offsets
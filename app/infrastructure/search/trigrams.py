@@ -0,0 +1,305 @@
+import heapq
+import math
+from array import array
+from collections import Counter
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from app.infrastructure.search.analysis import fold
+
+
+# Similarities are fractions, so there is a small margin for their rounding
+_EPSILON: float = 1e-9
+
+
+def trigrams(word: str) -> FrozenSet[str]:
+    """
+    Trigrams of the folded word like pg_trgm builds them: the word is padded by two spaces at the start
+    and one space at the end, so short words and starts of words matter more.
+    """
+    padded: str = f"  {word} "
+    return frozenset(padded[start:start + 3] for start in range(len(padded) - 2))
+
+
+def similarity(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    """
+    Share of common trigrams among all trigrams of both words, from 0 to 1.
+    """
+    if not first or not second:
+        return 0.0
+
+    shared: int = len(first & second)
+    return shared / (len(first) + len(second) - shared)
+
+
+def is_similar(value: float, threshold: float) -> bool:
+    """
+    Compares similarity or score with the threshold, allowing rounding errors of fractions.
+    """
+    return value >= threshold - _EPSILON
+
+
+def score(query: str, name: str, threshold: float) -> float:
+    """
+    Scores the name like NamesIndex does, but without index, for example, for a few books changed in the unit of work.
+    :return: score of the name or 0, if it's less than the threshold
+    """
+    query_words: List[str] = list(dict.fromkeys(fold(query)))
+    if not query_words:
+        return 0.0
+
+    name_trigrams: List[FrozenSet[str]] = [trigrams(word) for word in dict.fromkeys(fold(name))]
+    total: float = 0.0
+    for word in query_words:
+        word_trigrams: FrozenSet[str] = trigrams(word)
+        similarities: Iterator[float] = (similarity(word_trigrams, other) for other in name_trigrams)
+        total += max((value for value in similarities if value >= threshold - _EPSILON), default=0.0)
+
+    average: float = total / len(query_words)
+    return average if average >= threshold - _EPSILON else 0.0
+
+
+class TrigramIndex:
+    """
+    Finds words, which are similar to the query, for example, misspelled ones, without comparing the query
+    with every word. Every word has documents, which contain it.
+
+    Only words, which share enough trigrams with the query, may be similar to it: word with similarity
+    at least 'threshold' shares at least 'threshold * len(query)' trigrams. So the word must contain
+    at least one of the rarest 'len(query) - shared + 1' trigrams of the query, and only their postings
+    give candidates. A few next postings are counted too, and candidates, which are met not enough times,
+    are skipped without computing their similarity.
+
+    Postings are arrays of ids of words, so the index takes a few bytes per trigram of the word.
+    They are changed in place by a writer, which is fine for readers: they may only miss the change.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._words: List[Optional[str]] = []
+        self._sizes: array[int] = array("H")
+        self._documents: List[List[str]] = []
+        self._free_ids: List[int] = []
+        self._postings: Dict[str, array[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, word: str, document_id: str) -> None:
+        word_id: Optional[int] = self._ids.get(word)
+        if word_id is not None:
+            self._documents[word_id].append(document_id)
+            return
+
+        word_trigrams: FrozenSet[str] = trigrams(word)
+        if self._free_ids:
+            word_id = self._free_ids.pop()
+            self._words[word_id] = word
+            self._sizes[word_id] = len(word_trigrams)
+            self._documents[word_id] = [document_id]
+        else:
+            word_id = len(self._words)
+            self._words.append(word)
+            self._sizes.append(len(word_trigrams))
+            self._documents.append([document_id])
+
+        self._ids[word] = word_id
+        for trigram in word_trigrams:
+            posting: Optional[array[int]] = self._postings.get(trigram)
+            if posting is None:
+                posting = self._postings[trigram] = array("I")
+            posting.append(word_id)
+
+    def remove(self, word: str, document_id: str) -> None:
+        word_id: Optional[int] = self._ids.get(word)
+        if word_id is None:
+            return
+
+        documents: List[str] = self._documents[word_id]
+        if document_id in documents:
+            documents.remove(document_id)
+        if documents:
+            return
+
+        del self._ids[word]
+        for trigram in trigrams(word):
+            posting: array[int] = self._postings[trigram]
+            posting.remove(word_id)
+            if not posting:
+                del self._postings[trigram]
+
+        self._words[word_id] = None
+        self._free_ids.append(word_id)
+
+    def documents(self, word: str) -> Sequence[str]:
+        """
+        :return: ids of documents, which contain the word, in order of adding. The caller must not change them
+        """
+        word_id: Optional[int] = self._ids.get(word)
+        return self._documents[word_id] if word_id is not None else ()
+
+    def find_similar(self, query: str, threshold: float) -> Dict[str, float]:
+        """
+        :param query: folded word
+        :param threshold: minimum similarity of found words, from 0 to 1
+        :return: similarity of every found word to the query
+        """
+        query_trigrams: FrozenSet[str] = trigrams(query)
+        size: int = len(query_trigrams)
+        threshold = max(threshold, _EPSILON)
+        min_shared: int = max(math.ceil(threshold * size - _EPSILON), 1)
+        rarest: List[str] = sorted(query_trigrams, key=lambda trigram: len(self._postings.get(trigram, ())))
+
+        # Next postings only count candidates and are read while they are not longer than all read ones together:
+        # every read posting lets to skip words, which have been met less times
+        shared: Counter[int] = Counter()
+        read: int = 0
+        read_length: int = 0
+        while read < size:
+            posting: Sequence[int] = self._postings.get(rarest[read], ())
+            if read <= size - min_shared:
+                shared.update(posting)
+            elif len(posting) <= read_length:
+                shared.update(shared.keys() & posting)
+            else:
+                break
+
+            read_length += len(posting)
+            read += 1
+
+        # Word, which has been met 'count' times, shares at most 'count + unread' trigrams with the query
+        unread: List[str] = rarest[read:]
+        min_count: int = max(min_shared - len(unread), 1)
+        words: List[Optional[str]] = self._words
+        found: Dict[str, float] = {}
+
+        for word_id, count in shared.items():
+            word: Optional[str] = words[word_id]
+            if count < min_count or word is None:
+                continue
+
+            padded: str = f"  {word} "
+            for trigram in unread:
+                if trigram in padded:
+                    count += 1
+
+            word_similarity: float = count / (size + self._sizes[word_id] - count)
+            if word_similarity >= threshold - _EPSILON:
+                found[word] = word_similarity
+
+        return found
+
+
+class NamesIndex:
+    """
+    Finds names, titles and other short texts with misspelled words, for example, 'Dostoevsky' finds
+    'Фёдор Достоевский'. Words of the query are looked up in the trigram index of words of all names.
+
+    Name is scored by words, which it contains: every word of the query gives similarity of the most similar word
+    of the name, and the score is their average, so names with all words of the query are the first ones.
+    Names are met by words of the query from the rarest one, and lookup stops, when names, which have not been met,
+    can not be better than found ones, so common words like first names are usually not read at all.
+    """
+
+    def __init__(self) -> None:
+        self._words: TrigramIndex = TrigramIndex()
+        self._names: Dict[str, Tuple[Tuple[str, ...], List[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str, document_id: str) -> None:
+        entry: Optional[Tuple[Tuple[str, ...], List[str]]] = self._names.get(name)
+        if entry is not None:
+            entry[1].append(document_id)
+            return
+
+        words: Tuple[str, ...] = tuple(dict.fromkeys(fold(name)))
+        self._names[name] = (words, [document_id])
+        for word in words:
+            self._words.add(word, name)
+
+    def remove(self, name: str, document_id: str) -> None:
+        entry: Optional[Tuple[Tuple[str, ...], List[str]]] = self._names.get(name)
+        if entry is None:
+            return
+
+        words, documents = entry
+        if document_id in documents:
+            documents.remove(document_id)
+        if documents:
+            return
+
+        del self._names[name]
+        for word in words:
+            self._words.remove(word, name)
+
+    def documents(self, name: str) -> Sequence[str]:
+        """
+        :return: ids of documents with the name in order of adding. The caller must not change them
+        """
+        entry: Optional[Tuple[Tuple[str, ...], List[str]]] = self._names.get(name)
+        return entry[1] if entry is not None else ()
+
+    def find_similar(self, query: str, threshold: float, limit: int) -> List[Tuple[str, float]]:
+        """
+        :param threshold: minimum similarity of words and minimum score of names, from 0 to 1
+        :return: at most 'limit' names with their score, the most similar first
+        """
+        similar_words: List[Dict[str, float]] = [
+            self._words.find_similar(word, threshold) for word in dict.fromkeys(fold(query))
+        ]
+        if not similar_words or limit <= 0:
+            return []
+
+        similar_words.sort(key=lambda similar: sum(len(self._words.documents(word)) for word in similar))
+        scores: Dict[str, float] = {}
+        best_scores: List[float] = []
+        # Sum of the best similarities of words of the query, which have not been read yet
+        unread: float = sum(max(similar.values(), default=0.0) for similar in similar_words)
+
+        for similar in similar_words:
+            unread -= max(similar.values(), default=0.0)
+
+            for word, word_similarity in sorted(similar.items(), key=lambda item: item[1], reverse=True):
+                # Name, which has not been met yet, has no words similar to read words of the query
+                bound: float = (word_similarity + unread) / len(similar_words)
+                if bound < threshold - _EPSILON or (len(best_scores) >= limit and best_scores[0] >= bound):
+                    break
+
+                for name in self._words.documents(word):
+                    if name in scores:
+                        continue
+
+                    name_score: float = self._score(name, similar_words)
+                    scores[name] = name_score
+                    if name_score < threshold - _EPSILON:
+                        continue
+
+                    if len(best_scores) < limit:
+                        heapq.heappush(best_scores, name_score)
+                        continue
+
+                    heapq.heappushpop(best_scores, name_score)
+                    if best_scores[0] >= bound:
+                        break
+
+        found: List[Tuple[str, float]] = [
+            (name, name_score) for name, name_score in scores.items() if name_score >= threshold - _EPSILON
+        ]
+        return heapq.nlargest(limit, found, key=lambda item: item[1])
+
+    def _score(self, name: str, similar_words: List[Dict[str, float]]) -> float:
+        entry: Optional[Tuple[Tuple[str, ...], List[str]]] = self._names.get(name)
+        words: Tuple[str, ...] = entry[0] if entry is not None else ()
+
+        return sum(
+            max((similar.get(word, 0.0) for word in words), default=0.0) for similar in similar_words
+        ) / len(similar_words)
@@ -0,0 +1,238 @@
+import struct
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+
+# Stream starts with this marker, so it's never confused with json, which starts with '[' or '{'
+MAGIC: Final[bytes] = b"LBK\x01"
+
+DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+
+_DOUBLE: Final[struct.Struct] = struct.Struct(">d")
+
+
+def pack(value: Any) -> bytes:
+    """
+    Encodes value into MessagePack format. Only json compatible types are supported:
+    None, bool, int (up to 64 bits), float, str, list, tuple and dict with string keys.
+    """
+    chunks: List[bytes] = []
+    _pack(value, chunks.append)
+    return b"".join(chunks)
+
+
+def _pack(value: Any, write: Callable[[bytes], Any]) -> None:
+    if value is None:
+        write(b"\xc0")
+    elif value is True:
+        write(b"\xc3")
+    elif value is False:
+        write(b"\xc2")
+    elif isinstance(value, int):
+        write(_pack_int(value))
+    elif isinstance(value, float):
+        write(b"\xcb" + _DOUBLE.pack(value))
+    elif isinstance(value, str):
+        data: bytes = value.encode("utf-8")
+        write(_pack_header(len(data), 0xa0, 32, b"\xd9", b"\xda", b"\xdb"))
+        write(data)
+    elif isinstance(value, (list, tuple)):
+        write(_pack_header(len(value), 0x90, 16, None, b"\xdc", b"\xdd"))
+        for item in value:
+            _pack(item, write)
+    elif isinstance(value, dict):
+        write(_pack_header(len(value), 0x80, 16, None, b"\xde", b"\xdf"))
+        for key, item in value.items():
+            _pack(key, write)
+            _pack(item, write)
+    else:
+        raise TypeError(f"Type {type(value).__name__} is not supported by binary codec")
+
+
+def _pack_int(value: int) -> bytes:
+    if not -(1 << 63) <= value < 1 << 64:
+        raise OverflowError(f"Integer {value} does not fit into 64 bits")
+    if 0 <= value < 128:
+        return bytes((value,))
+    if -32 <= value < 0:
+        return struct.pack(">b", value)
+    if value >= 0:
+        for code, fmt, limit in ((b"\xcc", ">B", 1 << 8), (b"\xcd", ">H", 1 << 16), (b"\xce", ">I", 1 << 32)):
+            if value < limit:
+                return code + struct.pack(fmt, value)
+        return b"\xcf" + struct.pack(">Q", value)
+    for code, fmt, limit in ((b"\xd0", ">b", 1 << 7), (b"\xd1", ">h", 1 << 15), (b"\xd2", ">i", 1 << 31)):
+        if value >= -limit:
+            return code + struct.pack(fmt, value)
+    return b"\xd3" + struct.pack(">q", value)
+
+
+def _pack_header(size: int, fix: int, fix_limit: int, code8: Optional[bytes], code16: bytes, code32: bytes) -> bytes:
+    if size < fix_limit:
+        return bytes((fix | size,))
+    if code8 is not None and size < 1 << 8:
+        return code8 + struct.pack(">B", size)
+    if size < 1 << 16:
+        return code16 + struct.pack(">H", size)
+    return code32 + struct.pack(">I", size)
+
+
+class Unpacker:
+    """
+    Decodes MessagePack values one by one from the stream, which is read in chunks.
+    Only the not decoded part of the current chunk is held in memory.
+    """
+
+    def __init__(self, f: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buffer: bytes = b""
+        self._position: int = 0
+
+    def at_end(self) -> bool:
+        return self._position == len(self._buffer) and not self._fill(1)
+
+    def read(self, size: int) -> bytes:
+        if len(self._buffer) - self._position < size and not self._fill(size):
+            raise ValueError("Binary stream is truncated")
+
+        data: bytes = self._buffer[self._position:self._position + size]
+        self._position += size
+        return data
+
+    def unpack(self) -> Any:
+        code: int = self.read(1)[0]
+
+        if code < 0x80:
+            return code
+        if code >= 0xe0:
+            return code - 0x100
+        if 0xa0 <= code <= 0xbf:
+            return self.read(code & 0x1f).decode("utf-8")
+        if 0x90 <= code <= 0x9f:
+            return [self.unpack() for _ in range(code & 0x0f)]
+        if 0x80 <= code <= 0x8f:
+            return self._unpack_map(code & 0x0f)
+
+        if code not in _DECODERS:
+            raise ValueError(f"Unknown type code 0x{code:02x} in binary stream")
+
+        return _DECODERS[code](self)
+
+    def _unpack_number(self, fmt: struct.Struct) -> Any:
+        return fmt.unpack(self.read(fmt.size))[0]
+
+    def _unpack_map(self, size: int) -> Dict[Any, Any]:
+        return {self.unpack(): self.unpack() for _ in range(size)}
+
+    def _fill(self, size: int) -> bool:
+        """
+        Reads chunks until there are at least 'size' bytes after the position.
+        :return: False if the stream is over earlier
+        """
+        chunks: List[bytes] = [self._buffer[self._position:]]
+        available: int = len(chunks[0])
+
+        while available < size:
+            chunk: bytes = self._f.read(max(self._chunk_size, size - available))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            available += len(chunk)
+
+        self._buffer = b"".join(chunks)
+        self._position = 0
+        return available >= size
+
+
+def _number(fmt: str) -> Callable[[Unpacker], Any]:
+    compiled: struct.Struct = struct.Struct(fmt)
+    return lambda unpacker: unpacker._unpack_number(compiled)
+
+
+def _sized(fmt: str, read_value: Callable[[Unpacker, int], Any]) -> Callable[[Unpacker], Any]:
+    compiled: struct.Struct = struct.Struct(fmt)
+    return lambda unpacker: read_value(unpacker, unpacker._unpack_number(compiled))
+
+
+def _read_str(unpacker: Unpacker, size: int) -> str:
+    return unpacker.read(size).decode("utf-8")
+
+
+def _read_list(unpacker: Unpacker, size: int) -> List[Any]:
+    return [unpacker.unpack() for _ in range(size)]
+
+
+_DECODERS: Final[Dict[int, Callable[[Unpacker], Any]]] = {
+    0xc0: lambda unpacker: None,
+    0xc2: lambda unpacker: False,
+    0xc3: lambda unpacker: True,
+    0xcb: _number(">d"),
+    0xcc: _number(">B"),
+    0xcd: _number(">H"),
+    0xce: _number(">I"),
+    0xcf: _number(">Q"),
+    0xd0: _number(">b"),
+    0xd1: _number(">h"),
+    0xd2: _number(">i"),
+    0xd3: _number(">q"),
+    0xd9: _sized(">B", _read_str),
+    0xda: _sized(">H", _read_str),
+    0xdb: _sized(">I", _read_str),
+    0xdc: _sized(">H", _read_list),
+    0xdd: _sized(">I", _read_list),
+    0xde: _sized(">H", Unpacker._unpack_map),
+    0xdf: _sized(">I", Unpacker._unpack_map),
+}
+
+
+def dump_records(f: BinaryIO, records: Iterable[Dict[str, Any]]) -> None:
+    """
+    Writes records as MessagePack stream: magic, then every record. Keys of the records are written once:
+    record with the same keys as the previous one is written as array of values, other records are written as maps.
+    """
+    f.write(MAGIC)
+    keys: Optional[Tuple[str, ...]] = None
+
+    for record in records:
+        record_keys: Tuple[str, ...] = tuple(record)
+
+        if record_keys != keys:
+            keys = record_keys
+            f.write(pack(record))
+        else:
+            f.write(pack(list(record.values())))
+
+
+def load_records(f: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Reads records written by 'dump_records' one by one.
+    Raises ValueError if the stream is broken.
+    """
+    unpacker: Unpacker = Unpacker(f, chunk_size)
+
+    if unpacker.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Stream is not written by binary codec")
+
+    keys: Tuple[str, ...] = ()
+
+    while not unpacker.at_end():
+        record: Any = unpacker.unpack()
+
+        if isinstance(record, dict):
+            keys = tuple(record)
+            yield record
+        elif isinstance(record, list) and len(record) == len(keys):
+            yield dict(zip(keys, record, strict=True))
+        else:
+            raise ValueError("Record of binary stream is broken")
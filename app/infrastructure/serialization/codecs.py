@@ -0,0 +1,206 @@
+import gzip
+import io
+import json
+import lzma
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    Optional,
+    override,
+)
+
+from app.infrastructure.exceptions import UnknownStorageFormatException
+from app.infrastructure.serialization import binary
+from app.infrastructure.serialization.json_stream import (
+    iter_json_array,
+    write_json_array,
+)
+from app.settings.config import settings
+
+
+Record = Dict[str, Any]
+
+GZIP_MAGIC: Final[bytes] = b"\x1f\x8b"
+LZMA_MAGIC: Final[bytes] = b"\xfd7zXZ\x00"
+
+
+class Codec(ABC):
+    """
+    Format of records in the storage file. Codecs write and read records one by one,
+    so the whole file is never held in memory.
+    """
+
+    @abstractmethod
+    def dump(self, f: BinaryIO, records: Iterable[Record]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, f: BinaryIO) -> Iterator[Record]:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """
+    Json array. With indent it's human-readable, without indent it's minified.
+    """
+
+    def __init__(self, indent: Optional[int] = None) -> None:
+        self._indent = indent
+
+    @override
+    def dump(self, f: BinaryIO, records: Iterable[Record]) -> None:
+        with _text(f) as text:
+            write_json_array(text, records, indent=self._indent)
+
+    @override
+    def load(self, f: BinaryIO) -> Iterator[Record]:
+        with _text(f) as text:
+            yield from iter_json_array(text)
+
+
+class JsonLinesCodec(Codec):
+    """
+    One minified json object per line.
+    """
+
+    @override
+    def dump(self, f: BinaryIO, records: Iterable[Record]) -> None:
+        with _text(f) as text:
+            for record in records:
+                text.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                text.write("\n")
+
+    @override
+    def load(self, f: BinaryIO) -> Iterator[Record]:
+        with _text(f) as text:
+            for line in text:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class BinaryCodec(Codec):
+    """
+    MessagePack stream, where keys of records are written only once. See 'binary' module.
+    """
+
+    @override
+    def dump(self, f: BinaryIO, records: Iterable[Record]) -> None:
+        binary.dump_records(f, records)
+
+    @override
+    def load(self, f: BinaryIO) -> Iterator[Record]:
+        yield from binary.load_records(f)
+
+
+CODECS: Final[Dict[str, Codec]] = {
+    "pretty-json": JsonCodec(indent=4),
+    "json": JsonCodec(),
+    "jsonl": JsonLinesCodec(),
+    "binary": BinaryCodec(),
+}
+
+COMPRESSIONS: Final[Dict[str, bytes]] = {
+    "gzip": GZIP_MAGIC,
+    "lzma": LZMA_MAGIC,
+}
+
+
+@dataclass(frozen=True)
+class StorageFormat:
+    """
+    Codec with optional stream compression, which is used for writing.
+    Reading does not depend on the format: compression and codec are detected by the first bytes of the file,
+    so files written in any format are read after the format has been changed in settings.
+    """
+
+    codec: Codec
+    compression: Optional[str] = None
+
+    def dump(self, f: BinaryIO, records: Iterable[Record]) -> None:
+        if self.compression == "gzip":
+            # mtime is fixed, so the same records always give the same bytes
+            with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=6, mtime=0) as compressed:
+                self.codec.dump(compressed, records)  # type: ignore[arg-type]
+        elif self.compression == "lzma":
+            with lzma.LZMAFile(f, mode="wb") as compressed:
+                self.codec.dump(compressed, records)  # type: ignore[arg-type]
+        else:
+            self.codec.dump(f, records)
+
+
+def get_storage_format(name: str = "pretty-json", compression: Optional[str] = None) -> StorageFormat:
+    if name not in CODECS:
+        raise UnknownStorageFormatException(name)
+
+    if compression is not None and compression not in COMPRESSIONS:
+        raise UnknownStorageFormatException(compression)
+
+    return StorageFormat(codec=CODECS[name], compression=compression)
+
+
+def load_records(f: BinaryIO) -> Iterator[Record]:
+    """
+    Reads records from the file written in any storage format.
+    Raises ValueError if the file is broken.
+    """
+    stream: io.BufferedReader = f if isinstance(f, io.BufferedReader) else io.BufferedReader(f)  # type: ignore
+    head: bytes = stream.peek(len(LZMA_MAGIC))
+
+    try:
+        if head.startswith(GZIP_MAGIC):
+            with gzip.GzipFile(fileobj=stream, mode="rb") as decompressed_gzip:
+                yield from _load_decompressed(decompressed_gzip)
+        elif head.startswith(LZMA_MAGIC):
+            with lzma.open(stream, "rb") as decompressed_lzma:
+                yield from _load_decompressed(decompressed_lzma)
+        else:
+            yield from _load_decompressed(stream)
+    except (EOFError, gzip.BadGzipFile, lzma.LZMAError) as e:
+        raise ValueError(f"Compressed stream is broken: {e}") from e
+
+
+def _load_decompressed(stream: io.BufferedReader | gzip.GzipFile | lzma.LZMAFile) -> Iterator[Record]:
+    """
+    Decompressing files are buffered themselves, so they are peeked at without another buffer.
+    """
+    head: bytes = stream.peek(64)
+
+    if not head:
+        # Empty file is written by json lines codec, when there are no records
+        return iter(())
+
+    head = head.lstrip()
+
+    if head.startswith(binary.MAGIC):
+        return CODECS["binary"].load(stream)  # type: ignore[arg-type]
+
+    if head.startswith(b"{"):
+        return CODECS["jsonl"].load(stream)  # type: ignore[arg-type]
+
+    return CODECS["json"].load(stream)  # type: ignore[arg-type]
+
+
+@contextmanager
+def _text(f: BinaryIO) -> Iterator[io.TextIOWrapper]:
+    """
+    Text view of the binary stream, which does not close the stream.
+    """
+    text: io.TextIOWrapper = io.TextIOWrapper(f, encoding="utf-8")  # type: ignore[arg-type]
+    try:
+        yield text
+    finally:
+        text.flush()
+        text.detach()
+
+
+default_storage_format: StorageFormat = get_storage_format(settings.storage_format, settings.storage_compression)
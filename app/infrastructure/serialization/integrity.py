@@ -0,0 +1,102 @@
+import hashlib
+import io
+import json
+import logging
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Optional,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class HashingWriter(io.BufferedIOBase):
+    """
+    Writes everything to the underlying stream and computes checksum of written bytes on the fly.
+    Closing the writer does not close the underlying stream.
+    """
+
+    def __init__(self, f: BinaryIO) -> None:
+        super().__init__()
+        self._f = f
+        self._hash = hashlib.blake2b(digest_size=32)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._f.write(data)
+        self._hash.update(data)
+        return len(data)
+
+    def flush(self) -> None:
+        self._f.flush()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class HashingReader(io.RawIOBase):
+    """
+    Reads the underlying stream and computes checksum of read bytes on the fly.
+    Closing the reader does not close the underlying stream.
+    """
+
+    def __init__(self, f: BinaryIO) -> None:
+        super().__init__()
+        self._f = f
+        self._hash = hashlib.blake2b(digest_size=32)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size: int = self._f.readinto(buffer)  # type: ignore[attr-defined]
+        self._hash.update(memoryview(buffer)[:size])
+        return size
+
+    def hexdigest(self) -> str:
+        """
+        Reads the rest of the stream, which has not been read by the parser yet, and returns checksum of the whole.
+        """
+        while chunk := self._f.read(64 * 1024):
+            self._hash.update(chunk)
+        return self._hash.hexdigest()
+
+
+@dataclass(frozen=True)
+class StorageMeta:
+    """
+    Sidecar of the storage file: checksum of the file and version of validators, which have checked its records.
+    If both are still the same on load, records are trusted and are not validated again.
+    """
+
+    checksum: str
+    validators_version: int
+
+    @classmethod
+    def read(cls, path: Path) -> Optional["StorageMeta"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data: Dict[str, Any] = json.load(f)
+            return cls(checksum=data["checksum"], validators_version=data["validators_version"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring broken storage meta %s: %s", path, e)
+            return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def meta_path_for(path: Path) -> Path:
+    return path.with_name(path.name + ".meta")
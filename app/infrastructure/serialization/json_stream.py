@@ -0,0 +1,149 @@
+import json
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    Optional,
+    TextIO,
+)
+
+
+DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+
+_WHITESPACE: Final[str] = " \t\n\r"
+_DELIMITERS: Final[str] = _WHITESPACE + ",]"
+
+
+class _Reader:
+    """
+    Buffer over text file, which keeps only the part of the file, which is not parsed yet.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self.buffer: str = ""
+        self.position: int = 0
+        self.eof: bool = False
+
+    def read_more(self, size: int) -> bool:
+        """
+        Drops parsed part of the buffer and reads next chunk of the file.
+        :return: False if the file is over
+        """
+        chunk: str = self._f.read(size)
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        self.eof = not chunk
+        return bool(chunk)
+
+    def next_char(self) -> str:
+        """
+        Skips whitespaces and returns the next significant character without consuming it, empty string at the end.
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in _WHITESPACE:
+                self.position += 1
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if not self.read_more(self._chunk_size):
+                return ""
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.position)
+
+
+def iter_json_array(f: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Incrementally parses json array from the file and yields its items one by one.
+    Only one item and one chunk of the file are held in memory at the same time,
+    so huge files are read with memory, which does not depend on the size of the file.
+    Raises json.JSONDecodeError if the file is not a json array.
+    :param f: file opened in text mode
+    :param chunk_size: how many characters are read from the file at once
+    """
+    decoder: json.JSONDecoder = json.JSONDecoder()
+    reader: _Reader = _Reader(f, chunk_size)
+
+    if reader.next_char() != "[":
+        raise reader.error("Expecting '['")
+    reader.position += 1
+
+    if reader.next_char() == "]":
+        reader.position += 1
+    else:
+        while True:
+            yield _decode_item(decoder, reader, chunk_size)
+
+            char: str = reader.next_char()
+            reader.position += 1
+
+            if char == "]":
+                break
+
+            if char != ",":
+                raise reader.error("Expecting ',' delimiter or ']'")
+
+            reader.next_char()
+
+    if reader.next_char():
+        raise reader.error("Extra data")
+
+
+def _decode_item(decoder: json.JSONDecoder, reader: _Reader, chunk_size: int) -> Any:
+    """
+    Decodes the item, which starts at the current position, reading the file until the item is complete.
+    Item, which is not followed by delimiter, may be cut (for example, '-1.' of '-1.5'), so it's decoded once more
+    with the next chunk. Read size is doubled on every retry, so big items are not parsed quadratic number of times.
+    """
+    read_size: int = chunk_size
+
+    while True:
+        try:
+            item, end = decoder.raw_decode(reader.buffer, reader.position)
+        except json.JSONDecodeError:
+            if not reader.read_more(read_size):
+                raise
+        else:
+            if reader.eof or (end < len(reader.buffer) and reader.buffer[end] in _DELIMITERS):
+                reader.position = end
+                return item
+
+            parsed_size: int = reader.position
+            if not reader.read_more(read_size):
+                reader.position = end - parsed_size
+                return item
+
+        read_size *= 2
+
+
+def write_json_array(f: TextIO, items: Iterable[Dict[str, Any]], indent: Optional[int] = 4) -> None:
+    """
+    Writes items as json array one by one, so the whole array is never built in memory.
+    Output is the same as 'json.dump(list(items), f, ensure_ascii=False, indent=indent)',
+    without indent array is minified: 'json.dump(list(items), f, ensure_ascii=False, separators=(",", ":"))'.
+    """
+    if indent is None:
+        f.write("[")
+        for position, item in enumerate(items):
+            f.write("," if position else "")
+            f.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+        f.write("]")
+        return
+
+    padding: str = " " * indent
+    separator: str = "[\n" + padding
+    is_empty: bool = True
+
+    for item in items:
+        f.write(separator)
+        # Strings in json never contain raw line breaks, so every line break belongs to the formatting
+        f.write(json.dumps(item, ensure_ascii=False, indent=indent).replace("\n", "\n" + padding))
+        separator = ",\n" + padding
+        is_empty = False
+
+    f.write("[]" if is_empty else "\n]")
@@ -0,0 +1,31 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Dict,
+    Generic,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from app.exceptions import ApplicationException
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[T]):
+    """
+    Results of commands of a batch in their order. Result of a failed command is None,
+    and its error is kept by position of the command.
+    """
+
+    results: List[Optional[T]]
+    errors: Dict[int, ApplicationException] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> int:
+        return len(self.results) - len(self.errors)
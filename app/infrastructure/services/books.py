@@ -1,11 +1,25 @@
+from dataclasses import replace
 from typing import (
+    Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
 )
 
 from app.domain.entities.books import Book
-from app.infrastructure.exceptions import BookNotFoundException
+from app.infrastructure.exceptions import (
+    BookNotFoundException,
+    BookVersionConflictException,
+)
+from app.infrastructure.repositories.books.query import BooksQuery
+from app.infrastructure.services.pagination import (
+    decode_cursor,
+    encode_cursor,
+    Page,
+)
 from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.settings.config import settings
 
 
 class BooksService:
@@ -27,6 +41,25 @@ class BooksService:
             uow.commit()
             return new_book
 
+    def add_many(self, books: Iterable[Book]) -> List[Book]:
+        """
+        Service method which adds many books in one unit of work and commits once.
+        Books with titles, which are already in the library or repeat among books, are skipped.
+        Titles are looked up before any book is added, so every lookup uses only the title index
+        :param books: new books (domain objects)
+        :return: domain objects, which were added
+        """
+        with self._uow as uow:
+            new_books: Dict[str, Book] = {}
+            for book in books:
+                title: str = book.title.as_generic_type()
+                if title not in new_books and not uow.books.get_by_title(title):
+                    new_books[title] = book
+
+            added_books: List[Book] = [uow.books.add(model=book) for book in new_books.values()]
+            uow.commit()
+            return added_books
+
     def check_existence(self, oid: Optional[str] = None, title: Optional[str] = None) -> bool:
         """
         Service method which checks if a book exists in our database
@@ -84,25 +117,143 @@ class BooksService:
 
             return existing_book
 
+    def search(self, query: str, limit: int) -> List[Book]:
+        """
+        Service method which finds books by words of their title and author
+        :param query: words to search, in any form and case
+        :param limit: maximum amount of found books
+        :return: found books, the most relevant first
+        """
+        with self._uow as uow:
+            return uow.books.search(query, limit=limit)
+
+    def find_by_similar_title(
+            self, title: str, limit: int, threshold: float = settings.similarity_threshold
+    ) -> List[Book]:
+        """
+        Service method which finds books by title with misspelled words
+        :param title: title of the book, it may be misspelled or written by latin letters
+        :param limit: maximum amount of found books
+        :param threshold: minimum similarity of words, from 0 to 1
+        :return: found books, the most similar first
+        """
+        with self._uow as uow:
+            return uow.books.find_by_similar_title(title, limit=limit, threshold=threshold)
+
+    def find_by_similar_author(
+            self, author: str, limit: int, threshold: float = settings.similarity_threshold
+    ) -> List[Book]:
+        """
+        Service method which finds books by author with misspelled words
+        :param author: author of the book, it may be misspelled or written by latin letters
+        :param limit: maximum amount of found books
+        :param threshold: minimum similarity of words, from 0 to 1
+        :return: found books, the most similar first
+        """
+        with self._uow as uow:
+            return uow.books.find_by_similar_author(author, limit=limit, threshold=threshold)
+
+    def suggest(self, prefix: str, limit: int) -> List[Book]:
+        """
+        Service method which completes the prefix by titles and authors of books
+        :param prefix: start of any word of title or author, it may be written by latin letters
+        :param limit: maximum amount of found books
+        :return: found books in alphabetical order of their completions
+        """
+        with self._uow as uow:
+            return uow.books.suggest(prefix, limit=limit)
+
+    def query(self, query: BooksQuery) -> List[Book]:
+        """
+        Service method which finds books by year range, status, author and start of the title
+        :param query: predicates of books, their order and maximum amount of found books
+        :return: found books in order of the query
+        """
+        with self._uow as uow:
+            return uow.books.query(query)
+
     def get_all(self) -> List[Book]:
         with self._uow as uow:
             return uow.books.list()
 
-    def update(self, book: Book) -> Book:
+    def get_page(self, cursor: Optional[str], page_size: int) -> Page[Book]:
+        """
+        Service method which reads one page of books in order of their oids
+        :param cursor: cursor of the page from the previous page, None reads the first page
+        :param page_size: maximum amount of books of the page
+        :return: books of the page and cursor of the next page, which is None for the last page
+        """
+        after: Optional[str] = decode_cursor(cursor) if cursor is not None else None
+
+        # One book more tells whether there is the next page
         with self._uow as uow:
-            existing_book = uow.books.get(oid=book.oid)
+            books: List[Book] = uow.books.list_page(after, limit=page_size + 1)
 
-            if not existing_book:
-                raise BookNotFoundException(book.oid)
+        if len(books) <= page_size:
+            return Page(items=books)
 
-            updated_book = uow.books.update(oid=existing_book.oid, model=book)
-            uow.commit()
-            return updated_book
+        return Page(items=books[:page_size], next_cursor=encode_cursor(books[page_size - 1].oid))
+
+    def stream(self, page_size: int) -> Iterator[Book]:
+        """
+        Service method which lazily reads all books page by page in order of their oids.
+        Every page is read by its own unit of work, so the storage is not held between pages,
+        and only one page of books is in memory at once
+        :param page_size: amount of books, which are read at once
+        :return: iterator over all books
+        """
+        after: Optional[str] = None
+
+        while True:
+            with self._uow as uow:
+                books: List[Book] = uow.books.list_page(after, limit=page_size)
+
+            yield from books
+
+            if len(books) < page_size:
+                return
+            after = books[-1].oid
+
+    def update(
+            self,
+            book: Book,
+            expected_version: Optional[int] = None,
+            retries: int = settings.version_conflict_retries,
+    ) -> Book:
+        """
+        Service method which updates a book using compare-and-swap on its version
+        :param book: new state of the book
+        :param expected_version: version of the book, which was read by the client. If the stored book has another
+        version, BookVersionConflictException is raised. If it's not set, the latest version is overwritten,
+        and in case of concurrent change update is retried
+        :param retries: how many times update without expected version is retried
+        :return: updated book with increased version
+        """
+        attempt: int = 0
+
+        while True:
+            try:
+                with self._uow as uow:
+                    existing_book = uow.books.get(oid=book.oid)
+
+                    if not existing_book:
+                        raise BookNotFoundException(book.oid)
+
+                    version: int = existing_book.version if expected_version is None else expected_version
+                    updated_book = uow.books.update(oid=existing_book.oid, model=replace(book, version=version))
+                    uow.commit()
+                    return updated_book
+
+            except BookVersionConflictException:
+                if expected_version is not None or attempt >= retries:
+                    raise
+
+                attempt += 1
 
-    def delete(self, oid: str) -> None:
+    def delete(self, oid: str, version: Optional[int] = None) -> None:
         with self._uow as uow:
             existing_book = uow.books.get(oid)
             if not existing_book:
                 raise BookNotFoundException(oid)
-            uow.books.delete(oid)
+            uow.books.delete(oid, version=version)
             uow.commit()
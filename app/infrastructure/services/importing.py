@@ -0,0 +1,212 @@
+import csv
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+)
+from dataclasses import dataclass
+from itertools import batched
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from app.domain.entities.books import Book
+from app.exceptions import ApplicationException
+from app.infrastructure.exceptions import (
+    ImportFileException,
+    UnknownImportFormatException,
+)
+from app.infrastructure.services.books import BooksService
+from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.settings.config import settings
+
+
+# Application may run threads, for example, compaction of the journal, so workers are not forked from it
+START_METHOD: Final[str] = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+Record = Dict[str, Any]
+# Number of the line in the file with the row: dictionary of CSV columns or not parsed line of JSONL
+Row = Tuple[int, Union[Record, str]]
+
+
+@dataclass(frozen=True)
+class RejectedRow:
+    line: int
+    reason: str
+
+
+@dataclass(frozen=True)
+class ImportReport:
+    """
+    Result of the import: amount of read rows, imported books and rows, which were rejected with their reasons.
+    """
+
+    read: int
+    imported: int
+    rejected: List[RejectedRow]
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """
+        :return: read rows per second
+        """
+        return self.read / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def read_rows(path: Path) -> Iterator[Row]:
+    """
+    Opens CSV file with header or JSONL file, whose rows are read one by one, so the file is never in memory at once.
+    Lines of JSONL are parsed by validate_rows in worker processes.
+    Format and file are checked here, before rows are read, so the import fails before workers are started.
+    """
+    try:
+        if path.suffix == ".csv":
+            return _read_csv(path, open(path, newline="", encoding="utf-8-sig"))
+        if path.suffix == ".jsonl":
+            return _read_jsonl(path, open(path, encoding="utf-8"))
+    except OSError as e:
+        raise ImportFileException(path.name, e.strerror or str(e)) from e
+
+    raise UnknownImportFormatException(path.name)
+
+
+def _read_csv(path: Path, f: TextIO) -> Iterator[Row]:
+    with f:
+        reader = csv.DictReader(f)
+        try:
+            for row in reader:
+                yield reader.line_num, row
+        except (OSError, UnicodeError) as e:
+            raise ImportFileException(path.name, str(e)) from e
+
+
+def _read_jsonl(path: Path, f: TextIO) -> Iterator[Row]:
+    with f:
+        try:
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield number, line
+        except (OSError, UnicodeError) as e:
+            raise ImportFileException(path.name, str(e)) from e
+
+
+def validate_rows(rows: List[Row]) -> Tuple[List[Tuple[int, Record]], List[RejectedRow]]:
+    """
+    Validates title, author, year and status of every row like creation of a book does.
+    It runs in worker processes, so books are returned as records, which are restored without validation.
+    :return: records of valid books with their lines and rejected rows
+    """
+    valid: List[Tuple[int, Record]] = []
+    rejected: List[RejectedRow] = []
+
+    for line, row in rows:
+        try:
+            record: Any = json.loads(row) if isinstance(row, str) else row
+            if not isinstance(record, dict):
+                raise ValueError("Row must be an object with title, author and year")
+
+            fields: Record = {"title": record["title"], "author": record["author"], "year": int(record["year"])}
+            if record.get("status"):
+                fields["status"] = record["status"]
+
+            valid.append((line, Book(**fields).to_dict()))
+        except ApplicationException as e:
+            rejected.append(RejectedRow(line=line, reason=e.message))
+        except KeyError as e:
+            rejected.append(RejectedRow(line=line, reason=f"Missing field {e}"))
+        except (TypeError, ValueError) as e:
+            rejected.append(RejectedRow(line=line, reason=str(e)))
+
+    return valid, rejected
+
+
+class BooksImporter:
+    """
+    Imports books from CSV or JSONL file. Rows are read by chunks, which are validated in a process pool,
+    because validation of titles and authors by regular expressions takes the most of CPU time.
+    Only a few chunks are validated at once, so memory does not grow with the file.
+
+    Valid books are added by batches, one commit per batch. Books with titles, which are already in the library
+    or earlier in the file, are rejected as duplicates.
+    """
+
+    def __init__(
+            self,
+            uow: BooksUnitOfWork,
+            chunk_size: int = settings.import_chunk_size,
+            batch_size: int = settings.import_batch_size,
+            workers: Optional[int] = settings.import_workers,
+    ) -> None:
+        self._books_service: BooksService = BooksService(uow=uow)
+        self._chunk_size = chunk_size
+        self._batch_size = batch_size
+        self._workers: int = workers or os.cpu_count() or 1
+
+    def run(self, path: Path) -> ImportReport:
+        started_at: float = time.perf_counter()
+        read: int = 0
+        imported: int = 0
+        rejected: List[RejectedRow] = []
+        batch: List[Tuple[int, Record]] = []
+        pending: Deque[Future[Tuple[List[Tuple[int, Record]], List[RejectedRow]]]] = deque()
+
+        rows: Iterator[Row] = read_rows(path)
+        context: BaseContext = multiprocessing.get_context(START_METHOD)
+
+        with ProcessPoolExecutor(max_workers=self._workers, mp_context=context) as executor:
+            chunks: Iterator[Tuple[Row, ...]] = batched(rows, self._chunk_size)
+
+            while True:
+                # Pool gets the next chunks, while results of the first one are written
+                while len(pending) < 2 * self._workers and (chunk := next(chunks, None)) is not None:
+                    read += len(chunk)
+                    pending.append(executor.submit(validate_rows, list(chunk)))
+
+                if not pending:
+                    break
+
+                valid, invalid = pending.popleft().result()
+                rejected.extend(invalid)
+                batch.extend(valid)
+
+                if batch and (len(batch) >= self._batch_size or not pending):
+                    imported += self._write(batch, rejected)
+                    batch = []
+
+        return ImportReport(
+            read=read,
+            imported=imported,
+            rejected=sorted(rejected, key=lambda row: row.line),
+            elapsed=time.perf_counter() - started_at,
+        )
+
+    def _write(self, batch: List[Tuple[int, Record]], rejected: List[RejectedRow]) -> int:
+        """
+        Adds books of the batch and rejects duplicates.
+        :return: amount of added books
+        """
+        books: List[Book] = [Book.restore(record) for _, record in batch]
+        added: Set[str] = {book.oid for book in self._books_service.add_many(books)}
+
+        for (line, _), book in zip(batch, books, strict=True):
+            if book.oid not in added:
+                rejected.append(RejectedRow(line=line, reason=f"Book {book.title.as_generic_type()} already exists"))
+
+        return len(added)
@@ -0,0 +1,40 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import (
+    Generic,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from app.infrastructure.exceptions import InvalidCursorException
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """
+    One page of results ordered by a stable sort key.
+    Cursor of the next page is None, when this page is the last one.
+    """
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(key: str) -> str:
+    """
+    Cursor is the sort key of the last item of the page, which is opaque for clients,
+    so the next page starts right after that item, even if items before it have been added or deleted.
+    """
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        return base64.b64decode(cursor.encode(), altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorException(cursor) from e
@@ -1,14 +1,21 @@
+import asyncio
 from abc import (
     ABC,
     abstractmethod,
 )
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
 from typing import (
     Any,
+    Callable,
+    Deque,
     Dict,
     Generator,
-    List,
+    Optional,
     Self,
     Tuple,
+    TypeVar,
 )
 
 from app.logic.events.base import AbstractEvent
@@ -20,7 +27,7 @@ class AbstractUnitOfWork(ABC):
     """
 
     def __init__(self) -> None:
-        self._events: List[AbstractEvent] = []
+        self._events: Deque[AbstractEvent] = deque()
 
     def __enter__(self) -> Self:
         return self
@@ -46,4 +53,48 @@ class AbstractUnitOfWork(ABC):
         """
 
         while self._events:
-            yield self._events.pop(0)
+            yield self._events.popleft()
+
+
+T = TypeVar("T")
+
+
+class AsyncUnitOfWork:
+    """
+    Unit of work for asyncio applications, which wraps a synchronous unit of work and runs its blocking operations,
+    such as reading and writing of files, in a thread pool, so a slow disk does not block the event loop.
+
+    Operation, which enters the synchronous unit of work, must also exit it inside the same call of 'run',
+    because connections of some storages, for example SQLite, may be used only by the thread, which opened them.
+    Events are kept by the synchronous unit of work, so operations, which run in threads, add them as usual.
+    """
+
+    def __init__(self, uow: AbstractUnitOfWork, executor: Optional[Executor] = None) -> None:
+        """
+        :param uow: synchronous unit of work
+        :param executor: thread pool for blocking operations, None uses the default executor of the event loop
+        """
+        self._uow = uow
+        self._executor = executor
+
+    @property
+    def sync(self) -> AbstractUnitOfWork:
+        return self._uow
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        """
+        Runs the blocking function in the thread pool and waits for its result without blocking the event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(function, *args))
+
+    async def commit(self) -> None:
+        await self.run(self._uow.commit)
+
+    async def rollback(self) -> None:
+        await self.run(self._uow.rollback)
+
+    def add_event(self, event: AbstractEvent) -> None:
+        self._uow.add_event(event)
+
+    def get_events(self) -> Generator[AbstractEvent, None, None]:
+        return self._uow.get_events()
@@ -1,7 +1,12 @@
 from abc import ABC
+from concurrent.futures import Executor
+from typing import Optional
 
 from app.infrastructure.repositories.books.base import BooksRepository
-from app.infrastructure.uow.base import AbstractUnitOfWork
+from app.infrastructure.uow.base import (
+    AbstractUnitOfWork,
+    AsyncUnitOfWork,
+)
 
 
 class BooksUnitOfWork(AbstractUnitOfWork, ABC):
@@ -12,3 +17,17 @@ class BooksUnitOfWork(AbstractUnitOfWork, ABC):
     """
 
     books: BooksRepository
+
+
+class AsyncBooksUnitOfWork(AsyncUnitOfWork):
+    """
+    Books unit of work for asyncio applications, its storage operations run in a thread pool.
+    """
+
+    def __init__(self, uow: BooksUnitOfWork, executor: Optional[Executor] = None) -> None:
+        super().__init__(uow=uow, executor=executor)
+        self._uow: BooksUnitOfWork = uow
+
+    @property
+    def sync(self) -> BooksUnitOfWork:
+        return self._uow
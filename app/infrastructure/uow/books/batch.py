@@ -0,0 +1,43 @@
+from typing import (
+    Any,
+    Dict,
+    Self,
+    Tuple,
+    override,
+)
+
+from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.logic.events.base import AbstractEvent
+
+
+class BatchBooksUnitOfWork(BooksUnitOfWork):
+    """
+    Unit of work of one command of a batch. The batch enters its unit of work once, and commands share its
+    transaction: entering and exiting do nothing, and commits are deferred till the batch commits.
+    Events of commands are added to the unit of work of the batch, so the message bus handles them.
+    """
+
+    def __init__(self, uow: BooksUnitOfWork) -> None:
+        super().__init__()
+        self._uow = uow
+
+    @override
+    def __enter__(self) -> Self:
+        self.books = self._uow.books
+        return self
+
+    @override
+    def __exit__(self, *args: Tuple[Any, ...], **kwargs: Dict[str, Any]) -> None:
+        pass
+
+    @override
+    def commit(self) -> None:
+        pass
+
+    @override
+    def rollback(self) -> None:
+        pass
+
+    @override
+    def add_event(self, event: AbstractEvent) -> None:
+        self._uow.add_event(event)
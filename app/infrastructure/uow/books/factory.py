@@ -0,0 +1,40 @@
+from typing import (
+    Callable,
+    Dict,
+    Final,
+)
+
+from app.infrastructure.exceptions import UnknownDatabaseBackendException
+from app.infrastructure.uow.books.base import (
+    AsyncBooksUnitOfWork,
+    BooksUnitOfWork,
+)
+from app.infrastructure.uow.books.journal import JournalBooksUnitOfWork
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.books.sqlite import SqliteBooksUnitOfWork
+from app.settings.config import settings
+
+
+BOOKS_UNITS_OF_WORK: Final[Dict[str, Callable[[], BooksUnitOfWork]]] = {
+    "json": JsonBooksUnitOfWork,
+    "journal": JournalBooksUnitOfWork,
+    "sqlite": SqliteBooksUnitOfWork,
+}
+
+
+def get_books_unit_of_work(backend: str = settings.database_backend) -> BooksUnitOfWork:
+    """
+    Creates books unit of work for the storage, which was selected in settings.
+    If you want to add a new storage, register its unit of work in BOOKS_UNITS_OF_WORK.
+    """
+    try:
+        return BOOKS_UNITS_OF_WORK[backend]()
+    except KeyError as e:
+        raise UnknownDatabaseBackendException(backend) from e
+
+
+def get_async_books_unit_of_work(backend: str = settings.database_backend) -> AsyncBooksUnitOfWork:
+    """
+    Creates books unit of work for asyncio applications, its storage is selected like in get_books_unit_of_work.
+    """
+    return AsyncBooksUnitOfWork(uow=get_books_unit_of_work(backend))
@@ -0,0 +1,392 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    override,
+    Self,
+    Tuple,
+)
+
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import (
+    BookVersionConflictException,
+    LockTimeoutException,
+)
+from app.infrastructure.repositories.books.base import BooksRepository
+from app.infrastructure.repositories.books.indexes import BooksCatalog
+from app.infrastructure.repositories.books.jsonr import JsonBooksRepository
+from app.infrastructure.repositories.identity_map import IdentityMap
+from app.infrastructure.uow.base import AbstractUnitOfWork
+from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.infrastructure.uow.cache import (
+    catalog_cache,
+    CatalogCache,
+    FileFingerprint,
+)
+from app.infrastructure.uow.durability import (
+    default_group_committer,
+    GroupCommitter,
+    write_atomically,
+)
+from app.infrastructure.uow.locks import (
+    FileLock,
+    lock_for,
+)
+from app.settings.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JournalState:
+    """
+    Catalog rebuilt from snapshot and journal tail. 'seq' is the sequence number of the last applied record.
+    """
+
+    catalog: BooksCatalog
+    seq: int
+
+
+class Journal:
+    """
+    Append-only storage of the catalog on disk. It consists of two files:
+
+    - snapshot: the whole catalog as of some record with sequence number 'seq';
+    - journal: one json line per add/update/delete, every record has its own sequence number.
+
+    State is rebuilt from the snapshot plus records, which are newer than the snapshot.
+    When journal becomes too big, the current state is written as a new snapshot in background
+    and the journal is truncated to records which are not in the snapshot yet.
+
+    Files are shared between processes through the lock: state is loaded under shared lock,
+    appends and compaction take exclusive lock, so records of different processes never interleave.
+    """
+
+    def __init__(
+            self,
+            journal_path: Path,
+            snapshot_path: Path,
+            compaction_threshold: int,
+            group_committer: Optional[GroupCommitter] = None,
+            file_lock: Optional[FileLock] = None,
+    ) -> None:
+        self._journal_path = journal_path
+        self._snapshot_path = snapshot_path
+        self._compaction_threshold = compaction_threshold
+        self._group_committer = group_committer
+        self._file_lock: FileLock = file_lock if file_lock is not None else lock_for(journal_path)
+        self._lock: threading.RLock = threading.RLock()
+        self._compaction: Optional[threading.Thread] = None
+        self._fingerprint: Optional[FileFingerprint] = None
+        self.last_seq: Optional[int] = None
+
+    @property
+    def path(self) -> Path:
+        return self._journal_path
+
+    def load(self) -> JournalState:
+        """
+        Rebuilds catalog from the latest snapshot and the journal tail.
+        Broken last line (for example, process died in the middle of append) is ignored.
+        """
+        with self._lock, self._file_lock.shared():
+            return self._load()
+
+    def _load(self) -> JournalState:
+        """
+        Same as 'load', but caller must hold the file lock.
+        """
+        with self._lock:
+            books: Dict[str, Book] = {}
+            seq: int = 0
+
+            if self._snapshot_path.is_file():
+                with open(self._snapshot_path, "r", encoding="utf-8") as f:
+                    snapshot: Dict[str, Any] = json.load(f)
+                seq = snapshot["seq"]
+                books = {book.oid: book for book in (Book(**item) for item in snapshot["books"])}
+
+            for record in self._read_records(repair=True):
+                if record["seq"] <= seq:
+                    continue
+
+                if record["op"] == "delete":
+                    books.pop(record["oid"], None)
+                else:
+                    books[record["oid"]] = Book(**record["book"])
+
+                seq = record["seq"]
+
+            self.last_seq = seq
+            self._fingerprint = FileFingerprint.of(self._journal_path)
+            return JournalState(catalog=BooksCatalog.build(books.values()), seq=seq)
+
+    def append(
+            self,
+            records: Iterable[Dict[str, Any]],
+            base_seq: Optional[int] = None,
+            check: Optional[Callable[[BooksCatalog], None]] = None,
+    ) -> Tuple[int, int]:
+        """
+        Appends records to the end of the journal with one write call. Records are fsynced right away
+        or, if there is group committer, together with other commits within its window.
+        :param base_seq: sequence number of the state, which records are based on
+        :param check: called with the latest catalog before append, if journal has got records after 'base_seq'
+        :return: sequence number of the last record before append and sequence number of the last appended record
+        """
+        with self._lock, self._file_lock.exclusive():
+            state: Optional[JournalState] = None
+            if self.last_seq is None or self._fingerprint != FileFingerprint.of(self._journal_path):
+                state = self._load()
+
+            if check is not None and self.last_seq != base_seq:
+                check((state if state is not None else self._load()).catalog)
+
+            previous_seq: int = self.last_seq  # type: ignore[assignment]
+            seq: int = previous_seq
+            lines: List[str] = []
+
+            for record in records:
+                seq += 1
+                lines.append(json.dumps({"seq": seq, **record}, ensure_ascii=False))
+
+            with open(self._journal_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                if self._group_committer is None:
+                    os.fsync(f.fileno())
+
+            if self._group_committer is not None:
+                self._group_committer.sync(self._journal_path)
+
+            self.last_seq = seq
+            self._fingerprint = FileFingerprint.of(self._journal_path)
+            return previous_seq, seq
+
+    def needs_compaction(self) -> bool:
+        try:
+            return os.path.getsize(self._journal_path) > self._compaction_threshold
+        except OSError:
+            return False
+
+    def compact_in_background(self, books: Tuple[Book, ...], seq: int, cache: CatalogCache) -> None:
+        """
+        Starts compaction thread, if there is no running one for this journal.
+        """
+        with self._lock:
+            if self._compaction is not None and self._compaction.is_alive():
+                return
+
+            self._compaction = threading.Thread(
+                target=self.compact,
+                args=(books, seq, cache),
+                name=f"journal-compaction-{self._journal_path.name}",
+                daemon=True,
+            )
+            self._compaction.start()
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        compaction: Optional[threading.Thread] = self._compaction
+        if compaction is not None:
+            compaction.join(timeout)
+
+    def compact(self, books: Tuple[Book, ...], seq: int, cache: CatalogCache) -> None:
+        """
+        Writes books as of record 'seq' as a new snapshot and drops journal records, which are already in it.
+        Snapshot is replaced atomically before journal is truncated, so at any moment the pair of files on disk
+        describes the same catalog.
+        """
+        try:
+            # Order of locks is the same as in 'append': thread lock first, then file lock
+            with self._lock, self._file_lock.exclusive():
+                if self._snapshot_seq() >= seq:
+                    # Another process has already written newer snapshot
+                    return
+
+                write_atomically(
+                    self._snapshot_path,
+                    lambda f: json.dump({"seq": seq, "books": list(Book.iter_dicts(books))}, f, ensure_ascii=False),
+                )
+
+                cached_state: Optional[JournalState] = cache.get(self._journal_path)
+                tail: List[str] = [
+                    json.dumps(record, ensure_ascii=False) + "\n"
+                    for record in self._read_records()
+                    if record["seq"] > seq
+                ]
+                write_atomically(self._journal_path, lambda f: f.writelines(tail))
+                self._fingerprint = FileFingerprint.of(self._journal_path)
+
+                if cached_state is not None:
+                    cache.put(self._journal_path, cached_state)
+
+            logger.debug("Journal %s compacted up to record %s", self._journal_path, seq)
+
+        except (OSError, LockTimeoutException) as e:
+            logger.error("Failed to compact journal %s: %s", self._journal_path, e)
+
+    def _snapshot_seq(self) -> int:
+        """
+        :return: sequence number of the last record in the snapshot on disk
+        """
+        if not self._snapshot_path.is_file():
+            return 0
+
+        with open(self._snapshot_path, "r", encoding="utf-8") as f:
+            return json.load(f)["seq"]
+
+    def _read_records(self, repair: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Reads journal records one by one. Broken line means that process died in the middle of append,
+        so everything after it is ignored and, if 'repair' is set, cut off, so next appends start from a clean line.
+        """
+        if not self._journal_path.is_file():
+            return
+
+        valid_size: int = 0
+        with open(self._journal_path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("Record is not finished")
+                    record: Dict[str, Any] = json.loads(line)
+                except ValueError:
+                    logger.warning("Skipping broken record in journal %s", self._journal_path)
+                    break
+                valid_size += len(line)
+                yield record
+            else:
+                return
+
+        if repair:
+            os.truncate(self._journal_path, valid_size)
+
+
+_journals: Dict[Path, Journal] = {}
+_journals_lock: threading.Lock = threading.Lock()
+
+
+def get_journal(
+        journal_path: Path,
+        snapshot_path: Path,
+        compaction_threshold: int,
+        group_committer: Optional[GroupCommitter] = None,
+) -> Journal:
+    """
+    Journal objects are shared in the process, so all units of work for the same files use the same lock.
+    """
+    with _journals_lock:
+        if journal_path not in _journals:
+            _journals[journal_path] = Journal(journal_path, snapshot_path, compaction_threshold, group_committer)
+        return _journals[journal_path]
+
+
+class JournalAbstractUnitOfWork(AbstractUnitOfWork):
+    """
+    Unit of work interface for journal storage. Commit appends only books, which were touched in this unit of work,
+    so its cost depends on the size of the change, not on the size of the catalog.
+    Versions of changed books are checked against the latest state only if journal has got new records.
+    """
+
+    @override
+    def __init__(
+            self,
+            journal_path: os.PathLike[str] | str = settings.path_to_database_journal_file,
+            snapshot_path: os.PathLike[str] | str = settings.path_to_database_snapshot_file,
+            compaction_threshold: int = settings.journal_compaction_threshold,
+            cache: CatalogCache = catalog_cache,
+            group_committer: Optional[GroupCommitter] = default_group_committer,
+    ) -> None:
+        super().__init__()
+
+        self._journal: Journal = get_journal(
+            Path(journal_path).resolve(), Path(snapshot_path).resolve(), compaction_threshold, group_committer
+        )
+        self._cache = cache
+        self._state: JournalState = JournalState(catalog=BooksCatalog(), seq=0)
+        self._identity_map: IdentityMap[Book] = IdentityMap()
+
+    @override
+    def __enter__(self) -> Self:
+        self._state = self.__load()
+        self._identity_map = IdentityMap()
+
+        return super().__enter__()
+
+    @override
+    def __exit__(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        if self._identity_map:
+            self.commit()
+        super().__exit__(*args, **kwargs)
+
+    @override
+    def commit(self) -> None:
+        if not self._identity_map:
+            return
+
+        records: List[Dict[str, Any]] = [{"op": "delete", "oid": oid} for oid in self._identity_map.deleted]
+        records.extend(
+            {"op": "update" if book.oid in self._identity_map.dirty else "add", "oid": book.oid, "book": book.to_dict()}
+            for book in self._identity_map.changed()
+        )
+
+        try:
+            previous_seq, seq = self._journal.append(
+                records, base_seq=self._state.seq, check=lambda catalog: catalog.check_versions(self._identity_map)
+            )
+        except BookVersionConflictException:
+            self._identity_map.clear()
+            raise
+
+        if previous_seq != self._state.seq:
+            # Somebody else appended records after we had loaded the catalog, so our view is not the latest one
+            self._identity_map.clear()
+            self._cache.invalidate(self._journal.path)
+            return
+
+        self._state.catalog.apply(self._identity_map)
+        self._identity_map.clear()
+        self._state = JournalState(catalog=self._state.catalog, seq=seq)
+        self._cache.put(self._journal.path, self._state)
+
+        if self._journal.needs_compaction():
+            self._journal.compact_in_background(tuple(self._state.catalog.books.values()), seq, self._cache)
+
+    @override
+    def rollback(self) -> None:
+        self._identity_map.clear()
+
+    def __load(self) -> JournalState:
+        cached: Optional[JournalState] = self._cache.get(self._journal.path)
+
+        if cached is not None:
+            return cached
+
+        state: JournalState = self._journal.load()
+        self._cache.put(self._journal.path, state)
+        return state
+
+
+class JournalBooksUnitOfWork(JournalAbstractUnitOfWork, BooksUnitOfWork):
+    """
+    Implementation of journal book uow.
+    Here you must add only repositories for work
+    """
+
+    def __enter__(self) -> Self:
+        uow = super().__enter__()
+        self.books: BooksRepository = JsonBooksRepository(
+            session=self._state.catalog.books, index=self._state.catalog.index, identity_map=self._identity_map
+        )
+        return uow
@@ -1,67 +1,286 @@
 import json
+import logging
 import os
 from pathlib import Path
 from typing import (
     Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
     List,
+    Optional,
     override,
     Self,
+    Tuple,
 )
 
 from app.domain.entities.books import Book
+from app.domain.values.books import VALIDATORS_VERSION
+from app.infrastructure.exceptions import (
+    BookVersionConflictException,
+    CorruptedStorageException,
+)
 from app.infrastructure.repositories.books.base import BooksRepository
+from app.infrastructure.repositories.books.indexes import BooksCatalog
 from app.infrastructure.repositories.books.jsonr import JsonBooksRepository
+from app.infrastructure.repositories.identity_map import IdentityMap
+from app.infrastructure.serialization.codecs import (
+    default_storage_format,
+    load_records,
+    StorageFormat,
+)
+from app.infrastructure.serialization.integrity import (
+    HashingReader,
+    HashingWriter,
+    meta_path_for,
+    StorageMeta,
+)
 from app.infrastructure.uow.base import AbstractUnitOfWork
 from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.infrastructure.uow.cache import (
+    catalog_cache,
+    CatalogCache,
+)
+from app.infrastructure.uow.durability import (
+    BinaryWriter,
+    default_group_committer,
+    GroupCommitter,
+    write_atomically,
+)
+from app.infrastructure.uow.locks import (
+    FileLock,
+    lock_for,
+)
 from app.settings.config import settings
 
 
+logger = logging.getLogger(__name__)
+
+
 class JsonAbstractUnitOfWork(AbstractUnitOfWork):
     """
     Unit of work interface for Json, from which should be inherited all other units of work.
+
+    Catalog is shared with other units of work through the cache and is never copied. Changes are tracked
+    in the identity map, so commit writes the file only if something has been changed,
+    and rollback forgets only touched books.
+
+    File is replaced atomically: content is written to temporary file, fsynced and renamed over the database.
+    Content is written in the storage format from settings and read in whatever format it has been written.
+    With group committer, commits within its window are written to disk once, and the file stays locked
+    exclusively until it's written.
+
+    Processes share the file through the lock: file is parsed under shared lock and written under exclusive lock.
+    If the file has been changed by another process since it was loaded, commit rereads it under the same
+    exclusive lock and applies changes of this unit of work on top of it, so updates of other processes are not lost.
+    Commit fails with BookVersionConflictException, if some of changed books have been changed by somebody else.
     """
 
     @override
-    def __init__(self, file_path: os.PathLike[str] | str = settings.path_to_database_json_file) -> None:
+    def __init__(
+            self,
+            file_path: os.PathLike[str] | str = settings.path_to_database_json_file,
+            cache: CatalogCache = catalog_cache,
+            group_committer: Optional[GroupCommitter] = default_group_committer,
+            lock: Optional[FileLock] = None,
+            storage_format: StorageFormat = default_storage_format,
+    ) -> None:
         super().__init__()
 
-        self._data: List[Book] = []  # Хранилище объектов
-        self._file_path = Path(file_path)
-        self._backup: List[Book] = []
+        self._file_path = Path(file_path).resolve()
+        self._cache = cache
+        self._group_committer = group_committer
+        self._lock: FileLock = lock if lock is not None else lock_for(self._file_path)
+        self._storage_format = storage_format
+        self._meta_path: Path = meta_path_for(self._file_path)
+        self._catalog: BooksCatalog = BooksCatalog()  # Хранилище объектов
+        self._identity_map: IdentityMap[Book] = IdentityMap()
 
     @override
     def __enter__(self) -> Self:
-        self._data = self.__load()
-        self._backup = self._data.copy()
+        self._catalog = self.__load()
+        self._identity_map = IdentityMap()
 
         return super().__enter__()
 
     @override
     def __exit__(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
-        if self._data != self._backup:
+        if self._identity_map:
             self.commit()
         super().__exit__(*args, **kwargs)
 
     @override
     def commit(self) -> None:
-        with open(self._file_path, "w", encoding="utf-8") as f:
-            json.dump([book.to_dict() for book in self._data], f, ensure_ascii=False, indent=4)
+        if not self._identity_map:
+            return
+
+        if self._group_committer is not None:
+            self.__commit_in_group(self._group_committer)
+            return
+
+        with self._lock.exclusive():
+            self.__reload_if_changed()
+            self.__apply()
+
+            write, checksums = self.__writer()
+            try:
+                write_atomically(self._file_path, write, binary=True)
+            except BaseException:
+                # Catalog in memory is already changed, so it must be read from disk again
+                self._cache.invalidate(self._file_path)
+                raise
+
+            self.__write_meta(checksums[-1])
+            self._cache.put(self._file_path, self._catalog)
+
+    def __commit_in_group(self, group_committer: GroupCommitter) -> None:
+        # Lock is held by the committer until the file is written, so other processes never miss our changes
+        with group_committer.exclusive(self._file_path, self._lock):
+            self.__reload_if_changed()
+            self.__apply()
+
+            # File on disk is replaced later, until then the cache serves the catalog from memory
+            catalog: BooksCatalog = self._catalog
+            self._cache.put(self._file_path, catalog)
+            write, checksums = self.__writer()
+
+            def on_durable() -> None:
+                # Writer of this commit may have been replaced by writer of a later commit within the window
+                if checksums:
+                    self.__write_meta(checksums[-1])
+                self._cache.put(self._file_path, catalog)
+
+            group_committer.replace(self._file_path, write, on_durable=on_durable, binary=True)
+
+    def __reload_if_changed(self) -> None:
+        """
+        Rereads the file, if it has been changed by another process since it was loaded. Caller must hold
+        the exclusive lock.
+        """
+        if self._cache.get(self._file_path) is not self._catalog:
+            # Changes of this unit of work are applied to content of the other process
+            self._catalog.replace_with(self.__read())
+
+    def __apply(self) -> None:
+        """
+        Applies changes to the catalog, if books have not been changed by anybody else since they were read.
+        In case of conflict changes of the unit of work are dropped.
+        """
+        try:
+            self._catalog.check_versions(self._identity_map)
+        except BookVersionConflictException:
+            self._identity_map.clear()
+            raise
+
+        self._catalog.apply(self._identity_map)
+        self._identity_map.clear()
+
+    def __writer(self) -> Tuple[BinaryWriter, List[str]]:
+        """
+        :return: writer of the current catalog and list, where writer puts checksum of every written file
+        """
+        books: Tuple[Book, ...] = tuple(self._catalog.books.values())
+        storage_format: StorageFormat = self._storage_format
+        checksums: List[str] = []
+
+        def write(f: BinaryIO) -> None:
+            hashing_writer: HashingWriter = HashingWriter(f)
+            storage_format.dump(hashing_writer, Book.iter_dicts(books))  # type: ignore[arg-type]
+            checksums.append(hashing_writer.hexdigest())
+
+        return write, checksums
+
+    def __write_meta(self, checksum: str) -> None:
+        """
+        Stores checksum of the written file, so the next load can trust its books. Meta is only an optimization:
+        if it's lost or stale, checksum does not match and books are validated as usual.
+        """
+        meta: StorageMeta = StorageMeta(checksum=checksum, validators_version=VALIDATORS_VERSION)
+        try:
+            write_atomically(self._meta_path, lambda f: json.dump(meta.to_dict(), f), durable=False)
+        except OSError as e:
+            logger.warning("Failed to write storage meta %s: %s", self._meta_path, e)
 
     @override
     def rollback(self) -> None:
-        self._data = self._backup.copy()
+        self._identity_map.clear()
 
-    def __load(self) -> List[Book]:
+    def stream_books(self) -> Iterator[Book]:
+        """
+        Reads committed books from the file one by one without building and caching the catalog,
+        so export of a huge file needs memory only for one book. File is held under shared lock until
+        the iterator is exhausted or closed.
+        """
+        if not self._file_path.is_file():
+            return
+
+        with self._lock.shared(), open(self._file_path, "rb") as f:
+            for item in load_records(f):
+                yield Book(**item)
+
+    def __load(self) -> BooksCatalog:
         """
         Приватный метод для загрузки данных из файла и преобразования их в объекты Book.
+        Файл парсится только в том случае, если он изменился с момента последнего чтения или записи,
+        в остальных случаях берется каталог из кэша процесса.
         """
+        cached: Optional[BooksCatalog] = self._cache.get(self._file_path)
+
+        if cached is not None:
+            return cached
+
+        with self._lock.shared():
+            return self.__read()
+
+    def __read(self) -> BooksCatalog:
+        """
+        Parses the file and puts the catalog to the cache. Caller must hold the lock.
+        Broken file raises CorruptedStorageException, so units of work never start over it.
+
+        If checksum of the file and validators version match the meta, which was written together with the file,
+        books are restored without validation. Otherwise, they are validated and the meta is written,
+        so the next load is fast.
+        """
+        catalog: BooksCatalog = BooksCatalog()
+
         if self._file_path.exists() and self._file_path.is_file():
-            with open(self._file_path, "r", encoding="utf-8") as f:
-                try:
-                    raw_data = json.load(f)
-                    return [Book(**item) for item in raw_data]
-                except json.JSONDecodeError:
-                    return []
+            meta: Optional[StorageMeta] = StorageMeta.read(self._meta_path)
+            is_trusted: bool = meta is not None and meta.validators_version == VALIDATORS_VERSION
+
+            try:
+                catalog, checksum = self.__parse(trusted=is_trusted)
+
+                if is_trusted and checksum != meta.checksum:  # type: ignore[union-attr]
+                    logger.warning("Checksum of %s does not match, books are validated again", self._file_path)
+                    is_trusted = False
+                    catalog, checksum = self.__parse(trusted=False)
+
+            except ValueError as e:
+                # Empty catalog would be written over all books of the file on the next commit
+                raise CorruptedStorageException(str(self._file_path), str(e)) from e
+
+            if not is_trusted:
+                self.__write_meta(checksum)
+
+        self._cache.put(self._file_path, catalog)
+        return catalog
+
+    def __parse(self, trusted: bool) -> Tuple[BooksCatalog, str]:
+        """
+        Builds the catalog from the file computing checksum of the file on the fly.
+        :param trusted: restore books without validation, checksum must be checked by the caller
+        :return: catalog and checksum of the file
+        """
+        create_book: Callable[[Dict[str, Any]], Book] = Book.restore if trusted else lambda item: Book(**item)
+
+        with open(self._file_path, "rb") as f:
+            hashing_reader: HashingReader = HashingReader(f)  # type: ignore[arg-type]
+            # Books are built one by one, raw text and dicts of the whole file are never held together
+            catalog: BooksCatalog = BooksCatalog.build(
+                create_book(item) for item in load_records(hashing_reader)  # type: ignore[arg-type]
+            )
+            return catalog, hashing_reader.hexdigest()
 
 
 class JsonBooksUnitOfWork(JsonAbstractUnitOfWork, BooksUnitOfWork):
@@ -72,5 +291,7 @@ class JsonBooksUnitOfWork(JsonAbstractUnitOfWork, BooksUnitOfWork):
 
     def __enter__(self) -> Self:
         uow = super().__enter__()
-        self.books: BooksRepository = JsonBooksRepository(session=self._data)
+        self.books: BooksRepository = JsonBooksRepository(
+            session=self._catalog.books, index=self._catalog.index, identity_map=self._identity_map
+        )
         return uow
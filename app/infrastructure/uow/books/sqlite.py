@@ -0,0 +1,165 @@
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Set,
+    override,
+    Self,
+    Tuple,
+)
+
+from app.infrastructure.repositories.books.base import BooksRepository
+from app.infrastructure.repositories.books.sqlite import SqliteBooksRepository
+from app.infrastructure.uow.base import AbstractUnitOfWork
+from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.settings.config import settings
+
+
+BOOKS_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS books (
+    oid TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_books_title ON books (title);
+CREATE INDEX IF NOT EXISTS ix_books_title_author ON books (title, author);
+CREATE INDEX IF NOT EXISTS ix_books_year ON books (year);
+CREATE INDEX IF NOT EXISTS ix_books_status ON books (status);
+CREATE INDEX IF NOT EXISTS ix_books_author ON books (author);
+CREATE TABLE IF NOT EXISTS book_words (
+    word TEXT NOT NULL,
+    oid TEXT NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (word, oid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_book_words_oid ON book_words (oid);
+CREATE TABLE IF NOT EXISTS book_name_words (
+    field TEXT NOT NULL,
+    word TEXT NOT NULL,
+    oid TEXT NOT NULL,
+    PRIMARY KEY (field, word, oid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_book_name_words_oid ON book_name_words (oid);
+CREATE INDEX IF NOT EXISTS ix_book_name_words_word ON book_name_words (word);
+CREATE TABLE IF NOT EXISTS name_word_trigrams (
+    trigram TEXT NOT NULL,
+    word TEXT NOT NULL,
+    PRIMARY KEY (trigram, word)
+) WITHOUT ROWID;
+"""
+
+# Columns, which were added after the first release, so databases created before them must be migrated
+BOOKS_ADDED_COLUMNS: Final[Tuple[Tuple[str, str, str], ...]] = (
+    ("books", "version", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+
+def index_missing_book_words(connection: sqlite3.Connection) -> None:
+    SqliteBooksRepository(session=connection).index_missing_words()
+
+
+def index_missing_book_name_words(connection: sqlite3.Connection) -> None:
+    SqliteBooksRepository(session=connection).index_missing_name_words()
+
+
+# Data migrations, which are run after schema is created, they must do nothing when data is already migrated
+BOOKS_MIGRATIONS: Final[Tuple[Callable[[sqlite3.Connection], None], ...]] = (
+    index_missing_book_words,
+    index_missing_book_name_words,
+)
+
+_initialized_databases: Set[Path] = set()
+_initialization_lock: threading.Lock = threading.Lock()
+
+
+class SqliteAbstractUnitOfWork(AbstractUnitOfWork):
+    """
+    Unit of work interface for sqlite, from which should be inherited all other sqlite units of work.
+    Commit and rollback are real sqlite transactions, database works in WAL mode,
+    so readers are not blocked by the writer.
+    """
+
+    @override
+    def __init__(
+            self,
+            file_path: os.PathLike[str] | str = settings.path_to_database_sqlite_file,
+            schema: str = BOOKS_SCHEMA,
+            added_columns: Tuple[Tuple[str, str, str], ...] = BOOKS_ADDED_COLUMNS,
+            migrations: Tuple[Callable[[sqlite3.Connection], None], ...] = BOOKS_MIGRATIONS,
+    ) -> None:
+        super().__init__()
+        self._file_path = Path(file_path).resolve()
+        self._schema = schema
+        self._added_columns = added_columns
+        self._migrations = migrations
+
+    @override
+    def __enter__(self) -> Self:
+        self._connection: sqlite3.Connection = sqlite3.connect(self._file_path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self.__initialize_database()
+
+        return super().__enter__()
+
+    @override
+    def __exit__(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        super().__exit__(*args, **kwargs)
+        try:
+            # Gathers statistics of indexes, which have been used without them, so sqlite picks the most selective index
+            self._connection.execute("PRAGMA optimize")
+        except sqlite3.OperationalError:
+            # Statistics are only a hint, they are gathered by the next unit of work, if the database is busy now
+            pass
+        finally:
+            self._connection.close()
+
+    @override
+    def commit(self) -> None:
+        self._connection.commit()
+
+    @override
+    def rollback(self) -> None:
+        self._connection.rollback()
+
+    def __initialize_database(self) -> None:
+        """
+        Creates schema, adds missing columns, migrates data and switches database to WAL mode
+        once per process for every database file.
+        """
+        with _initialization_lock:
+            if self._file_path in _initialized_databases:
+                return
+
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.executescript(self._schema)
+
+            for table, column, definition in self._added_columns:
+                columns: Set[str] = {row["name"] for row in self._connection.execute(f"PRAGMA table_info({table})")}
+                if column not in columns:
+                    self._connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+            for migrate in self._migrations:
+                migrate(self._connection)
+
+            self._connection.commit()
+            _initialized_databases.add(self._file_path)
+
+
+class SqliteBooksUnitOfWork(SqliteAbstractUnitOfWork, BooksUnitOfWork):
+    """
+    Implementation of sqlite book uow.
+    Here you must add only repositories for work
+    """
+
+    def __enter__(self) -> Self:
+        uow = super().__enter__()
+        self.books: BooksRepository = SqliteBooksRepository(session=self._connection)
+        return uow
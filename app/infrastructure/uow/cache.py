@@ -0,0 +1,91 @@
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """
+    Cheap identity of a file on disk. If any of these fields changed, someone has rewritten the file
+    and everything we have parsed from it before is stale.
+    """
+
+    inode: int
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, file_path: Path) -> Optional["FileFingerprint"]:
+        try:
+            stat: os.stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        return cls(inode=stat.st_ino, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+@dataclass(frozen=True)
+class CatalogCacheEntry:
+    # None means that file does not exist yet
+    fingerprint: Optional[FileFingerprint]
+    catalog: Any
+
+
+class CatalogCache:
+    """
+    Process-lifetime cache of catalogs which were already parsed from disk.
+    Units of work share it, so the file is parsed only when it was changed by somebody else,
+    in other cases entering unit of work costs one 'stat' call.
+
+    Stored catalogs must be treated as immutable by consumers, otherwise changes,
+    which were not committed, will leak into other units of work.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Path, CatalogCacheEntry] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, file_path: Path) -> Optional[Any]:
+        """
+        Returns cached catalog for the file, if file was not changed since catalog was cached.
+        :param file_path: path to the file, from which catalog was loaded
+        :return: catalog or None if there is no fresh entry for this file
+        """
+        entry: Optional[CatalogCacheEntry] = self._entries.get(file_path)
+
+        if entry is None:
+            return None
+
+        if entry.fingerprint != FileFingerprint.of(file_path):
+            self.invalidate(file_path)
+            return None
+
+        return entry.catalog
+
+    def put(self, file_path: Path, catalog: Any) -> None:
+        """
+        Stores catalog for the file in its current state on disk. Must be called right after reading or writing
+        the file, so fingerprint matches the catalog.
+        """
+        fingerprint: Optional[FileFingerprint] = FileFingerprint.of(file_path)
+
+        with self._lock:
+            self._entries[file_path] = CatalogCacheEntry(fingerprint=fingerprint, catalog=catalog)
+
+    def invalidate(self, file_path: Optional[Path] = None) -> None:
+        """
+        Drops entry for the file, or all entries if file is not provided.
+        """
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(file_path, None)
+
+
+catalog_cache = CatalogCache()
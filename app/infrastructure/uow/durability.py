@@ -0,0 +1,210 @@
+import atexit
+import logging
+import os
+import threading
+from contextlib import (
+    contextmanager,
+    ExitStack,
+)
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from app.infrastructure.uow.locks import FileLock
+from app.settings.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+Writer = Callable[[TextIO], None]
+BinaryWriter = Callable[[BinaryIO], None]
+
+
+def fsync_directory(path: Path) -> None:
+    """
+    Makes rename of the file in this directory durable. Directories can not be opened on Windows, where it's not needed.
+    """
+    if os.name != "posix":
+        return
+
+    fd: int = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_atomically(path: Path, write: Writer | BinaryWriter, durable: bool = True, binary: bool = False) -> None:
+    """
+    Writes the file to temporary file in the same directory and renames it over the target.
+    Crash in the middle of writing never leaves truncated file: readers see either old or new content.
+    :param path: target file
+    :param write: function, which writes content to the opened file
+    :param durable: fsync the file and its directory, so the change survives power loss
+    :param binary: file is opened in binary mode, otherwise in text mode with utf-8 encoding
+    """
+    tmp_path: Path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    try:
+        with open(tmp_path, "wb") if binary else open(tmp_path, "w", encoding="utf-8") as f:
+            write(f)  # type: ignore[arg-type]
+            f.flush()
+            if durable:
+                os.fsync(f.fileno())
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if durable:
+        fsync_directory(path.parent)
+
+
+def fsync_file(path: Path) -> None:
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
+class GroupCommitter:
+    """
+    Group commit: commits, which arrive within the window, share one fsync.
+
+    - replace: file is rewritten atomically. If the same file was committed several times within the window,
+      only the latest content is written, so on disk there is always a complete version of the file.
+    - sync: file was already written by the caller (for example, appended), it only must be fsynced.
+
+    Commit returns immediately, changes become durable at most after 'window' seconds or on 'flush'.
+    Pending changes are flushed on interpreter exit. Content of replaced file is taken from memory of this process,
+    so file, which is shared with other processes, must be changed inside 'exclusive': its lock is held until
+    the file is written, and other processes wait for it instead of reading or overwriting older content.
+    """
+
+    def __init__(self, window: float) -> None:
+        self._window = window
+        self._lock: threading.Lock = threading.Lock()
+        self._io_lock: threading.Lock = threading.Lock()
+        self._pending_writes: Dict[Path, Tuple[Writer | BinaryWriter, bool]] = {}
+        self._pending_syncs: Set[Path] = set()
+        self._callbacks: Dict[Path, List[Callable[[], None]]] = {}
+        self._held_locks: Dict[Path, ExitStack] = {}
+        self._timer: Optional[threading.Timer] = None
+
+        atexit.register(self.flush)
+
+    def replace(
+            self,
+            path: Path,
+            write: Writer | BinaryWriter,
+            on_durable: Optional[Callable[[], None]] = None,
+            binary: bool = False,
+    ) -> None:
+        """
+        Schedules atomic rewrite of the file. Writer must not depend on state, which can be changed later.
+        :param on_durable: called after the file was written and fsynced, while lock of the file is still held
+        :param binary: writer expects file opened in binary mode
+        """
+        with self._lock:
+            self._pending_writes[path] = (write, binary)
+            if on_durable is not None:
+                self._callbacks.setdefault(path, []).append(on_durable)
+            self._schedule()
+
+    @contextmanager
+    def exclusive(self, path: Path, lock: FileLock) -> Iterator[None]:
+        """
+        Takes the lock of the file exclusively and holds it until the rewrite, which is scheduled inside,
+        is written by 'flush'. Commits of this process within the window reuse the held lock,
+        and they are serialized with each other and with 'flush'.
+        """
+        with self._io_lock:
+            if path not in self._held_locks:
+                held: ExitStack = ExitStack()
+                held.enter_context(lock.exclusive())
+                self._held_locks[path] = held
+
+            try:
+                yield
+            finally:
+                with self._lock:
+                    is_pending: bool = path in self._pending_writes
+
+                if not is_pending:
+                    # Nothing has been scheduled, so there is nothing to protect
+                    self._held_locks.pop(path).close()
+
+    def sync(self, path: Path) -> None:
+        """
+        Schedules fsync of the file, which was already written.
+        """
+        with self._lock:
+            self._pending_syncs.add(path)
+            self._schedule()
+
+    def flush(self) -> None:
+        """
+        Writes and fsyncs everything, which is pending, right now.
+        """
+        with self._io_lock:
+            with self._lock:
+                writes, self._pending_writes = self._pending_writes, {}
+                syncs, self._pending_syncs = self._pending_syncs, set()
+                callbacks, self._callbacks = self._callbacks, {}
+                self._timer = None
+
+            directories: Set[Path] = set()
+
+            for path, (write, binary) in writes.items():
+                try:
+                    write_atomically(path, write, durable=True, binary=binary)
+                except OSError as e:
+                    # Lock of the file is still held, so nobody else writes it until the content is written again
+                    logger.error("Group commit failed to write %s: %s", path, e)
+                    self._requeue(path, (write, binary), callbacks.pop(path, []))
+                    continue
+
+                for callback in callbacks.pop(path, []):
+                    callback()
+
+                held: Optional[ExitStack] = self._held_locks.pop(path, None)
+                if held is not None:
+                    held.close()
+
+            for path in syncs - writes.keys():
+                try:
+                    fsync_file(path)
+                    directories.add(path.parent)
+                except OSError as e:
+                    logger.error("Group commit failed to fsync %s: %s", path, e)
+
+            for directory in directories:
+                fsync_directory(directory)
+
+    def _schedule(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self._window, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _requeue(
+            self, path: Path, write: Tuple[Writer | BinaryWriter, bool], callbacks: List[Callable[[], None]]
+    ) -> None:
+        with self._lock:
+            # Newer content, which arrived during flush, is more important than failed one
+            self._pending_writes.setdefault(path, write)
+            self._callbacks.setdefault(path, []).extend(callbacks)
+            self._schedule()
+
+
+default_group_committer: Optional[GroupCommitter] = (
+    GroupCommitter(settings.group_commit_window) if settings.group_commit_window else None
+)
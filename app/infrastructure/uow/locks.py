@@ -0,0 +1,141 @@
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterator,
+)
+
+from app.infrastructure.exceptions import LockTimeoutException
+from app.settings.config import settings
+
+
+try:
+    import fcntl
+except ImportError:  # Windows, where there are no advisory file locks
+    fcntl = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LockMetrics:
+    """
+    Lock contention metrics of the process:
+
+    - acquired: how many times locks were taken;
+    - contended: how many times lock was busy and we had to wait;
+    - timeouts: how many times we gave up waiting;
+    - waited_seconds: total time spent waiting for locks.
+    """
+
+    acquired: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    waited_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, waited_seconds: float, contended: bool, timed_out: bool = False) -> None:
+        with self._lock:
+            self.acquired += not timed_out
+            self.contended += contended
+            self.timeouts += timed_out
+            self.waited_seconds += waited_seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "acquired": self.acquired,
+                "contended": self.contended,
+                "timeouts": self.timeouts,
+                "waited_seconds": self.waited_seconds,
+            }
+
+
+lock_metrics = LockMetrics()
+
+
+class FileLock:
+    """
+    Reader/writer lock between processes built on 'flock' over a separate lock file.
+    Lock file is used instead of the data file, because data files are replaced by rename on commit.
+
+    Shared lock can be held by many readers at the same time, exclusive lock is held by one writer.
+    Every acquisition opens its own file descriptor, so threads of one process also exclude each other.
+    Waiting is bounded: lock is polled with exponential backoff and jitter until timeout expires,
+    after which LockTimeoutException is raised.
+    """
+
+    def __init__(
+            self,
+            path: Path,
+            timeout: float = settings.lock_timeout,
+            metrics: LockMetrics = lock_metrics,
+    ) -> None:
+        self._path = path
+        self._timeout = timeout
+        self._metrics = metrics
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self._locked(shared=True):
+            yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._locked(shared=False):
+            yield
+
+    @contextmanager
+    def _locked(self, shared: bool) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+
+        fd: int = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            self._acquire(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _acquire(self, fd: int, operation: int) -> None:
+        started_at: float = time.monotonic()
+        delay: float = 0.001
+        contended: bool = False
+
+        while True:
+            try:
+                fcntl.flock(fd, operation | fcntl.LOCK_NB)
+                self._metrics.record(time.monotonic() - started_at, contended)
+                return
+            except BlockingIOError:
+                contended = True
+
+            waited: float = time.monotonic() - started_at
+            if waited >= self._timeout:
+                self._metrics.record(waited, contended, timed_out=True)
+                raise LockTimeoutException(str(self._path))
+
+            logger.debug("Lock %s is busy, waiting %.3f seconds", self._path, delay)
+            time.sleep(min(delay * random.uniform(0.5, 1.5), self._timeout - waited))
+            delay = min(delay * 2, 0.1)
+
+
+def lock_for(path: Path) -> FileLock:
+    """
+    Returns lock, which protects the data file.
+    """
+    return FileLock(path.with_name(path.name + ".lock"))
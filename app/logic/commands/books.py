@@ -1,4 +1,9 @@
 from dataclasses import dataclass
+from typing import (
+    Optional,
+    Tuple,
+    Union,
+)
 from uuid import UUID
 
 from app.logic.commands.base import AbstractCommand
@@ -19,6 +24,8 @@ class UpdateBookCommand(AbstractCommand):
     author: str
     year: int
     status: str
+    # Version of the book, which was read by the client. If it's not set, the latest version is overwritten
+    version: Optional[int] = None
 
 
 @dataclass(frozen=True)
@@ -45,3 +52,67 @@ class GetBookByTitleAndAuthorCommand(AbstractCommand):
 @dataclass(frozen=True)
 class GetAllBooksCommand(AbstractCommand):
     pass
+
+
+@dataclass(frozen=True)
+class GetBooksPageCommand(AbstractCommand):
+    cursor: Optional[str] = None
+    page_size: int = 20
+
+
+@dataclass(frozen=True)
+class StreamAllBooksCommand(AbstractCommand):
+    page_size: int = 100
+
+
+@dataclass(frozen=True)
+class SearchBooksCommand(AbstractCommand):
+    query: str
+    limit: int = 20
+
+
+@dataclass(frozen=True)
+class FindBooksBySimilarTitleCommand(AbstractCommand):
+    title: str
+    limit: int = 10
+
+
+@dataclass(frozen=True)
+class FindBooksBySimilarAuthorCommand(AbstractCommand):
+    author: str
+    limit: int = 10
+
+
+@dataclass(frozen=True)
+class SuggestBooksCommand(AbstractCommand):
+    prefix: str
+    limit: int = 10
+
+
+@dataclass(frozen=True)
+class QueryBooksCommand(AbstractCommand):
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    status: Optional[str] = None
+    author: Optional[str] = None
+    title_prefix: Optional[str] = None
+    order_by: Tuple[str, ...] = ()
+    limit: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class BatchCommand(AbstractCommand):
+    """
+    Runs commands in one unit of work and commits once at the end.
+    If 'atomic' is set, the first failed command cancels the whole batch, otherwise errors of failed commands are
+    returned with results of others.
+    """
+
+    commands: Tuple[Union[CreateBookCommand, UpdateBookCommand, DeleteBookCommand], ...]
+    atomic: bool = True
+
+
+@dataclass(frozen=True)
+class ImportBooksCommand(AbstractCommand):
+    # Path to CSV file with header or JSONL file with title, author, year and optional status of books
+    path: str
@@ -32,3 +32,12 @@ class EmptyLibraryException(LogicException):
     @property
     def message(self) -> str:
         return "No books in library"
+
+
+@dataclass(eq=False)
+class UnsupportedBatchCommandException(LogicException):
+    value: str = ""
+
+    @property
+    def message(self) -> str:
+        return f"Command {self.value} can not be run in a batch"
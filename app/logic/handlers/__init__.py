@@ -1,47 +1,93 @@
 from typing import (
+    Any,
     Dict,
     List,
     Type,
-    TypeVar,
 )
 
 from app.logic.commands.base import AbstractCommand
 from app.logic.commands.books import (
+    BatchCommand,
     CreateBookCommand,
     DeleteBookCommand,
+    FindBooksBySimilarAuthorCommand,
+    FindBooksBySimilarTitleCommand,
     GetAllBooksCommand,
     GetBookByIdCommand,
     GetBookByTitleAndAuthorCommand,
     GetBookByTitleCommand,
+    GetBooksPageCommand,
+    ImportBooksCommand,
+    QueryBooksCommand,
+    SearchBooksCommand,
+    StreamAllBooksCommand,
+    SuggestBooksCommand,
     UpdateBookCommand,
 )
 from app.logic.events.base import AbstractEvent
 from app.logic.handlers.base import (
+    AbstractAsyncCommandHandler,
+    AbstractAsyncEventHandler,
     AbstractCommandHandler,
     AbstractEventHandler,
     AbstractHandler,
-    CT,
-    ET,
+)
+from app.logic.handlers.books.async_commands import (
+    AsyncBatchCommandHandler,
+    AsyncCreateBookCommandHandler,
+    AsyncDeleteBookCommandHandler,
+    AsyncGetBookByIdCommandHandler,
+    AsyncStreamAllBooksCommandHandler,
+    AsyncUpdateBookCommandHandler,
 )
 from app.logic.handlers.books.commands import (
+    BatchCommandHandler,
     CreateBookCommandHandler,
     DeleteBookCommandHandler,
+    FindBooksBySimilarAuthorCommandHandler,
+    FindBooksBySimilarTitleCommandHandler,
     GetAllBooksCommandHandler,
     GetBookByIdCommandHandler,
     GetBookByTitleAndAuthorCommandHandler,
     GetBookByTitleCommandHandler,
+    GetBooksPageCommandHandler,
+    ImportBooksCommandHandler,
+    QueryBooksCommandHandler,
+    SearchBooksCommandHandler,
+    StreamAllBooksCommandHandler,
+    SuggestBooksCommandHandler,
     UpdateBookCommandHandler,
 )
 
 
-EVENTS_HANDLERS_FOR_INJECTION: Dict[Type[ET], List[Type[AbstractEventHandler[ET]]]] = {}
+EVENTS_HANDLERS_FOR_INJECTION: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler[Any]]]] = {}
 
-COMMANDS_HANDLERS_FOR_INJECTION: Dict[Type[CT], Type[AbstractCommandHandler[CT]]] = {
+COMMANDS_HANDLERS_FOR_INJECTION: Dict[Type[AbstractCommand], Type[AbstractCommandHandler[Any]]] = {
     CreateBookCommand: CreateBookCommandHandler,
     GetBookByIdCommand: GetBookByIdCommandHandler,
     GetBookByTitleCommand: GetBookByTitleCommandHandler,
     GetBookByTitleAndAuthorCommand: GetBookByTitleAndAuthorCommandHandler,
     GetAllBooksCommand: GetAllBooksCommandHandler,
+    GetBooksPageCommand: GetBooksPageCommandHandler,
+    StreamAllBooksCommand: StreamAllBooksCommandHandler,
     UpdateBookCommand: UpdateBookCommandHandler,
     DeleteBookCommand: DeleteBookCommandHandler,
+    SearchBooksCommand: SearchBooksCommandHandler,
+    FindBooksBySimilarTitleCommand: FindBooksBySimilarTitleCommandHandler,
+    FindBooksBySimilarAuthorCommand: FindBooksBySimilarAuthorCommandHandler,
+    SuggestBooksCommand: SuggestBooksCommandHandler,
+    QueryBooksCommand: QueryBooksCommandHandler,
+    BatchCommand: BatchCommandHandler,
+    ImportBooksCommand: ImportBooksCommandHandler,
+}
+
+ASYNC_EVENTS_HANDLERS_FOR_INJECTION: Dict[Type[AbstractEvent], List[Type[AbstractAsyncEventHandler[Any]]]] = {}
+
+ASYNC_COMMANDS_HANDLERS_FOR_INJECTION: Dict[Type[AbstractCommand], Type[AbstractAsyncCommandHandler[Any]]] = {
+    CreateBookCommand: AsyncCreateBookCommandHandler,
+    GetBookByIdCommand: AsyncGetBookByIdCommandHandler,
+    StreamAllBooksCommand: AsyncStreamAllBooksCommandHandler,
+    UpdateBookCommand: AsyncUpdateBookCommandHandler,
+    DeleteBookCommand: AsyncDeleteBookCommandHandler,
+    BatchCommand: AsyncBatchCommandHandler,
 }
@@ -47,3 +47,25 @@ class AbstractCommandHandler(AbstractHandler, ABC, Generic[CT]):
     @abstractmethod
     def __call__(self, command: CT) -> Any:
         raise NotImplementedError
+
+
+class AbstractAsyncEventHandler(AbstractHandler, ABC, Generic[ET]):
+    """
+    Abstract event handler class for asyncio applications, from which every async event handler should be inherited.
+    Handlers of one event run concurrently.
+    """
+
+    @abstractmethod
+    async def __call__(self, event: ET) -> None:
+        raise NotImplementedError
+
+
+class AbstractAsyncCommandHandler(AbstractHandler, ABC, Generic[CT]):
+    """
+    Abstract command handler class for asyncio applications, from which every async command handler should be
+    inherited.
+    """
+
+    @abstractmethod
+    async def __call__(self, command: CT) -> Any:
+        raise NotImplementedError
@@ -0,0 +1,97 @@
+from abc import ABC
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Optional,
+    Type,
+)
+
+from app.domain.entities.books import Book
+from app.infrastructure.services.books import BooksService
+from app.infrastructure.services.pagination import Page
+from app.logic.commands.books import (
+    BatchCommand,
+    CreateBookCommand,
+    DeleteBookCommand,
+    GetBookByIdCommand,
+    StreamAllBooksCommand,
+    UpdateBookCommand,
+)
+from app.logic.handlers.base import CT
+from app.logic.handlers.books.base import (
+    AsyncBooksCommandHandler,
+    BooksCommandHandler,
+)
+from app.logic.handlers.books.commands import (
+    BatchCommandHandler,
+    CreateBookCommandHandler,
+    DeleteBookCommandHandler,
+    GetBookByIdCommandHandler,
+    UpdateBookCommandHandler,
+)
+
+
+class ThreadedBooksCommandHandler(AsyncBooksCommandHandler[CT], ABC):
+    """
+    Async handler, which runs the synchronous handler of the command in the thread pool of the unit of work,
+    so business rules are written once and the event loop never waits for the storage.
+    """
+
+    handler: ClassVar[Type[BooksCommandHandler[Any]]]
+
+    async def __call__(self, command: CT) -> Any:
+        """
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: result of the synchronous handler
+        """
+        return await self._uow.run(self.handler(uow=self._uow.sync), command)
+
+
+class AsyncBatchCommandHandler(ThreadedBooksCommandHandler[BatchCommand]):
+    handler = BatchCommandHandler
+
+
+class AsyncCreateBookCommandHandler(ThreadedBooksCommandHandler[CreateBookCommand]):
+    handler = CreateBookCommandHandler
+
+
+class AsyncUpdateBookCommandHandler(ThreadedBooksCommandHandler[UpdateBookCommand]):
+    handler = UpdateBookCommandHandler
+
+
+class AsyncDeleteBookCommandHandler(ThreadedBooksCommandHandler[DeleteBookCommand]):
+    handler = DeleteBookCommandHandler
+
+
+class AsyncGetBookByIdCommandHandler(ThreadedBooksCommandHandler[GetBookByIdCommand]):
+    handler = GetBookByIdCommandHandler
+
+
+class AsyncStreamAllBooksCommandHandler(AsyncBooksCommandHandler[StreamAllBooksCommand]):
+    """
+    Handler for asynchronous streaming of all books, this handler must be linked with StreamAllBooksCommand
+    in app/logic/handlers/__init__
+    """
+
+    async def __call__(self, command: StreamAllBooksCommand) -> AsyncIterator[Book]:
+        """
+        Get all books lazily, every page is read in the thread pool, while the result is iterated.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: async iterator over domain entities of all books in order of their oids
+        """
+        return self._stream(page_size=command.page_size)
+
+    async def _stream(self, page_size: int) -> AsyncIterator[Book]:
+        books_service: BooksService = BooksService(uow=self._uow.sync)
+        cursor: Optional[str] = None
+
+        while True:
+            page: Page[Book] = await self._uow.run(books_service.get_page, cursor, page_size)
+
+            for book in page.items:
+                yield book
+
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
@@ -1,7 +1,12 @@
 from abc import ABC
 
-from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.infrastructure.uow.books.base import (
+    AsyncBooksUnitOfWork,
+    BooksUnitOfWork,
+)
 from app.logic.handlers.base import (
+    AbstractAsyncCommandHandler,
+    AbstractAsyncEventHandler,
     AbstractCommandHandler,
     AbstractEventHandler,
     CT,
@@ -25,3 +30,23 @@ class BooksCommandHandler(AbstractCommandHandler[CT], ABC):
 
     def __init__(self, uow: BooksUnitOfWork) -> None:
         self._uow: BooksUnitOfWork = uow
+
+
+class AsyncBooksEventHandler(AbstractAsyncEventHandler[ET], ABC):
+    """
+    Abstract event handler class for asyncio applications, from which every async users event handler
+    should be inherited from.
+    """
+
+    def __init__(self, uow: AsyncBooksUnitOfWork) -> None:
+        self._uow: AsyncBooksUnitOfWork = uow
+
+
+class AsyncBooksCommandHandler(AbstractAsyncCommandHandler[CT], ABC):
+    """
+    Abstract command handler class for asyncio applications, from which every async users command handler
+    should be inherited from.
+    """
+
+    def __init__(self, uow: AsyncBooksUnitOfWork) -> None:
+        self._uow: AsyncBooksUnitOfWork = uow
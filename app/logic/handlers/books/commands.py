@@ -1,20 +1,48 @@
-from typing import List
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+)
 
 from app.domain.entities.books import Book
+from app.exceptions import ApplicationException
+from app.infrastructure.repositories.books.query import BooksQuery
+from app.infrastructure.services.batch import BatchResult
 from app.infrastructure.services.books import BooksService
+from app.infrastructure.services.importing import (
+    BooksImporter,
+    ImportReport,
+)
+from app.infrastructure.services.pagination import Page
+from app.infrastructure.uow.books.batch import BatchBooksUnitOfWork
+from app.logic.commands.base import AbstractCommand
 from app.logic.commands.books import (
+    BatchCommand,
     CreateBookCommand,
     DeleteBookCommand,
+    FindBooksBySimilarAuthorCommand,
+    FindBooksBySimilarTitleCommand,
     GetAllBooksCommand,
     GetBookByIdCommand,
     GetBookByTitleAndAuthorCommand,
     GetBookByTitleCommand,
+    GetBooksPageCommand,
+    ImportBooksCommand,
+    QueryBooksCommand,
+    SearchBooksCommand,
+    StreamAllBooksCommand,
+    SuggestBooksCommand,
     UpdateBookCommand,
 )
 from app.logic.exceptions import (
     BookAlreadyExistsException,
     BookNotExistsException,
     EmptyLibraryException,
+    UnsupportedBatchCommandException,
 )
 from app.logic.handlers.books.base import BooksCommandHandler
 
@@ -55,9 +83,9 @@ class UpdateBookCommandHandler(BooksCommandHandler[UpdateBookCommand]):
         if not books_service.check_existence(oid=command.oid):
             raise BookNotExistsException()
 
-        book: Book = Book(**command.to_dict())
+        book: Book = Book(**command.to_dict(exclude={"version"}))
 
-        return books_service.update(book=book)
+        return books_service.update(book=book, expected_version=command.version)
 
 
 class DeleteBookCommandHandler(BooksCommandHandler[DeleteBookCommand]):
@@ -156,3 +184,208 @@ class GetAllBooksCommandHandler(BooksCommandHandler[GetAllBooksCommand]):
             raise EmptyLibraryException()
 
         return library
+
+
+class GetBooksPageCommandHandler(BooksCommandHandler[GetBooksPageCommand]):
+    """
+    Handler for reading books by pages, this handler must be linked with GetBooksPageCommand
+    in app/logic/handlers/__init__
+    """
+
+    def __call__(self, command: GetBooksPageCommand) -> Page[Book]:
+        """
+        Get one page of books in order of their oids. If there are no books at all, raises EmptyLibraryException.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: books of the page and opaque cursor of the next page, which is None for the last page
+        """
+        books_service: BooksService = BooksService(uow=self._uow)
+
+        page: Page[Book] = books_service.get_page(cursor=command.cursor, page_size=command.page_size)
+
+        if not page.items and command.cursor is None:
+            raise EmptyLibraryException()
+
+        return page
+
+
+class StreamAllBooksCommandHandler(BooksCommandHandler[StreamAllBooksCommand]):
+    """
+    Handler for streaming of all books, this handler must be linked with StreamAllBooksCommand
+    in app/logic/handlers/__init__
+    """
+
+    def __call__(self, command: StreamAllBooksCommand) -> Iterator[Book]:
+        """
+        Get all books lazily, they are read page by page, while the result is iterated.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: iterator over domain entities of all books in order of their oids
+        """
+        books_service: BooksService = BooksService(uow=self._uow)
+
+        return books_service.stream(page_size=command.page_size)
+
+
+class SearchBooksCommandHandler(BooksCommandHandler[SearchBooksCommand]):
+    """
+    Handler for full-text search of books, this handler must be linked with SearchBooksCommand
+    in app/logic/handlers/__init__
+    """
+
+    def __call__(self, command: SearchBooksCommand) -> List[Book]:
+        """
+        Finds books by words of title and author. Words may be in any form and case, 'ё' and 'е' are the same.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: list of domain entities of found books, the most relevant first, it's empty if nothing is found
+        """
+        books_service: BooksService = BooksService(uow=self._uow)
+
+        return books_service.search(query=command.query, limit=command.limit)
+
+
+class FindBooksBySimilarTitleCommandHandler(BooksCommandHandler[FindBooksBySimilarTitleCommand]):
+    """
+    Handler for lookup of books by misspelled title, this handler must be linked with FindBooksBySimilarTitleCommand
+    in app/logic/handlers/__init__
+    """
+
+    def __call__(self, command: FindBooksBySimilarTitleCommand) -> List[Book]:
+        """
+        Finds books, which titles are similar to the title of the command.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: list of domain entities of found books, the most similar first, it's empty if nothing is found
+        """
+        books_service: BooksService = BooksService(uow=self._uow)
+
+        return books_service.find_by_similar_title(title=command.title, limit=command.limit)
+
+
+class FindBooksBySimilarAuthorCommandHandler(BooksCommandHandler[FindBooksBySimilarAuthorCommand]):
+    """
+    Handler for lookup of books by misspelled author, this handler must be linked with FindBooksBySimilarAuthorCommand
+    in app/logic/handlers/__init__
+    """
+
+    def __call__(self, command: FindBooksBySimilarAuthorCommand) -> List[Book]:
+        """
+        Finds books, which authors are similar to the author of the command.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: list of domain entities of found books, the most similar first, it's empty if nothing is found
+        """
+        books_service: BooksService = BooksService(uow=self._uow)
+
+        return books_service.find_by_similar_author(author=command.author, limit=command.limit)
+
+
+class SuggestBooksCommandHandler(BooksCommandHandler[SuggestBooksCommand]):
+    """
+    Handler for autocompletion of titles and authors, this handler must be linked with SuggestBooksCommand
+    in app/logic/handlers/__init__
+    """
+
+    def __call__(self, command: SuggestBooksCommand) -> List[Book]:
+        """
+        Finds books, which title or author has a word starting with the prefix of the command.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: list of domain entities of found books in alphabetical order of completions, it's empty
+        if nothing is found
+        """
+        books_service: BooksService = BooksService(uow=self._uow)
+
+        return books_service.suggest(prefix=command.prefix, limit=command.limit)
+
+
+class QueryBooksCommandHandler(BooksCommandHandler[QueryBooksCommand]):
+    """
+    Handler for filtering and sorting of books, this handler must be linked with QueryBooksCommand
+    in app/logic/handlers/__init__
+    """
+
+    def __call__(self, command: QueryBooksCommand) -> List[Book]:
+        """
+        Finds books by year range, status, author and start of the title, all given predicates must match.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: list of domain entities of found books in order of sort keys of the command, it's empty
+        if nothing is found
+        """
+        books_service: BooksService = BooksService(uow=self._uow)
+
+        return books_service.query(
+            BooksQuery(
+                year_from=command.year_from,
+                year_to=command.year_to,
+                status=command.status,
+                author=command.author,
+                title_prefix=command.title_prefix,
+                order_by=command.order_by,
+                limit=command.limit,
+            )
+        )
+
+
+# Commands, which may be run in a batch, with their handlers
+BATCH_COMMANDS_HANDLERS: Dict[Type[AbstractCommand], Type[BooksCommandHandler[Any]]] = {
+    CreateBookCommand: CreateBookCommandHandler,
+    UpdateBookCommand: UpdateBookCommandHandler,
+    DeleteBookCommand: DeleteBookCommandHandler,
+}
+
+
+class BatchCommandHandler(BooksCommandHandler[BatchCommand]):
+    """
+    Handler for running of many commands in one unit of work, this handler must be linked with BatchCommand
+    in app/logic/handlers/__init__
+    """
+
+    def __call__(self, command: BatchCommand) -> BatchResult[Book]:
+        """
+        Runs commands of the batch by their handlers in one transaction, which is loaded and committed once,
+        so importing of many books does not rewrite the storage for every book.
+        Handlers check commands before they change books, so a failed command leaves no changes in the batch.
+        If the commit fails, for example, because of a concurrent change, the whole batch is cancelled.
+        Unexpected errors, which are not application exceptions, cancel the whole batch even if it's not atomic.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: results of commands in their order and errors of failed ones, if the batch is not atomic
+        """
+        for item in command.commands:
+            if type(item) not in BATCH_COMMANDS_HANDLERS:
+                raise UnsupportedBatchCommandException(type(item).__name__)
+
+        results: List[Optional[Any]] = []
+        errors: Dict[int, ApplicationException] = {}
+
+        with self._uow as uow:
+            item_uow: BatchBooksUnitOfWork = BatchBooksUnitOfWork(uow=uow)
+
+            try:
+                for position, item in enumerate(command.commands):
+                    try:
+                        results.append(BATCH_COMMANDS_HANDLERS[type(item)](uow=item_uow)(item))
+                    except ApplicationException as e:
+                        if command.atomic:
+                            raise
+
+                        results.append(None)
+                        errors[position] = e
+            except Exception:
+                # Some units of work commit pending changes on exit, so changes of the cancelled batch are dropped here
+                uow.rollback()
+                raise
+
+            uow.commit()
+
+        return BatchResult(results=results, errors=errors)
+
+
+class ImportBooksCommandHandler(BooksCommandHandler[ImportBooksCommand]):
+    """
+    Handler for import of books from file, this handler must be linked with ImportBooksCommand
+    in app/logic/handlers/__init__
+    """
+
+    def __call__(self, command: ImportBooksCommand) -> ImportReport:
+        """
+        Imports books from CSV or JSONL file, rows with invalid values or titles of existing books are rejected.
+        :param command: command to execute which must be linked in app/logic/handlers/__init__
+        :return: amounts of read rows and imported books, rejected rows with reasons and throughput
+        """
+        return BooksImporter(uow=self._uow).run(Path(command.path))
@@ -10,8 +10,11 @@ from typing import (
 from app.application.api.books.handlers import (
     create_book,
     delete_book,
+    import_books,
     read_all_books,
     read_book,
+    search_books,
+    suggest_books,
     update_book,
 )
 from app.settings.logger.config import setup_logging
@@ -24,7 +27,10 @@ CHOICES_FOR_ACTION: Final[Tuple[str, ...]] = (
     "3. Find book",
     "4. Show all books",
     "5. Update book",
-    "6. Exit"
+    "6. Search books",
+    "7. Suggest books",
+    "8. Import books",
+    "9. Exit"
 )
 
 ACTIONS: Final[Dict[str, Callable[[], None]]] = {
@@ -33,7 +39,10 @@ ACTIONS: Final[Dict[str, Callable[[], None]]] = {
     "3": read_book,
     "4": read_all_books,
     "5": update_book,
-    "6": exit
+    "6": search_books,
+    "7": suggest_books,
+    "8": import_books,
+    "9": exit
 }
 
 logger = logging.getLogger(__name__)
@@ -48,10 +57,10 @@ def main() -> None:
         for comment in CHOICES_FOR_ACTION:
             print(comment)
 
-        choice = input("Select an action (1-6): ").strip()
+        choice = input("Select an action (1-9): ").strip()
 
         if choice not in ACTIONS:
-            logger.error("Invalid choice! Please select a valid option (1-6).")
+            logger.error("Invalid choice! Please select a valid option (1-9).")
             continue
 
         ACTIONS[choice]()
@@ -1,7 +1,14 @@
 import logging.handlers
+import os
 import pathlib
-from dataclasses import dataclass
-from typing import Final
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Final,
+    Optional,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -14,7 +21,32 @@ class Settings:
     """
     In real cases this class must be pydantic BaseModel which contains all urls to connect database, redis and etc.
     """
+    # Storage of books: "json", "journal" or "sqlite"
+    database_backend: str = field(default_factory=lambda: os.getenv("DATABASE_BACKEND", "json"))
+    # Format of the json backend file: "pretty-json", "json" (minified), "jsonl" or "binary" (MessagePack)
+    storage_format: str = field(default_factory=lambda: os.getenv("STORAGE_FORMAT", "pretty-json"))
+    # Compression of the json backend file: "gzip", "lzma" or nothing
+    storage_compression: Optional[str] = field(default_factory=lambda: os.getenv("STORAGE_COMPRESSION") or None)
     path_to_database_json_file: pathlib.Path = PROJECT_DIR / "resources" / "data" / "database.json"
+    path_to_database_snapshot_file: pathlib.Path = PROJECT_DIR / "resources" / "data" / "database.snapshot.json"
+    path_to_database_journal_file: pathlib.Path = PROJECT_DIR / "resources" / "data" / "database.journal"
+    path_to_database_sqlite_file: pathlib.Path = PROJECT_DIR / "resources" / "data" / "database.sqlite3"
+    # When journal grows bigger than this amount of bytes, it is compacted into snapshot in background
+    journal_compaction_threshold: int = 4 * 1024 * 1024
+    # If set, commits which arrive within this amount of seconds share one fsync, otherwise every commit is fsynced
+    group_commit_window: Optional[float] = None
+    # How many seconds to wait for lock of the database file, which is held by another process
+    lock_timeout: float = 10.0
+    # How many times update without expected version is retried, if the book has been changed concurrently
+    version_conflict_retries: int = 3
+    # Minimum similarity of words of books found by misspelled title or author, from 0 to 1
+    similarity_threshold: float = 0.5
+    # Rows of the imported file are validated by chunks of this size in worker processes
+    import_chunk_size: int = 1000
+    # Validated books are committed by batches of this size, every commit of the json backend rewrites its file
+    import_batch_size: int = 10_000
+    # Amount of processes, which validate imported rows, None uses all CPUs
+    import_workers: Optional[int] = None
 
     def __post_init__(self) -> None:
         self.path_to_database_json_file.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,83 @@
+"""
+Compares storage formats of the json backend: size of the file, dump and load time.
+
+Usage: python -m benchmarks.bench_codecs [amount of books]
+"""
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from app.infrastructure.serialization.codecs import (
+    CODECS,
+    COMPRESSIONS,
+    get_storage_format,
+    load_records,
+)
+
+
+TITLES: Tuple[str, ...] = ("Мастер и Маргарита", "Преступление и наказание", "1984", "Brave New World", "Дюна")
+AUTHORS: Tuple[str, ...] = ("Михаил Булгаков", "Фёдор Достоевский", "George Orwell", "Aldous Huxley", "Frank Herbert")
+
+
+def make_records(amount: int) -> List[Dict[str, Any]]:
+    generator: random.Random = random.Random(42)
+    return [
+        {
+            "oid": str(uuid.UUID(int=generator.getrandbits(128))),
+            "title": f"{generator.choice(TITLES)} {number}",
+            "author": generator.choice(AUTHORS),
+            "year": generator.randint(1800, 2024),
+            "status": generator.choice(("in stock", "issued")),
+            "version": generator.randint(0, 5),
+        }
+        for number in range(amount)
+    ]
+
+
+def measure(
+        records: List[Dict[str, Any]], name: str, compression: Optional[str], directory: Path
+) -> Tuple[int, float, float]:
+    path: Path = directory / f"{name}.{compression or 'raw'}"
+    storage_format = get_storage_format(name, compression)
+
+    started_at: float = time.perf_counter()
+    with open(path, "wb") as f:
+        storage_format.dump(f, records)
+    dump_seconds: float = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    with open(path, "rb") as f:
+        loaded: int = sum(1 for _ in load_records(f))
+    load_seconds: float = time.perf_counter() - started_at
+
+    assert loaded == len(records)
+    return path.stat().st_size, dump_seconds, load_seconds
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    records: List[Dict[str, Any]] = make_records(amount)
+
+    print(f"{amount} books")
+    print(f"{'format':<26}{'size, KiB':>12}{'dump, s':>10}{'load, s':>10}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in CODECS:
+            for compression in (None, *COMPRESSIONS):
+                size, dump_seconds, load_seconds = measure(records, name, compression, Path(directory))
+                label: str = f"{name}+{compression}" if compression else name
+                print(f"{label:<26}{size / 1024:>12.0f}{dump_seconds:>10.3f}{load_seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
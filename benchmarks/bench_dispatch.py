@@ -0,0 +1,94 @@
+"""
+Compares overhead of dispatching one command by Bootstrap, which inspects and creates every handler per command,
+with the long-lived container, which inspects handlers once and creates only the handler of the command.
+Unit of work and the handler do nothing, so only dispatching is measured.
+
+Usage: python -m benchmarks.bench_dispatch [amount of commands]
+"""
+import sys
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Type,
+)
+
+from app.infrastructure.bootstrap import Bootstrap
+from app.infrastructure.container import Container
+from app.infrastructure.uow.base import AbstractUnitOfWork
+from app.logic.commands.base import AbstractCommand
+from app.logic.handlers import (
+    COMMANDS_HANDLERS_FOR_INJECTION,
+    EVENTS_HANDLERS_FOR_INJECTION,
+)
+from app.logic.handlers.base import AbstractCommandHandler
+
+
+REPEATS: int = 5
+
+
+class NoopUnitOfWork(AbstractUnitOfWork):
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class NoopCommand(AbstractCommand):
+    pass
+
+
+class NoopCommandHandler(AbstractCommandHandler[NoopCommand]):
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
+        self._uow = uow
+
+    def __call__(self, command: NoopCommand) -> Any:
+        return None
+
+
+# Handlers of the application are registered too, so Bootstrap creates as many handlers as it does for a request
+COMMANDS_HANDLERS: Dict[Type[Any], Type[Any]] = {**COMMANDS_HANDLERS_FOR_INJECTION, NoopCommand: NoopCommandHandler}
+
+
+def measure(function: Callable[[], None], amount: int, repeats: int = REPEATS) -> float:
+    best: float = float("inf")
+    for _ in range(repeats):
+        started_at: float = time.perf_counter()
+        for _ in range(amount):
+            function()
+        best = min(best, time.perf_counter() - started_at)
+    return best / amount
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    command: NoopCommand = NoopCommand()
+    container: Container = Container(
+        uow_factory=NoopUnitOfWork,
+        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
+        commands_handlers_for_injection=COMMANDS_HANDLERS,
+    )
+
+    def by_bootstrap() -> None:
+        Bootstrap(
+            uow=NoopUnitOfWork(),
+            events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
+            commands_handlers_for_injection=COMMANDS_HANDLERS,
+        ).get_messagebus().handle(command)
+
+    def by_container() -> None:
+        container.get_messagebus().handle(command)
+
+    results: List[float] = [measure(by_bootstrap, amount), measure(by_container, amount)]
+    print(f"{len(COMMANDS_HANDLERS)} registered command handlers, {amount} commands")
+    print(f"bootstrap per command  {results[0] * 1_000_000:>8.1f} us")
+    print(f"container              {results[1] * 1_000_000:>8.1f} us    {results[0] / results[1]:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measures throughput of creating books from raw dictionaries, which is the hot path of loading the catalog,
+and of converting books back into dictionaries, which is the hot path of commit.
+
+Usage: python -m benchmarks.bench_entities [amount of books]
+"""
+import sys
+import time
+from dataclasses import asdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+)
+
+from app.domain.entities import base
+from app.domain.entities.books import Book
+from benchmarks.bench_codecs import make_records
+
+
+def measure(name: str, records: List[Dict[str, Any]], create: Callable[[Dict[str, Any]], Any]) -> None:
+    started_at: float = time.perf_counter()
+    for record in records:
+        create(record)
+    seconds: float = time.perf_counter() - started_at
+
+    print(f"{name:<40}{len(records) / seconds:>12.0f} books/s")
+
+
+def create_resolving_type_hints(record: Dict[str, Any]) -> Book:
+    # Forgets the plan, so type hints are resolved for every book, as it was before plans were cached
+    base._coercion_plans.clear()
+    return Book(**record)
+
+
+def measure_serializing(name: str, books: List[Book], serialize: Callable[[List[Book]], Iterable[Any]]) -> None:
+    started_at: float = time.perf_counter()
+    for _ in serialize(books):
+        pass
+    seconds: float = time.perf_counter() - started_at
+
+    print(f"{name:<40}{len(books) / seconds:>12.0f} books/s")
+
+
+def to_dict_by_asdict(book: Book) -> Dict[str, Any]:
+    # Deep copy of the book with unwrapping of value objects, as it was before serializers were generated
+    data: Dict[str, Any] = asdict(book)
+    for key, value in data.items():
+        if isinstance(value, dict) and "value" in value:
+            data[key] = value["value"]
+    return data
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    records: List[Dict[str, Any]] = make_records(amount)
+
+    measure("Book(**raw), type hints on every book", records, create_resolving_type_hints)
+    measure("Book(**raw), cached coercion plan", records, lambda record: Book(**record))
+    measure("Book.restore(raw), trusted storage", records, Book.restore)
+
+    books: List[Book] = [Book.restore(record) for record in records]
+    measure_serializing("asdict and unwrapping", books, lambda items: map(to_dict_by_asdict, items))
+    measure_serializing("book.to_dict()", books, lambda items: (book.to_dict() for book in items))
+    measure_serializing("Book.iter_dicts(books)", books, Book.iter_dicts)
+
+
+if __name__ == "__main__":
+    main()
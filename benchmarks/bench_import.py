@@ -0,0 +1,71 @@
+"""
+Measures import of books from CSV file into the sqlite and json backends with validation in one process
+and in all CPUs. Every 100th row is invalid and every 50th row repeats a title, so they are rejected.
+
+Usage: python -m benchmarks.bench_import [amount of rows]
+"""
+import csv
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import (
+    Callable,
+    Tuple,
+)
+
+from app.infrastructure.services.importing import (
+    BooksImporter,
+    ImportReport,
+)
+from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.books.sqlite import SqliteBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+from benchmarks.bench_codecs import make_records
+
+
+BACKENDS: Tuple[Tuple[str, Callable[[Path], BooksUnitOfWork]], ...] = (
+    ("sqlite", lambda directory: SqliteBooksUnitOfWork(file_path=directory / "database.sqlite3")),
+    (
+        "json",
+        lambda directory: JsonBooksUnitOfWork(
+            file_path=directory / "database.json", cache=CatalogCache(), group_committer=None
+        ),
+    ),
+)
+
+
+def write_feed(path: Path, amount: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=("title", "author", "year", "status"))
+        writer.writeheader()
+        records = make_records(amount)
+        for number, record in enumerate(records):
+            if number % 100 == 99:
+                record["author"] = "not a name"
+            if number % 50 == 49:
+                record["title"] = records[0]["title"]
+            writer.writerow({key: record[key] for key in ("title", "author", "year", "status")})
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        feed: Path = Path(directory) / "feed.csv"
+        write_feed(feed, amount)
+        print(f"{amount} rows, {feed.stat().st_size / 1024 / 1024:.1f} MB")
+
+        for name, make_uow in BACKENDS:
+            for workers in sorted({1, os.cpu_count() or 1}):
+                with tempfile.TemporaryDirectory() as storage:
+                    report: ImportReport = BooksImporter(uow=make_uow(Path(storage)), workers=workers).run(feed)
+                print(
+                    f"{name:<8}{workers:>3} workers  imported {report.imported:>8}  rejected {len(report.rejected):>6}"
+                    f"  {report.elapsed:>7.2f} s  {report.throughput:>9.0f} rows/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Reports memory, which is taken by books of the in-memory catalog, measured by tracemalloc.
+
+Books are created from json lines, like they are loaded from the storage,
+so every book owns strings of its own record, unless they are shared.
+
+Usage: python -m benchmarks.bench_memory [amount of books]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+from app.domain.entities.books import Book
+from benchmarks.bench_codecs import make_records
+
+
+def measure(name: str, lines: List[str], create: Callable[[Dict[str, Any]], Book], top: int = 5) -> None:
+    gc.collect()
+    tracemalloc.start()
+    started_with: int = tracemalloc.get_traced_memory()[0]
+
+    books: List[Book] = [create(json.loads(line)) for line in lines]
+    gc.collect()
+    taken: int = tracemalloc.get_traced_memory()[0] - started_with
+    snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    print(f"{name:<40}{taken / len(books):>10.0f} bytes/book{taken / 1024 / 1024:>10.1f} MiB")
+    for statistic in snapshot.statistics("lineno")[:top]:
+        print(f"    {statistic.size / len(books):>8.1f} bytes/book  {statistic.traceback}")
+
+    del books
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    lines: List[str] = [json.dumps(record, ensure_ascii=False) for record in make_records(amount)]
+
+    print(f"{amount} books")
+    measure("Book(**raw)", lines, lambda record: Book(**record))
+    measure("Book.restore(raw)", lines, Book.restore)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Measures the dispatch loop of the message bus: every no-op command raises one no-op event, and both are dispatched
+by one message bus. The previous loop over queue.Queue with isinstance checks is measured for comparison.
+
+Usage: python -m benchmarks.bench_message_bus [amount of commands]
+"""
+import sys
+import time
+from dataclasses import dataclass
+from queue import Queue
+from typing import (
+    Any,
+    Callable,
+)
+
+from app.infrastructure.message_bus import MessageBus
+from app.infrastructure.uow.base import AbstractUnitOfWork
+from app.logic.commands.base import AbstractCommand
+from app.logic.events.base import AbstractEvent
+from app.logic.handlers.base import (
+    AbstractCommandHandler,
+    AbstractEventHandler,
+)
+
+
+class NoopUnitOfWork(AbstractUnitOfWork):
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class NoopCommand(AbstractCommand):
+    pass
+
+
+@dataclass(frozen=True)
+class NoopEvent(AbstractEvent):
+    pass
+
+
+class NoopCommandHandler(AbstractCommandHandler[NoopCommand]):
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
+        self._uow = uow
+        self._event = NoopEvent()
+
+    def __call__(self, command: NoopCommand) -> Any:
+        self._uow.add_event(self._event)
+
+
+class NoopEventHandler(AbstractEventHandler[NoopEvent]):
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
+        pass
+
+    def __call__(self, event: NoopEvent) -> None:
+        pass
+
+
+class QueueMessageBus(MessageBus):
+    """
+    Previous dispatch loop: thread-synchronized queue, isinstance checks and lookup by the exact type.
+    """
+
+    def handle(self, message: Any) -> None:
+        queue: Queue = Queue()
+        queue.put(message)
+        while not queue.empty():
+            message = queue.get()
+            if isinstance(message, AbstractEvent):
+                for handler in self._event_handlers[type(message)]:
+                    handler(message)
+                    for event in self._uow.get_events():
+                        queue.put_nowait(event)
+            elif isinstance(message, AbstractCommand):
+                self._command_result = self._command_handlers[type(message)](message)
+                for event in self._uow.get_events():
+                    queue.put_nowait(event)
+
+
+def measure(messagebus_type: Callable[..., MessageBus], amount: int) -> float:
+    uow: NoopUnitOfWork = NoopUnitOfWork()
+    messagebus: MessageBus = messagebus_type(
+        uow=uow,
+        event_handlers={NoopEvent: [NoopEventHandler(uow)]},
+        command_handlers={NoopCommand: NoopCommandHandler(uow)},
+    )
+    command: NoopCommand = NoopCommand()
+    handle: Callable[[Any], None] = messagebus.handle
+
+    started_at: float = time.perf_counter()
+    for _ in range(amount):
+        handle(command)
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f"{amount} commands and {amount} events")
+    for name, messagebus_type in (
+        ("queue.Queue and isinstance", QueueMessageBus),
+        ("deque and dispatch table", MessageBus),
+    ):
+        elapsed: float = measure(messagebus_type, amount)
+        print(f"{name:<30}{elapsed:>8.2f} s    {elapsed / (2 * amount) * 1_000_000_000:>8.0f} ns per message")
+
+
+if __name__ == "__main__":
+    main()
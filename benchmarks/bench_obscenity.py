@@ -0,0 +1,72 @@
+"""
+Compares the obscenity filter of titles with matching the pattern by re.match on every title, as it was before.
+
+Usage: python -m benchmarks.bench_obscenity [amount of titles]
+"""
+import random
+import re
+import sys
+import time
+from typing import (
+    Callable,
+    List,
+)
+
+from app.domain.values.obscenity import (
+    obscenity_filter,
+    RUSSIAN_SWEAR_WORDS_PATTERN,
+)
+from faker import Faker
+
+
+OBSCENE_WORDS: List[str] = ["хуй", "блять", "пизда", "ебать", "мудак", "похуй", "нахуй", "пиздец"]
+
+
+def make_titles(amount: int) -> List[str]:
+    """
+    Russian and english titles of different length, few of them start with obscene words.
+    """
+    generator: random.Random = random.Random(amount)
+    fakers: List[Faker] = [Faker("ru_RU"), Faker("en_US")]
+    for faker in fakers:
+        faker.seed_instance(amount)
+
+    titles: List[str] = []
+    for _ in range(amount):
+        title: str = generator.choice(fakers).sentence(nb_words=generator.randint(1, 8)).rstrip(".")
+        if generator.random() < 0.02:
+            title = f"{generator.choice(OBSCENE_WORDS).capitalize()} {title}"
+        titles.append(title[:100])
+
+    return titles
+
+
+def measure(name: str, titles: List[str], check: Callable[[List[str]], List[bool]]) -> List[bool]:
+    started_at: float = time.perf_counter()
+    flags: List[bool] = check(titles)
+    seconds: float = time.perf_counter() - started_at
+
+    print(f"{name:<40}{len(titles) / seconds:>12.0f} titles/s{sum(flags):>8} obscene")
+    return flags
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    titles: List[str] = make_titles(amount)
+    pattern: re.Pattern[str] = re.compile(RUSSIAN_SWEAR_WORDS_PATTERN)
+
+    expected: List[bool] = measure(
+        "re.match on every title", titles,
+        lambda items: [re.match(RUSSIAN_SWEAR_WORDS_PATTERN, item) is not None for item in items],
+    )
+    measure("precompiled pattern", titles, lambda items: [pattern.match(item) is not None for item in items])
+    flags: List[bool] = measure(
+        "obscenity filter", titles, lambda items: [obscenity_filter.is_obscene(item) for item in items]
+    )
+    measure("obscenity filter, batch", titles, obscenity_filter.is_obscene_many)
+
+    assert flags == expected, "Filter gives other results than the pattern"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Measures the prefix index of names: time of building, memory taken by it, time of completion of prefixes
+and time of adding and removing a name on a large catalog.
+
+Usage: python -m benchmarks.bench_prefixes [amount of names]
+"""
+import gc
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from app.infrastructure.search.prefixes import PrefixIndex
+from benchmarks.bench_similar import make_names
+
+
+LIMIT: int = 10
+QUERIES: int = 1000
+
+
+def report(name: str, durations: List[float]) -> None:
+    print(
+        f"{name:<20}median {statistics.median(durations) * 1000:>8.3f} ms"
+        f"    max {max(durations) * 1000:>8.3f} ms"
+    )
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    names: List[str] = make_names(amount)
+    generator: random.Random = random.Random(18)
+
+    gc.collect()
+    tracemalloc.start()
+    started_at: float = time.perf_counter()
+    index: PrefixIndex = PrefixIndex.build((name, str(number)) for number, name in enumerate(names))
+    built_in: float = time.perf_counter() - started_at
+    gc.collect()
+    taken: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{amount} names, {len(index)} distinct, built in {built_in:.1f} s, {taken / len(index):.0f} bytes/name")
+
+    prefixes: List[str] = []
+    for _ in range(QUERIES):
+        word: str = generator.choice(generator.choice(names).split())
+        prefixes.append(word[:generator.randint(1, len(word))])
+
+    durations: List[float] = []
+    for prefix in prefixes:
+        started_at = time.perf_counter()
+        index.complete(prefix, LIMIT)
+        durations.append(time.perf_counter() - started_at)
+    report("complete", durations)
+
+    additions: List[float] = []
+    removals: List[float] = []
+    for number in range(QUERIES):
+        name: str = f"{generator.choice(names)} {number}"
+        started_at = time.perf_counter()
+        index.add(name, f"new-{number}")
+        additions.append(time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        index.remove(name, f"new-{number}")
+        removals.append(time.perf_counter() - started_at)
+    report("add", additions)
+    report("remove", removals)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares queries of books by the secondary indexes of the in-memory repository with scanning of all books,
+for example, the report of issued books from 1990 to 2000.
+
+Usage: python -m benchmarks.bench_query [amount of books]
+"""
+import sys
+import time
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from app.domain.entities.books import Book
+from app.infrastructure.repositories.books.jsonr import JsonBooksRepository
+from app.infrastructure.repositories.books.query import BooksQuery
+from benchmarks.bench_codecs import make_records
+
+
+REPEATS: int = 5
+
+QUERIES: Tuple[Tuple[str, BooksQuery], ...] = (
+    ("issued from 1990 to 2000", BooksQuery(year_from=1990, year_to=2000, status="issued", order_by=("year",))),
+    ("one year", BooksQuery(year_from=1990, year_to=1990)),
+    ("one author, the newest 10", BooksQuery(author="George Orwell", order_by=("-year",), limit=10)),
+    ("title prefix, no index", BooksQuery(title_prefix="1984 1", limit=10)),
+)
+
+
+def measure(function, repeats: int = REPEATS) -> float:
+    best: float = float("inf")
+    for _ in range(repeats):
+        started_at: float = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started_at)
+    return best
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    session: Dict[str, Book] = {book.oid: book for book in map(Book.restore, make_records(amount))}
+    repository: JsonBooksRepository = JsonBooksRepository(session=session)
+
+    started_at: float = time.perf_counter()
+    repository.query(BooksQuery(year_from=0))
+    built_in: float = time.perf_counter() - started_at
+    print(f"{amount} books, secondary indexes are built with the first query in {built_in:.2f} s")
+
+    for name, query in QUERIES:
+        found: List[Book] = repository.query(query)
+        indexed: float = measure(lambda query=query: repository.query(query))
+        scanned: float = measure(
+            lambda query=query: query.sort(book for book in session.values() if query.matches(book))
+        )
+        print(
+            f"{name:<30}{len(found):>8} books    index {indexed * 1000:>8.1f} ms    scan {scanned * 1000:>8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Compares lookup of names with misspelled words by the trigram index with scoring of every name of the catalog.
+
+Names are first names with generated surnames, popular surnames are shared by many names like in real catalogs,
+so the most of names are distinct, but their words are not.
+
+Usage: python -m benchmarks.bench_similar [amount of names] [threshold]
+"""
+import gc
+import random
+import statistics
+import sys
+import time
+from typing import (
+    List,
+    Tuple,
+)
+
+from app.infrastructure.search.trigrams import (
+    NamesIndex,
+    score,
+)
+
+
+FIRST_NAMES: Tuple[str, ...] = (
+    "Александр", "Алексей", "Анна", "Борис", "Василий", "Владимир", "Дмитрий", "Елена", "Иван", "Лев", "Мария",
+    "Михаил", "Николай", "Ольга", "Пётр", "Сергей", "Татьяна", "Фёдор", "Юрий",
+    "Aldous", "Arthur", "Charlotte", "David", "Emily", "Ernest", "Frank", "George", "Jane", "John", "Mary",
+    "Neil", "Oscar", "Ray", "Stephen", "Terry", "Ursula", "Virginia", "William",
+)
+RUSSIAN_SUFFIXES: Tuple[str, ...] = ("ов", "ев", "ин", "ский", "ко", "енко", "ич")
+ENGLISH_SUFFIXES: Tuple[str, ...] = ("son", "er", "ton", "ley", "man", "")
+SURNAMES_AMOUNT: int = 100_000
+LIMIT: int = 10
+REPEATS: int = 5
+
+
+def make_names(amount: int) -> List[str]:
+    generator: random.Random = random.Random(amount)
+
+    def make_surname(russian: bool) -> str:
+        consonants, vowels = ("бвгджзклмнпрстфхчш", "аеиоуя") if russian else ("bcdfghklmnprstvw", "aeiou")
+        root: str = ""
+        for _ in range(generator.randint(1, 2)):
+            root += generator.choice(consonants) + generator.choice(vowels)
+            if generator.random() < 0.4:
+                root += generator.choice(consonants)
+        return (root + generator.choice(RUSSIAN_SUFFIXES if russian else ENGLISH_SUFFIXES)).capitalize()
+
+    surnames: List[Tuple[bool, str]] = []
+    for _ in range(SURNAMES_AMOUNT):
+        russian: bool = generator.random() < 0.6
+        surnames.append((russian, make_surname(russian)))
+
+    russian_names: List[str] = [name for name in FIRST_NAMES if not name.isascii()]
+    english_names: List[str] = [name for name in FIRST_NAMES if name.isascii()]
+    names: List[str] = []
+    for _ in range(amount):
+        position: int = generator.randrange(SURNAMES_AMOUNT)
+        if generator.random() < 0.3:
+            position = min(int(generator.paretovariate(1.0)), SURNAMES_AMOUNT) - 1
+        russian, surname = surnames[position]
+        names.append(f"{generator.choice(russian_names if russian else english_names)} {surname}")
+
+    return names
+
+
+def misspell(name: str, generator: random.Random) -> str:
+    letters: List[str] = list(name)
+    position: int = generator.randrange(len(letters))
+    letters[position] = generator.choice("aoei" if letters[position].isascii() else "аоеи")
+    return "".join(letters)
+
+
+def main() -> None:
+    amount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    threshold: float = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    names: List[str] = make_names(amount)
+    names.append("Фёдор Достоевский")
+
+    started_at: float = time.perf_counter()
+    index: NamesIndex = NamesIndex()
+    for number, name in enumerate(names):
+        index.add(name, str(number))
+    print(f"{amount} names, {len(index)} distinct, index is built in {time.perf_counter() - started_at:.1f} s")
+    gc.freeze()
+
+    generator: random.Random = random.Random(42)
+    queries: List[str] = ["Dostoevsky", "Достоевскии", "Федор Достаевский"]
+    queries += [misspell(generator.choice(names), generator) for _ in range(20)]
+    queries += [generator.choice(names).split()[1] for _ in range(5)]
+
+    latencies: List[float] = []
+    for query in queries:
+        timings: List[float] = []
+        for _ in range(REPEATS):
+            started_at = time.perf_counter()
+            found: List[Tuple[str, float]] = index.find_similar(query, threshold, LIMIT)
+            timings.append(time.perf_counter() - started_at)
+
+        latencies.append(statistics.median(timings))
+        print(f"{query:<40}{latencies[-1] * 1000:>10.3f} ms  {found[0] if found else '-'}")
+
+    print(f"{'trigram index, median':<40}{statistics.median(latencies) * 1000:>10.3f} ms")
+    print(f"{'trigram index, max':<40}{max(latencies) * 1000:>10.3f} ms")
+
+    distinct_names: List[str] = list(dict.fromkeys(names))
+    started_at = time.perf_counter()
+    expected: List[float] = sorted((score(queries[0], name, threshold) for name in distinct_names), reverse=True)
+    print(f"{'scoring of every name':<40}{(time.perf_counter() - started_at) * 1000:>10.3f} ms")
+
+    found_scores: List[float] = [name_score for _, name_score in index.find_similar(queries[0], threshold, LIMIT)]
+    assert found_scores == [value for value in expected[:LIMIT] if value > 0], "Index gives other names than scoring"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Final,
+)
+
+import pytest
+from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.infrastructure.uow.books.journal import JournalBooksUnitOfWork
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.books.sqlite import SqliteBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+
+
+# Creates unit of work over the storage in the given directory, units of work of the same directory share the storage
+UnitOfWorkFactory = Callable[[Path], BooksUnitOfWork]
+
+
+def _json(tmp_path: Path) -> BooksUnitOfWork:
+    return JsonBooksUnitOfWork(file_path=tmp_path / "database.json", cache=CatalogCache(), group_committer=None)
+
+
+def _journal(tmp_path: Path) -> BooksUnitOfWork:
+    return JournalBooksUnitOfWork(
+        tmp_path / "database.journal", tmp_path / "database.snapshot.json", cache=CatalogCache(), group_committer=None
+    )
+
+
+def _sqlite(tmp_path: Path) -> BooksUnitOfWork:
+    return SqliteBooksUnitOfWork(file_path=tmp_path / "database.sqlite3")
+
+
+UNIT_OF_WORK_FACTORIES: Final[Dict[str, UnitOfWorkFactory]] = {
+    "json": _json,
+    "journal": _journal,
+    "sqlite": _sqlite,
+}
+
+
+@pytest.fixture(params=list(UNIT_OF_WORK_FACTORIES))
+def make_uow(request: pytest.FixtureRequest) -> UnitOfWorkFactory:
+    """
+    Test using this fixture runs with every storage. Test may narrow the storages down with
+    '@pytest.mark.parametrize("make_uow", ["json", "sqlite"], indirect=True)'.
+    """
+    return UNIT_OF_WORK_FACTORIES[request.param]
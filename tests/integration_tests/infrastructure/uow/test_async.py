@@ -0,0 +1,115 @@
+import asyncio
+import threading
+from pathlib import Path
+from typing import (
+    Any,
+    List,
+)
+
+import pytest
+from app.domain.entities.books import Book
+from app.infrastructure.container import AsyncContainer
+from app.infrastructure.message_bus import AsyncMessageBus
+from app.infrastructure.uow.books.base import AsyncBooksUnitOfWork
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+from app.logic.commands.books import (
+    CreateBookCommand,
+    DeleteBookCommand,
+    GetBookByIdCommand,
+    StreamAllBooksCommand,
+    UpdateBookCommand,
+)
+from app.logic.exceptions import BookNotExistsException
+from app.logic.handlers import (
+    ASYNC_COMMANDS_HANDLERS_FOR_INJECTION,
+    ASYNC_EVENTS_HANDLERS_FOR_INJECTION,
+)
+from tests.integration_tests.infrastructure.uow.conftest import UnitOfWorkFactory
+
+
+def _container(tmp_path: Path, make_uow: UnitOfWorkFactory) -> AsyncContainer:
+    return AsyncContainer(
+        uow_factory=lambda: AsyncBooksUnitOfWork(uow=make_uow(tmp_path)),
+        events_handlers_for_injection=ASYNC_EVENTS_HANDLERS_FOR_INJECTION,
+        commands_handlers_for_injection=ASYNC_COMMANDS_HANDLERS_FOR_INJECTION,
+    )
+
+
+async def _handle(container: AsyncContainer, command: Any) -> Any:
+    messagebus: AsyncMessageBus = container.get_async_messagebus()
+    await messagebus.handle(command)
+    return messagebus.command_result
+
+
+@pytest.mark.parametrize("make_uow", ["json", "sqlite"], indirect=True)
+def test_books_are_created_read_updated_and_deleted_by_async_message_bus(
+        tmp_path: Path,
+        make_uow: UnitOfWorkFactory,
+) -> None:
+    container: AsyncContainer = _container(tmp_path, make_uow)
+
+    async def scenario() -> None:
+        book: Book = await _handle(container, CreateBookCommand(title="Идиот", author="Фёдор Достоевский", year=1869))
+        assert (await _handle(container, GetBookByIdCommand(oid=book.oid))).title.as_generic_type() == "Идиот"
+
+        updated: Book = await _handle(
+            container,
+            UpdateBookCommand(oid=book.oid, title="Идиот", author="Фёдор Достоевский", year=1868, status="issued"),
+        )
+        assert updated.year.as_generic_type() == 1868
+
+        await _handle(container, DeleteBookCommand(oid=book.oid))
+        with pytest.raises(BookNotExistsException):
+            await _handle(container, GetBookByIdCommand(oid=book.oid))
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("make_uow", ["json", "sqlite"], indirect=True)
+def test_all_books_are_streamed_page_by_page(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    container: AsyncContainer = _container(tmp_path, make_uow)
+
+    async def scenario() -> List[str]:
+        created: List[Book] = await asyncio.gather(
+            *(_handle(container, CreateBookCommand(title=f"Книга {number}", author="Лев Толстой", year=1900))
+              for number in range(7))
+        )
+        streamed: List[str] = [book.oid async for book in await _handle(container, StreamAllBooksCommand(page_size=3))]
+        assert streamed == sorted(book.oid for book in created)
+        return streamed
+
+    assert len(asyncio.run(scenario())) == 7
+
+
+def test_event_loop_is_not_blocked_by_slow_storage(tmp_path: Path) -> None:
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    storage_entered: asyncio.Event = asyncio.Event()
+    storage_released: threading.Event = threading.Event()
+
+    class SlowUnitOfWork(JsonBooksUnitOfWork):
+        def commit(self) -> None:
+            loop.call_soon_threadsafe(storage_entered.set)
+            # Storage is released only by the coroutine, which must run meanwhile on the event loop
+            assert storage_released.wait(timeout=5)
+            super().commit()
+
+    container: AsyncContainer = _container(
+        tmp_path,
+        lambda path: SlowUnitOfWork(file_path=path / "database.json", cache=CatalogCache(), group_committer=None),
+    )
+
+    async def release() -> None:
+        await storage_entered.wait()
+        storage_released.set()
+
+    async def scenario() -> Book:
+        book, _ = await asyncio.gather(
+            _handle(container, CreateBookCommand(title="Идиот", author="Фёдор Достоевский", year=1869)), release()
+        )
+        return book
+
+    try:
+        assert loop.run_until_complete(scenario()).title.as_generic_type() == "Идиот"
+    finally:
+        loop.close()
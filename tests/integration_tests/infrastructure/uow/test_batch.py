@@ -0,0 +1,137 @@
+from pathlib import Path
+from typing import (
+    Any,
+    List,
+)
+
+import pytest
+from app.domain.entities.books import Book
+from app.infrastructure.services.batch import BatchResult
+from app.infrastructure.services.books import BooksService
+from app.infrastructure.uow.books.base import BooksUnitOfWork
+from app.logic.commands.books import (
+    BatchCommand,
+    CreateBookCommand,
+    DeleteBookCommand,
+    GetAllBooksCommand,
+    UpdateBookCommand,
+)
+from app.logic.exceptions import (
+    BookAlreadyExistsException,
+    BookNotExistsException,
+    UnsupportedBatchCommandException,
+)
+from app.logic.handlers.books.base import BooksCommandHandler
+from app.logic.handlers.books.commands import (
+    BATCH_COMMANDS_HANDLERS,
+    BatchCommandHandler,
+)
+from tests.integration_tests.infrastructure.uow.conftest import UnitOfWorkFactory
+
+
+def _titles(uow: BooksUnitOfWork) -> List[str]:
+    return sorted(book.title.as_generic_type() for book in BooksService(uow=uow).get_all())
+
+
+def _create(title: str) -> CreateBookCommand:
+    return CreateBookCommand(title=title, author="Лев Толстой", year=1869)
+
+
+def test_commands_of_the_batch_are_committed_once(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow: BooksUnitOfWork = make_uow(tmp_path)
+    existing: Book = BooksService(uow=uow).add(Book(title="Детство", author="Лев Толстой", year=1852))
+    commits: List[None] = []
+    commit = uow.commit
+    uow.commit = lambda: commits.append(commit())  # type: ignore[method-assign]
+
+    result: BatchResult[Book] = BatchCommandHandler(uow=uow)(
+        BatchCommand(
+            commands=(
+                _create("Война и мир"),
+                _create("Анна Каренина"),
+                UpdateBookCommand(
+                    oid=existing.oid, title="Отрочество", author="Лев Толстой", year=1854, status="issued"
+                ),
+                DeleteBookCommand(oid=existing.oid),
+            )
+        )
+    )
+
+    assert len(commits) == 1
+    assert result.succeeded == 4
+    assert result.errors == {}
+    assert [book.title.as_generic_type() for book in result.results[:3]] == [  # type: ignore[union-attr]
+        "Война и мир",
+        "Анна Каренина",
+        "Отрочество",
+    ]
+    assert _titles(make_uow(tmp_path)) == ["Анна Каренина", "Война и мир"]
+
+
+def test_failed_command_cancels_the_atomic_batch(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow: BooksUnitOfWork = make_uow(tmp_path)
+
+    # Books created earlier in the batch are visible to the next commands
+    with pytest.raises(BookAlreadyExistsException):
+        BatchCommandHandler(uow=uow)(BatchCommand(commands=(_create("Война и мир"), _create("Война и мир"))))
+
+    assert _titles(make_uow(tmp_path)) == []
+
+
+class _BrokenDeleteBookCommandHandler(BooksCommandHandler[DeleteBookCommand]):
+    def __call__(self, command: DeleteBookCommand) -> Any:
+        raise RuntimeError("Storage is not available")
+
+
+@pytest.mark.parametrize("atomic", [True, False])
+def test_unexpected_error_cancels_the_batch(
+        tmp_path: Path,
+        make_uow: UnitOfWorkFactory,
+        monkeypatch: pytest.MonkeyPatch,
+        atomic: bool,
+) -> None:
+    monkeypatch.setitem(BATCH_COMMANDS_HANDLERS, DeleteBookCommand, _BrokenDeleteBookCommandHandler)
+
+    with pytest.raises(RuntimeError, match="Storage is not available"):
+        BatchCommandHandler(uow=make_uow(tmp_path))(
+            BatchCommand(
+                commands=(_create("Война и мир"), DeleteBookCommand(oid="missing"), _create("Воскресение")),
+                atomic=atomic,
+            )
+        )
+
+    assert _titles(make_uow(tmp_path)) == []
+
+
+def test_errors_of_failed_commands_are_returned_with_results_of_others(
+        tmp_path: Path,
+        make_uow: UnitOfWorkFactory,
+) -> None:
+    uow: BooksUnitOfWork = make_uow(tmp_path)
+
+    result: BatchResult[Book] = BatchCommandHandler(uow=uow)(
+        BatchCommand(
+            commands=(
+                _create("Война и мир"),
+                DeleteBookCommand(oid="missing"),
+                _create("Война и мир"),
+                _create("Воскресение"),
+            ),
+            atomic=False,
+        )
+    )
+
+    assert result.succeeded == 2
+    assert result.results[1] is None
+    assert result.results[2] is None
+    assert isinstance(result.errors[1], BookNotExistsException)
+    assert isinstance(result.errors[2], BookAlreadyExistsException)
+    assert _titles(make_uow(tmp_path)) == ["Война и мир", "Воскресение"]
+
+
+@pytest.mark.parametrize("make_uow", ["json"], indirect=True)
+def test_only_changes_of_books_are_run_in_a_batch(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    with pytest.raises(UnsupportedBatchCommandException):
+        BatchCommandHandler(uow=make_uow(tmp_path))(
+            BatchCommand(commands=(GetAllBooksCommand(),))  # type: ignore[arg-type]
+        )
@@ -0,0 +1,129 @@
+from pathlib import Path
+from typing import (
+    List,
+    TextIO,
+)
+
+import pytest
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import (
+    CorruptedStorageException,
+    LockTimeoutException,
+)
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+from app.infrastructure.uow.durability import (
+    GroupCommitter,
+    write_atomically,
+    Writer,
+)
+from app.infrastructure.uow.locks import FileLock
+
+
+def test_write_atomically_keeps_old_content_if_writing_failed(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    database.write_text("[]", encoding="utf-8")
+
+    def broken_write(f: TextIO) -> None:
+        f.write("[{")
+        raise OSError("No space left on device")
+
+    with pytest.raises(OSError, match="No space left on device"):
+        write_atomically(database, broken_write)
+
+    assert database.read_text(encoding="utf-8") == "[]"
+    assert list(tmp_path.iterdir()) == [database]
+
+
+def test_group_committer_writes_only_the_latest_content_within_window(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    committer = GroupCommitter(window=60)
+    written: List[str] = []
+
+    def writer(content: str) -> Writer:
+        def write(f: TextIO) -> None:
+            written.append(content)
+            f.write(content)
+
+        return write
+
+    for content in ("first", "second", "third"):
+        committer.replace(database, writer(content))
+
+    assert not database.exists()
+
+    committer.flush()
+
+    assert written == ["third"]
+    assert database.read_text(encoding="utf-8") == "third"
+
+
+def test_json_uow_with_group_committer_serves_committed_books_before_flush(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    cache = CatalogCache()
+    committer = GroupCommitter(window=60)
+
+    for title in ("1984", "Animal Farm"):
+        with JsonBooksUnitOfWork(file_path=database, cache=cache, group_committer=committer) as uow:
+            uow.books.add(Book(title=title, author="George Orwell", year=1949))
+            uow.commit()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache, group_committer=committer) as uow:
+        assert len(uow.books.list()) == 2
+
+    committer.flush()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache()) as uow:
+        assert len(uow.books.list()) == 2
+
+
+def test_json_uow_with_group_committer_holds_the_lock_until_flush(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    committer = GroupCommitter(window=60)
+    # Another process, which does not wait long for the lock
+    other_process_lock = FileLock(tmp_path / "database.json.lock", timeout=0.01)
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=committer) as uow:
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    with pytest.raises(LockTimeoutException):
+        JsonBooksUnitOfWork(
+            file_path=database, cache=CatalogCache(), group_committer=None, lock=other_process_lock
+        ).__enter__()
+
+    committer.flush()
+
+    with JsonBooksUnitOfWork(
+            file_path=database, cache=CatalogCache(), group_committer=None, lock=other_process_lock
+        ) as uow:
+        assert len(uow.books.list()) == 1
+
+
+def test_json_uow_with_group_committer_keeps_books_of_other_processes(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    committer = GroupCommitter(window=60)
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=committer) as uow:
+        # Another process commits, while this unit of work is open
+        with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as other_uow:
+            other_uow.books.add(Book(title="Animal Farm", author="George Orwell", year=1945))
+            other_uow.commit()
+
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    committer.flush()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        assert sorted(book.title.as_generic_type() for book in uow.books.list()) == ["1984", "Animal Farm"]
+
+
+def test_corrupted_json_file_is_not_overwritten(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    database.write_text('[{"title": "1984", ', encoding="utf-8")
+
+    with pytest.raises(CorruptedStorageException):
+        JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None).__enter__()
+
+    assert database.read_text(encoding="utf-8") == '[{"title": "1984", '
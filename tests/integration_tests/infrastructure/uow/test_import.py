@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import (
+    ImportFileException,
+    UnknownImportFormatException,
+)
+from app.infrastructure.services.books import BooksService
+from app.infrastructure.services.importing import (
+    BooksImporter,
+    ImportReport,
+)
+from app.infrastructure.uow.books.base import BooksUnitOfWork
+from tests.integration_tests.infrastructure.uow.conftest import UnitOfWorkFactory
+
+
+def _titles(uow: BooksUnitOfWork) -> List[str]:
+    return sorted(book.title.as_generic_type() for book in BooksService(uow=uow).get_all())
+
+
+def _importer(uow: BooksUnitOfWork) -> BooksImporter:
+    # Small chunks and batches, so rows are validated by several chunks and written by several commits
+    return BooksImporter(uow=uow, chunk_size=2, batch_size=3, workers=2)
+
+
+@pytest.mark.parametrize("make_uow", ["json", "sqlite"], indirect=True)
+def test_valid_rows_of_csv_are_imported_and_others_are_rejected(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow: BooksUnitOfWork = make_uow(tmp_path)
+    BooksService(uow=uow).add(Book(title="Детство", author="Лев Толстой", year=1852))
+    feed: Path = tmp_path / "feed.csv"
+    feed.write_text(
+        "title,author,year,status\n"
+        "Война и мир,Лев Толстой,1869,\n"
+        "Идиот,Фёдор Достоевский,1869,issued\n"
+        "Бесы,fedor,1872,\n"
+        "Детство,Лев Толстой,1852,\n"
+        "Война и мир,Лев Толстой,1869,\n"
+        "Анна Каренина,Лев Толстой,not a year,\n"
+        "Будущее,Лев Толстой,3000,\n"
+        "\"Отцы, и дети\",Иван Тургенев,1862,\n",
+        encoding="utf-8",
+    )
+
+    report: ImportReport = _importer(uow).run(feed)
+
+    assert (report.read, report.imported) == (8, 3)
+    assert [row.line for row in report.rejected] == [4, 5, 6, 7, 8]
+    assert "already exists" in report.rejected[1].reason
+    assert "already exists" in report.rejected[2].reason
+    assert report.throughput > 0
+    assert _titles(make_uow(tmp_path)) == ["Война и мир", "Детство", "Идиот", "Отцы, и дети"]
+
+
+@pytest.mark.parametrize("make_uow", ["json"], indirect=True)
+def test_rows_of_jsonl_are_parsed_and_validated_in_workers(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    feed: Path = tmp_path / "feed.jsonl"
+    lines: List[str] = [
+        json.dumps({"title": "Война и мир", "author": "Лев Толстой", "year": 1869}, ensure_ascii=False),
+        "",
+        "{broken",
+        json.dumps(["Идиот", "Фёдор Достоевский", 1869], ensure_ascii=False),
+        json.dumps({"title": "Идиот", "author": "Фёдор Достоевский"}, ensure_ascii=False),
+        json.dumps({"title": "Идиот", "author": "Фёдор Достоевский", "year": "1869"}, ensure_ascii=False),
+    ]
+    feed.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    report: ImportReport = _importer(make_uow(tmp_path)).run(feed)
+
+    assert (report.read, report.imported) == (5, 2)
+    assert [row.line for row in report.rejected] == [3, 4, 5]
+    assert report.rejected[2].reason == "Missing field 'year'"
+    assert _titles(make_uow(tmp_path)) == ["Война и мир", "Идиот"]
+
+
+@pytest.mark.parametrize("make_uow", ["json"], indirect=True)
+def test_file_of_unknown_format_is_not_imported(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    feed: Path = tmp_path / "feed.xml"
+    feed.write_text("<books/>", encoding="utf-8")
+
+    with pytest.raises(UnknownImportFormatException):
+        _importer(make_uow(tmp_path)).run(feed)
+
+
+@pytest.mark.parametrize("make_uow", ["json"], indirect=True)
+def test_missing_file_is_not_imported(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    with pytest.raises(ImportFileException, match="feed.csv"):
+        _importer(make_uow(tmp_path)).run(tmp_path / "feed.csv")
+
+
+@pytest.mark.parametrize("make_uow", ["json"], indirect=True)
+def test_file_not_in_utf8_is_not_imported(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    feed: Path = tmp_path / "feed.jsonl"
+    feed.write_bytes('{"title": "Идиот"}\n'.encode("cp1251"))
+
+    with pytest.raises(ImportFileException, match="feed.jsonl"):
+        _importer(make_uow(tmp_path)).run(feed)
+
+    assert _titles(make_uow(tmp_path)) == []
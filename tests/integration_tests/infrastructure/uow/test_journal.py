@@ -0,0 +1,80 @@
+from pathlib import Path
+
+from app.domain.entities.books import Book
+from app.infrastructure.uow.books.journal import JournalBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+
+
+def make_uow(tmp_path: Path, cache: CatalogCache, compaction_threshold: int = 1024 * 1024) -> JournalBooksUnitOfWork:
+    return JournalBooksUnitOfWork(
+        journal_path=tmp_path / "database.journal",
+        snapshot_path=tmp_path / "database.snapshot.json",
+        compaction_threshold=compaction_threshold,
+        cache=cache,
+    )
+
+
+def test_journal_uow_appends_only_changed_books(tmp_path: Path) -> None:
+    with make_uow(tmp_path, CatalogCache()) as uow:
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.books.add(Book(title="Brave New World", author="Aldous Huxley", year=1932))
+        uow.commit()
+
+    with make_uow(tmp_path, CatalogCache()) as uow:
+        book = uow.books.get_by_title("1984")
+        assert book is not None
+        uow.books.delete(book.oid)
+        uow.commit()
+
+    lines = (tmp_path / "database.journal").read_text(encoding="utf-8").splitlines()
+
+    assert len(lines) == 3
+
+
+def test_journal_uow_rebuilds_catalog_from_journal(tmp_path: Path) -> None:
+    with make_uow(tmp_path, CatalogCache()) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.books.add(Book(title="Brave New World", author="Aldous Huxley", year=1932))
+        uow.commit()
+
+    with make_uow(tmp_path, CatalogCache()) as uow:
+        uow.books.update(book.oid, Book(oid=book.oid, title="1984", author="George Orwell", year=1949, status="issued"))
+        uow.commit()
+
+    with make_uow(tmp_path, CatalogCache()) as uow:
+        updated_book = uow.books.get(book.oid)
+
+        assert len(uow.books.list()) == 2
+        assert updated_book is not None
+        assert updated_book.status.as_generic_type() == "issued"
+
+
+def test_journal_uow_ignores_broken_last_record(tmp_path: Path) -> None:
+    with make_uow(tmp_path, CatalogCache()) as uow:
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    with open(tmp_path / "database.journal", "a", encoding="utf-8") as f:
+        f.write('{"seq": 2, "op": "add", "oid": "1", "bo')
+
+    with make_uow(tmp_path, CatalogCache()) as uow:
+        assert len(uow.books.list()) == 1
+        uow.books.add(Book(title="Brave New World", author="Aldous Huxley", year=1932))
+        uow.commit()
+
+    with make_uow(tmp_path, CatalogCache()) as uow:
+        assert len(uow.books.list()) == 2
+
+
+def test_journal_uow_compacts_journal_into_snapshot(tmp_path: Path) -> None:
+    with make_uow(tmp_path, CatalogCache(), compaction_threshold=1) as uow:
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.books.add(Book(title="Brave New World", author="Aldous Huxley", year=1932))
+        uow.commit()
+        uow._journal.wait_for_compaction()
+
+    assert (tmp_path / "database.snapshot.json").is_file()
+    assert (tmp_path / "database.journal").read_text(encoding="utf-8") == ""
+
+    with make_uow(tmp_path, CatalogCache()) as uow:
+        assert len(uow.books.list()) == 2
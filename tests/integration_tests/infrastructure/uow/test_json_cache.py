@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+
+from app.domain.entities.books import Book
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+
+
+def test_json_uow_reuses_parsed_catalog_if_file_was_not_changed(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    cache = CatalogCache()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        first = uow.books.get_by_title("1984")
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        second = uow.books.get_by_title("1984")
+
+    assert first is not None
+    assert first is second
+
+
+def test_json_uow_reloads_catalog_if_file_was_changed_by_someone_else(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    cache = CatalogCache()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    with open(database, "w", encoding="utf-8") as f:
+        json.dump([{"title": "Brave New World", "author": "Aldous Huxley", "year": 1932, "status": "in stock"}], f)
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        assert uow.books.get_by_title("1984") is None
+        assert uow.books.get_by_title("Brave New World") is not None
+
+
+def test_json_uow_does_not_leak_uncommitted_changes_to_cache(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    cache = CatalogCache()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        book = uow.books.get_by_title("1984")
+        assert book is not None
+        uow.books.delete(book.oid)
+        uow.rollback()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        assert uow.books.get_by_title("1984") is not None
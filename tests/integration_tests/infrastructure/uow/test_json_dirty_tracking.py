@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from app.domain.entities.books import Book
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+
+
+def test_json_uow_does_not_write_file_if_nothing_changed(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    cache = CatalogCache()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    modified_at = database.stat().st_mtime_ns
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        uow.books.list()
+        uow.commit()
+
+    assert database.stat().st_mtime_ns == modified_at
+
+
+def test_json_uow_saves_book_replaced_with_the_same_oid(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache()) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache()) as uow:
+        uow.books.update(book.oid, Book(oid=book.oid, title="1984", author="George Orwell", year=1949, status="issued"))
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache()) as uow:
+        updated_book = uow.books.get(book.oid)
+
+        assert updated_book is not None
+        assert updated_book.status.as_generic_type() == "issued"
+
+
+def test_json_uow_rollback_forgets_only_touched_books(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    cache = CatalogCache()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+        uow.books.delete(book.oid)
+        uow.books.add(Book(title="Brave New World", author="Aldous Huxley", year=1932))
+        uow.rollback()
+
+        assert uow.books.list() == [book]
@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+
+from app.domain.entities.books import Book
+from app.infrastructure.serialization.codecs import get_storage_format
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+
+
+def test_json_uow_writes_the_same_file_as_before_streaming(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        books = [
+            uow.books.add(Book(title="Мастер и Маргарита", author="Михаил Булгаков", year=1967)),
+            uow.books.add(Book(title="1984", author="George Orwell", year=1949)),
+        ]
+
+    assert database.read_text(encoding="utf-8") == json.dumps(
+        [book.to_dict() for book in books], ensure_ascii=False, indent=4
+    )
+
+
+def test_json_uow_streams_committed_books_without_caching_them(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    cache = CatalogCache()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache, group_committer=None) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+
+    cache.invalidate()
+    streamed_books = list(JsonBooksUnitOfWork(file_path=database, cache=cache, group_committer=None).stream_books())
+
+    assert [streamed_book.to_dict() for streamed_book in streamed_books] == [book.to_dict()]
+    assert cache.get(database.resolve()) is None
+
+
+def test_json_uow_reads_file_written_in_previous_storage_format(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+
+    with JsonBooksUnitOfWork(
+            file_path=database, cache=CatalogCache(), group_committer=None, storage_format=get_storage_format()
+    ) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+
+    with JsonBooksUnitOfWork(
+            file_path=database,
+            cache=CatalogCache(),
+            group_committer=None,
+            storage_format=get_storage_format("binary", "gzip"),
+    ) as uow:
+        assert uow.books.get(book.oid) == book
+        uow.books.add(Book(title="Мастер и Маргарита", author="Михаил Булгаков", year=1967))
+
+    assert database.read_bytes().startswith(b"\x1f\x8b")
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        assert len(uow.books.list()) == 2
@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+from app.domain.entities.books import Book
+from app.domain.values.books import Title
+from app.infrastructure.uow.books import jsonr
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+
+
+@pytest.fixture
+def validated_titles(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    titles: List[str] = []
+    validate = Title.validate
+
+    def counting_validate(self: Title) -> None:
+        titles.append(self.value)
+        validate(self)
+
+    monkeypatch.setattr(Title, "validate", counting_validate)
+    return titles
+
+
+def _commit_book(database: Path) -> Book:
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        return uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+
+
+def _load(database: Path) -> List[Book]:
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        return uow.books.list()
+
+
+def test_json_uow_does_not_validate_books_of_its_own_file(tmp_path: Path, validated_titles: List[str]) -> None:
+    database = tmp_path / "database.json"
+    book = _commit_book(database)
+    validated_titles.clear()
+
+    books = _load(database)
+
+    assert [loaded_book.to_dict() for loaded_book in books] == [book.to_dict()]
+    assert validated_titles == []
+
+
+def test_json_uow_validates_books_if_file_was_changed_outside(tmp_path: Path, validated_titles: List[str]) -> None:
+    database = tmp_path / "database.json"
+    book = _commit_book(database)
+    database.write_text(json.dumps([book.to_dict(include={"title": "Animal Farm"})]), encoding="utf-8")
+    validated_titles.clear()
+
+    assert [loaded_book.title.as_generic_type() for loaded_book in _load(database)] == ["Animal Farm"]
+    assert validated_titles == ["Animal Farm"]
+
+    validated_titles.clear()
+    _load(database)
+
+    # Meta has been written after validation, so the next load trusts the file
+    assert validated_titles == []
+
+
+def test_json_uow_validates_books_if_validators_were_changed(
+        tmp_path: Path, validated_titles: List[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    database = tmp_path / "database.json"
+    _commit_book(database)
+    validated_titles.clear()
+    monkeypatch.setattr(jsonr, "VALIDATORS_VERSION", jsonr.VALIDATORS_VERSION + 1)
+
+    _load(database)
+
+    assert validated_titles == ["1984"]
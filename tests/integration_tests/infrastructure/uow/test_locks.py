@@ -0,0 +1,113 @@
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import LockTimeoutException
+from app.infrastructure.uow.books.journal import (
+    Journal,
+    JournalBooksUnitOfWork,
+)
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+from app.infrastructure.uow.locks import (
+    FileLock,
+    LockMetrics,
+)
+
+
+def test_shared_locks_are_held_together(tmp_path: Path) -> None:
+    lock = FileLock(tmp_path / "database.json.lock", timeout=0.05)
+
+    with lock.shared(), lock.shared():
+        pass
+
+
+def test_exclusive_lock_times_out_while_shared_lock_is_held_and_is_counted(tmp_path: Path) -> None:
+    metrics = LockMetrics()
+    lock = FileLock(tmp_path / "database.json.lock", timeout=0.05, metrics=metrics)
+
+    with lock.shared(), pytest.raises(LockTimeoutException), lock.exclusive():
+        pass
+
+    with lock.exclusive():
+        pass
+
+    assert metrics.as_dict()["timeouts"] == 1
+    assert metrics.as_dict()["contended"] == 1
+    assert metrics.as_dict()["acquired"] == 2
+
+
+def test_exclusive_lock_waits_until_it_is_released(tmp_path: Path) -> None:
+    metrics = LockMetrics()
+    lock = FileLock(tmp_path / "database.json.lock", timeout=5, metrics=metrics)
+    order: List[str] = []
+    released = threading.Event()
+
+    def writer() -> None:
+        with lock.exclusive():
+            order.append("writer")
+
+    with lock.exclusive():
+        thread = threading.Thread(target=writer)
+        thread.start()
+        released.wait(0.05)
+        order.append("holder")
+
+    thread.join()
+
+    assert order == ["holder", "writer"]
+    assert metrics.contended == 1
+
+
+def test_json_units_of_work_of_different_processes_do_not_lose_updates(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    # Every process has its own cache, so two caches behave like two processes
+    first_process = JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None)
+    second_process = JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None)
+
+    with first_process:
+        pass
+
+    with second_process:
+        second_process.books.add(Book(title="Мастер и Маргарита", author="Михаил Булгаков", year=1967))
+
+    with first_process:
+        first_process.books.add(Book(title="Преступление и наказание", author="Фёдор Достоевский", year=1866))
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        titles = sorted(book.title.as_generic_type() for book in uow.books.list())
+
+    assert titles == ["Мастер и Маргарита", "Преступление и наказание"]
+
+
+def test_journal_appends_of_different_processes_get_different_sequence_numbers(tmp_path: Path) -> None:
+    journal_path = tmp_path / "database.journal"
+    snapshot_path = tmp_path / "database.snapshot.json"
+    first_process = Journal(journal_path, snapshot_path, compaction_threshold=1024 * 1024)
+    second_process = Journal(journal_path, snapshot_path, compaction_threshold=1024 * 1024)
+
+    book = Book(title="Мастер и Маргарита", author="Михаил Булгаков", year=1967)
+    record = {"op": "add", "oid": book.oid, "book": book.to_dict()}
+
+    assert first_process.append([record]) == (0, 1)
+    assert second_process.append([record]) == (1, 2)
+    assert first_process.append([record]) == (2, 3)
+
+
+def test_journal_unit_of_work_sees_books_appended_by_another_process(tmp_path: Path) -> None:
+    journal_path = tmp_path / "database.journal"
+    snapshot_path = tmp_path / "database.snapshot.json"
+    other_process = Journal(journal_path, snapshot_path, compaction_threshold=1024 * 1024)
+    book = Book(title="Мастер и Маргарита", author="Михаил Булгаков", year=1967)
+
+    with JournalBooksUnitOfWork(journal_path=journal_path, snapshot_path=snapshot_path, cache=CatalogCache()):
+        pass
+
+    other_process.append([{"op": "add", "oid": book.oid, "book": book.to_dict()}])
+
+    with JournalBooksUnitOfWork(
+            journal_path=journal_path, snapshot_path=snapshot_path, cache=CatalogCache(), group_committer=None
+    ) as uow:
+        assert uow.books.get(book.oid) == book
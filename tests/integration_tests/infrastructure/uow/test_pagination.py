@@ -0,0 +1,79 @@
+from pathlib import Path
+from typing import (
+    List,
+    Optional,
+)
+
+import pytest
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import InvalidCursorException
+from app.infrastructure.services.books import BooksService
+from app.infrastructure.services.pagination import Page
+from app.infrastructure.uow.books.base import BooksUnitOfWork
+from tests.integration_tests.infrastructure.uow.conftest import UnitOfWorkFactory
+
+
+def _add_books(uow: BooksUnitOfWork, amount: int) -> List[Book]:
+    with uow:
+        books = [
+            uow.books.add(Book(title=f"Книга {number}", author="Лев Толстой", year=1900)) for number in range(amount)
+        ]
+        uow.commit()
+    return books
+
+
+def test_pages_continue_after_the_last_book_of_the_previous_page(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+    books = _add_books(uow, 7)
+    service = BooksService(uow=uow)
+
+    first_page: Page[Book] = service.get_page(cursor=None, page_size=3)
+    assert [book.oid for book in first_page.items] == sorted(book.oid for book in books)[:3]
+
+    # Books added or deleted before the cursor do not move the next pages
+    with uow:
+        uow.books.delete(first_page.items[0].oid)
+        uow.commit()
+
+    read: List[str] = [book.oid for book in first_page.items]
+    cursor: Optional[str] = first_page.next_cursor
+    while cursor is not None:
+        page = service.get_page(cursor=cursor, page_size=3)
+        read.extend(book.oid for book in page.items)
+        cursor = page.next_cursor
+
+    assert read == sorted(book.oid for book in books)
+    assert [book.oid for book in service.stream(page_size=2)] == sorted(book.oid for book in books)[1:]
+
+
+def test_last_page_has_no_cursor(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+    service = BooksService(uow=uow)
+
+    assert service.get_page(cursor=None, page_size=3) == Page(items=[])
+
+    _add_books(uow, 3)
+    page = service.get_page(cursor=None, page_size=3)
+    assert len(page.items) == 3
+    assert page.next_cursor is None
+
+
+def test_page_sees_changes_of_the_unit_of_work(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+    books = _add_books(uow, 5)
+
+    with uow:
+        uow.books.delete(books[0].oid)
+        new_book = uow.books.add(Book(title="Воскресение", author="Лев Толстой", year=1899))
+        expected = sorted([book.oid for book in books[1:]] + [new_book.oid])
+
+        first_page = uow.books.list_page(None, limit=3)
+        second_page = uow.books.list_page(first_page[-1].oid, limit=3)
+
+        assert [book.oid for book in first_page + second_page] == expected
+
+
+@pytest.mark.parametrize("make_uow", ["sqlite"], indirect=True)
+def test_broken_cursor_is_rejected(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    with pytest.raises(InvalidCursorException):
+        BooksService(uow=make_uow(tmp_path)).get_page(cursor="@@@", page_size=3)
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from app.domain.entities.books import Book
+from app.infrastructure.repositories.books.query import BooksQuery
+from tests.integration_tests.infrastructure.uow.conftest import UnitOfWorkFactory
+
+
+def test_books_are_filtered_and_sorted(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+
+    with uow:
+        idiot = uow.books.add(Book(title="Идиот", author="Фёдор Достоевский", year=1869, status="issued"))
+        demons = uow.books.add(Book(title="Бесы", author="Фёдор Достоевский", year=1872))
+        war_and_peace = uow.books.add(Book(title="Война и мир", author="Лев Толстой", year=1869, status="issued"))
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949, status="issued"))
+        uow.commit()
+
+    with uow:
+        issued = uow.books.query(BooksQuery(year_from=1860, year_to=1870, status="issued", order_by=("title",)))
+        assert [book.oid for book in issued] == [war_and_peace.oid, idiot.oid]
+
+        by_author = uow.books.query(BooksQuery(author="Фёдор Достоевский", order_by=("-year",)))
+        assert [book.oid for book in by_author] == [demons.oid, idiot.oid]
+
+        assert [book.oid for book in uow.books.query(BooksQuery(title_prefix="Бе"))] == [demons.oid]
+        assert len(uow.books.query(BooksQuery(order_by=("year",), limit=2))) == 2
+        assert uow.books.query(BooksQuery(year_from=2000)) == []
+
+
+def test_query_sees_changes_of_the_unit_of_work(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+
+    with uow:
+        idiot = uow.books.add(Book(title="Идиот", author="Фёдор Достоевский", year=1869, status="issued"))
+        demons = uow.books.add(Book(title="Бесы", author="Фёдор Достоевский", year=1872))
+        uow.commit()
+
+    with uow:
+        assert [book.oid for book in uow.books.query(BooksQuery(status="issued"))] == [idiot.oid]
+
+    with uow:
+        uow.books.update(
+            demons.oid, Book(oid=demons.oid, title="Бесы", author="Фёдор Достоевский", year=1872, status="issued")
+        )
+        uow.books.delete(idiot.oid)
+        gambler = uow.books.add(Book(title="Игрок", author="Фёдор Достоевский", year=1866, status="issued"))
+
+        found = uow.books.query(BooksQuery(status="issued", order_by=("year",)))
+        assert [book.oid for book in found] == [gambler.oid, demons.oid]
+        uow.commit()
+
+    with uow:
+        found = uow.books.query(BooksQuery(author="Фёдор Достоевский", year_to=1870))
+        assert [book.oid for book in found] == [gambler.oid]
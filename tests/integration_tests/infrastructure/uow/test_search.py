@@ -0,0 +1,44 @@
+import sqlite3
+from pathlib import Path
+
+from app.domain.entities.books import Book
+from app.infrastructure.uow.books.sqlite import SqliteBooksUnitOfWork
+from tests.integration_tests.infrastructure.uow.conftest import UnitOfWorkFactory
+
+
+def test_search_index_follows_added_updated_and_deleted_books(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+
+    with uow:
+        war_and_peace = uow.books.add(Book(title="Война и мир", author="Лев Толстой", year=1869))
+        anna_karenina = uow.books.add(Book(title="Анна Каренина", author="Лев Толстой", year=1877))
+        uow.commit()
+
+    with uow:
+        assert [book.oid for book in uow.books.search("войны", limit=10)] == [war_and_peace.oid]
+
+        uow.books.update(
+            anna_karenina.oid, Book(oid=anna_karenina.oid, title="Воскресение", author="Лев Толстой", year=1899)
+        )
+        uow.books.delete(war_and_peace.oid)
+        uow.commit()
+
+    with uow:
+        assert uow.books.search("войны", limit=10) == []
+        assert uow.books.search("каренина", limit=10) == []
+        assert [book.oid for book in uow.books.search("воскресения", limit=10)] == [anna_karenina.oid]
+        assert [book.oid for book in uow.books.search("толстой", limit=10)] == [anna_karenina.oid]
+
+
+def test_sqlite_books_stored_before_search_are_indexed(tmp_path: Path) -> None:
+    database = tmp_path / "database.sqlite3"
+    connection = sqlite3.connect(database)
+    connection.execute(
+        "CREATE TABLE books (oid TEXT PRIMARY KEY, title TEXT, author TEXT, year INTEGER, status TEXT)"
+    )
+    connection.execute("INSERT INTO books VALUES ('1', 'Мастер и Маргарита', 'Михаил Булгаков', 1967, 'in stock')")
+    connection.commit()
+    connection.close()
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        assert [book.oid for book in uow.books.search("Булгакова", limit=10)] == ["1"]
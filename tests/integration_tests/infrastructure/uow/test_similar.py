@@ -0,0 +1,72 @@
+import sqlite3
+from pathlib import Path
+
+from app.domain.entities.books import Book
+from app.infrastructure.uow.books.sqlite import SqliteBooksUnitOfWork
+from tests.integration_tests.infrastructure.uow.conftest import UnitOfWorkFactory
+
+
+def test_books_are_found_by_misspelled_author_and_title(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+
+    with uow:
+        crime = uow.books.add(Book(title="Преступление и наказание", author="Фёдор Достоевский", year=1866))
+        idiot = uow.books.add(Book(title="Идиот", author="Фёдор Достоевский", year=1869))
+        uow.books.add(Book(title="Война и мир", author="Лев Толстой", year=1869))
+        uow.commit()
+
+    with uow:
+        for author in ("Dostoevsky", "Достоевскии", "федор достаевский"):
+            found = uow.books.find_by_similar_author(author, limit=10, threshold=0.5)
+            assert {book.oid for book in found} == {crime.oid, idiot.oid}
+
+        assert uow.books.find_by_similar_author("Dostoevsky", limit=1, threshold=0.5)[0].oid in {crime.oid, idiot.oid}
+        assert [book.oid for book in uow.books.find_by_similar_title("Прeступленье", limit=10, threshold=0.5)] == [
+            crime.oid
+        ]
+        assert uow.books.find_by_similar_title("Булгаков", limit=10, threshold=0.5) == []
+
+
+def test_lookup_of_similar_books_sees_changes_of_the_unit_of_work(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+
+    with uow:
+        crime = uow.books.add(Book(title="Преступление и наказание", author="Фёдор Достоевский", year=1866))
+        war_and_peace = uow.books.add(Book(title="Война и мир", author="Лев Толстой", year=1869))
+        uow.commit()
+
+    with uow:
+        uow.books.update(
+            crime.oid, Book(oid=crime.oid, title="Преступление и наказание", author="Лев Толстой", year=1866)
+        )
+        uow.books.delete(war_and_peace.oid)
+        resurrection = uow.books.add(Book(title="Воскресение", author="Лев Толстой", year=1899))
+
+        assert uow.books.find_by_similar_author("Dostoevsky", limit=10, threshold=0.5) == []
+        assert {book.oid for book in uow.books.find_by_similar_author("Толстои", limit=10, threshold=0.5)} == {
+            crime.oid, resurrection.oid
+        }
+        assert [book.oid for book in uow.books.find_by_similar_title("Воскресенье", limit=10, threshold=0.5)] == [
+            resurrection.oid
+        ]
+        uow.commit()
+
+    with uow:
+        assert {book.oid for book in uow.books.find_by_similar_author("Tolstoy", limit=10, threshold=0.5)} == {
+            crime.oid, resurrection.oid
+        }
+        assert uow.books.find_by_similar_title("Война", limit=10, threshold=0.5) == []
+
+
+def test_sqlite_books_stored_before_lookup_of_similar_books_are_indexed(tmp_path: Path) -> None:
+    database = tmp_path / "database.sqlite3"
+    connection = sqlite3.connect(database)
+    connection.execute(
+        "CREATE TABLE books (oid TEXT PRIMARY KEY, title TEXT, author TEXT, year INTEGER, status TEXT)"
+    )
+    connection.execute("INSERT INTO books VALUES ('1', 'Мастер и Маргарита', 'Михаил Булгаков', 1967, 'in stock')")
+    connection.commit()
+    connection.close()
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        assert [book.oid for book in uow.books.find_by_similar_author("Bulgakov", limit=10, threshold=0.5)] == ["1"]
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import BookNotFoundException
+from app.infrastructure.uow.books.sqlite import SqliteBooksUnitOfWork
+
+
+def test_sqlite_uow_persists_committed_books(tmp_path: Path) -> None:
+    database = tmp_path / "database.sqlite3"
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        found_book = uow.books.get(book.oid)
+
+        assert found_book is not None
+        assert found_book.to_dict() == book.to_dict()
+        assert uow.books.get_by_title("1984") is not None
+        assert uow.books.get_by_title_and_author("1984", "George Orwell") is not None
+        assert uow.books.get_by_title_and_author("1984", "Aldous Huxley") is None
+
+
+def test_sqlite_uow_discards_not_committed_changes(tmp_path: Path) -> None:
+    database = tmp_path / "database.sqlite3"
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        assert uow.books.list() == []
+
+
+def test_sqlite_uow_updates_and_deletes_books(tmp_path: Path) -> None:
+    database = tmp_path / "database.sqlite3"
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.books.update(book.oid, Book(oid=book.oid, title="1984", author="George Orwell", year=1949, status="issued"))
+        uow.commit()
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        updated_book = uow.books.get(book.oid)
+        assert updated_book is not None
+        assert updated_book.status.as_generic_type() == "issued"
+
+        uow.books.delete(book.oid)
+        uow.commit()
+
+        with pytest.raises(BookNotFoundException):
+            uow.books.delete(book.oid)
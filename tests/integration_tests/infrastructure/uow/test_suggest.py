@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from app.domain.entities.books import Book
+from tests.integration_tests.infrastructure.uow.conftest import UnitOfWorkFactory
+
+
+def test_books_are_suggested_by_start_of_title_or_author(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+
+    with uow:
+        crime = uow.books.add(Book(title="Преступление и наказание", author="Фёдор Достоевский", year=1866))
+        idiot = uow.books.add(Book(title="Идиот", author="Фёдор Достоевский", year=1869))
+        war_and_peace = uow.books.add(Book(title="Война и мир", author="Лев Толстой", year=1869))
+        uow.commit()
+
+    with uow:
+        assert {book.oid for book in uow.books.suggest("дост", limit=10)} == {crime.oid, idiot.oid}
+        assert {book.oid for book in uow.books.suggest("Fedor Dost", limit=10)} == {crime.oid, idiot.oid}
+        # Completions 'i mir', 'i nakazanie' and 'idiot' are in alphabetical order
+        assert [book.oid for book in uow.books.suggest("и", limit=10)] == [war_and_peace.oid, crime.oid, idiot.oid]
+        assert [book.oid for book in uow.books.suggest("пре", limit=1)] == [crime.oid]
+        assert uow.books.suggest("Булг", limit=10) == []
+        assert uow.books.suggest(" ", limit=10) == []
+
+
+def test_suggestions_see_changes_of_the_unit_of_work(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+
+    with uow:
+        crime = uow.books.add(Book(title="Преступление и наказание", author="Фёдор Достоевский", year=1866))
+        war_and_peace = uow.books.add(Book(title="Война и мир", author="Лев Толстой", year=1869))
+        uow.commit()
+
+    with uow:
+        assert [book.oid for book in uow.books.suggest("толс", limit=10)] == [war_and_peace.oid]
+
+    with uow:
+        uow.books.update(
+            crime.oid, Book(oid=crime.oid, title="Преступление и наказание", author="Лев Толстой", year=1866)
+        )
+        uow.books.delete(war_and_peace.oid)
+        resurrection = uow.books.add(Book(title="Воскресение", author="Лев Толстой", year=1899))
+
+        assert uow.books.suggest("дост", limit=10) == []
+        assert {book.oid for book in uow.books.suggest("толс", limit=10)} == {crime.oid, resurrection.oid}
+        assert [book.oid for book in uow.books.suggest("вос", limit=10)] == [resurrection.oid]
+        uow.commit()
+
+    with uow:
+        assert {book.oid for book in uow.books.suggest("Tols", limit=10)} == {crime.oid, resurrection.oid}
+        assert uow.books.suggest("войн", limit=10) == []
@@ -0,0 +1,222 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from app.domain.entities.books import Book
+from app.domain.values.books import Year
+from app.infrastructure.exceptions import (
+    BookOidAlreadyExistsException,
+    BookVersionConflictException,
+)
+from app.infrastructure.services.books import BooksService
+from app.infrastructure.uow.books.journal import JournalBooksUnitOfWork
+from app.infrastructure.uow.books.jsonr import JsonBooksUnitOfWork
+from app.infrastructure.uow.books.sqlite import SqliteBooksUnitOfWork
+from app.infrastructure.uow.cache import CatalogCache
+from tests.integration_tests.infrastructure.uow.conftest import UnitOfWorkFactory
+
+
+def _copy(book: Book, **changes: object) -> Book:
+    return Book(**{**book.to_dict(), **changes})
+
+
+def test_json_update_increases_version_and_persists_it(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        updated_book = uow.books.update(book.oid, _copy(book, status="issued"))
+
+    assert updated_book.version == 1
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        assert uow.books.get(book.oid).version == 1  # type: ignore[union-attr]
+
+
+def test_json_update_of_book_returned_by_get_is_committed(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    cache = CatalogCache()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache, group_committer=None) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+
+    with JsonBooksUnitOfWork(file_path=database, cache=cache, group_committer=None) as uow:
+        stored_book = uow.books.get(book.oid)
+        assert stored_book is not None
+
+        stored_book.year = Year(1950)
+        updated_book = uow.books.update(book.oid, stored_book)
+        uow.commit()
+
+    assert stored_book.version == 0
+    assert updated_book.version == 1
+
+    for reader_cache in (cache, CatalogCache()):
+        with JsonBooksUnitOfWork(file_path=database, cache=reader_cache, group_committer=None) as uow:
+            stored_book = uow.books.get(book.oid)
+
+        assert stored_book is not None
+        assert stored_book.to_dict() == _copy(book, year=1950, version=1).to_dict()
+
+
+def test_json_commit_fails_if_book_was_changed_by_another_process(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    first_process = JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None)
+    second_process = JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None)
+
+    with first_process:
+        book = first_process.books.add(Book(title="1984", author="George Orwell", year=1949))
+
+    with first_process, second_process:
+        first_process.books.update(book.oid, _copy(book, status="issued"))
+        second_process.books.update(book.oid, _copy(book, year=1950))
+
+        second_process.commit()
+
+        with pytest.raises(BookVersionConflictException):
+            first_process.commit()
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        stored_book = uow.books.get(book.oid)
+
+    assert stored_book is not None
+    assert stored_book.to_dict() == _copy(book, year=1950, version=1).to_dict()
+
+
+def test_json_repository_rejects_stale_version_right_away(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+
+    with JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None) as uow:
+        with pytest.raises(BookVersionConflictException):
+            uow.books.update(book.oid, _copy(book, version=5))
+
+        with pytest.raises(BookVersionConflictException):
+            uow.books.delete(book.oid, version=5)
+
+
+def test_journal_commit_fails_if_book_was_changed_by_another_process(tmp_path: Path) -> None:
+    journal_path = tmp_path / "database.journal"
+    snapshot_path = tmp_path / "database.snapshot.json"
+    first_process = JournalBooksUnitOfWork(journal_path, snapshot_path, cache=CatalogCache(), group_committer=None)
+    second_process = JournalBooksUnitOfWork(journal_path, snapshot_path, cache=CatalogCache(), group_committer=None)
+
+    with first_process:
+        book = first_process.books.add(Book(title="1984", author="George Orwell", year=1949))
+
+    with first_process, second_process:
+        first_process.books.update(book.oid, _copy(book, status="issued"))
+        second_process.books.update(book.oid, _copy(book, year=1950))
+
+        second_process.commit()
+
+        with pytest.raises(BookVersionConflictException):
+            first_process.commit()
+
+
+def test_sqlite_update_is_compare_and_swap(tmp_path: Path) -> None:
+    database = tmp_path / "database.sqlite3"
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        book = uow.books.add(Book(title="1984", author="George Orwell", year=1949))
+        uow.commit()
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        issued_book = _copy(book, status="issued")
+        updated_book = uow.books.update(book.oid, issued_book)
+
+        assert issued_book.version == 0
+        assert updated_book.version == 1
+
+        with pytest.raises(BookVersionConflictException):
+            uow.books.update(book.oid, _copy(book, year=1950))
+
+        with pytest.raises(BookVersionConflictException):
+            uow.books.delete(book.oid, version=0)
+
+        uow.commit()
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        assert uow.books.get(book.oid).version == 1  # type: ignore[union-attr]
+
+
+def test_sqlite_database_without_versions_is_migrated(tmp_path: Path) -> None:
+    database = tmp_path / "database.sqlite3"
+    connection = sqlite3.connect(database)
+    connection.execute("CREATE TABLE books (oid TEXT PRIMARY KEY, title TEXT, author TEXT, year INTEGER, status TEXT)")
+    connection.execute("INSERT INTO books VALUES ('1', '1984', 'George Orwell', 1949, 'in stock')")
+    connection.commit()
+    connection.close()
+
+    with SqliteBooksUnitOfWork(file_path=database) as uow:
+        assert uow.books.get("1").version == 0  # type: ignore[union-attr]
+
+
+def test_service_update_without_expected_version_overwrites_the_latest_version(tmp_path: Path) -> None:
+    database = tmp_path / "database.sqlite3"
+    service = BooksService(uow=SqliteBooksUnitOfWork(file_path=database))
+    book = service.add(Book(title="1984", author="George Orwell", year=1949))
+
+    service.update(_copy(book, status="issued"))
+    updated_book = service.update(_copy(book, year=1950))
+
+    assert updated_book.version == 2
+
+    with pytest.raises(BookVersionConflictException):
+        service.update(_copy(book, year=1951), expected_version=0)
+
+
+def test_service_update_of_book_returned_by_get_does_not_change_it(tmp_path: Path) -> None:
+    database = tmp_path / "database.json"
+    service = BooksService(uow=JsonBooksUnitOfWork(file_path=database, cache=CatalogCache(), group_committer=None))
+    book = service.add(Book(title="1984", author="George Orwell", year=1949))
+
+    stored_book = service.get_by_id(book.oid)
+    stored_book.year = Year(1950)
+    updated_book = service.update(stored_book)
+
+    assert stored_book.version == 0
+    assert updated_book.version == 1
+    assert service.get_by_id(book.oid).to_dict() == _copy(book, year=1950, version=1).to_dict()
+
+
+def test_book_with_oid_of_another_book_is_not_stored(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+
+    with uow:
+        crime = uow.books.add(Book(title="Преступление и наказание", author="Фёдор Достоевский", year=1866))
+        idiot = uow.books.add(Book(title="Идиот", author="Фёдор Достоевский", year=1869))
+        uow.commit()
+
+    with uow:
+        with pytest.raises(BookOidAlreadyExistsException):
+            uow.books.add(Book(oid=crime.oid, title="Бесы", author="Фёдор Достоевский", year=1872))
+
+        with pytest.raises(BookOidAlreadyExistsException):
+            uow.books.update(idiot.oid, _copy(idiot, oid=crime.oid))
+
+        uow.rollback()
+
+    with uow:
+        assert uow.books.get(crime.oid).to_dict() == crime.to_dict()  # type: ignore[union-attr]
+        assert uow.books.get(idiot.oid).to_dict() == idiot.to_dict()  # type: ignore[union-attr]
+
+
+def test_deleted_book_may_be_added_again(tmp_path: Path, make_uow: UnitOfWorkFactory) -> None:
+    uow = make_uow(tmp_path)
+
+    with uow:
+        book = uow.books.add(Book(title="Идиот", author="Фёдор Достоевский", year=1869))
+        uow.commit()
+
+    with uow:
+        uow.books.delete(book.oid)
+        uow.books.add(_copy(book, year=1868))
+        uow.commit()
+
+    with uow:
+        assert uow.books.get(book.oid).year.as_generic_type() == 1868  # type: ignore[union-attr]
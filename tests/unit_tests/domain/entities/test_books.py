@@ -1,5 +1,7 @@
 import pytest
+from app.domain.entities import base
 from app.domain.entities.books import Book
+from app.domain.exceptions import CastException
 from app.domain.values.books import (
     Author,
     Status,
@@ -52,3 +54,66 @@ def test_books_creating_and_checking_default_status(book_mapping) -> None:
     book = Book(**book_mapping)
 
     assert book.status.value == "in stock"
+
+
+def test_books_creating_resolves_type_hints_once_per_class(monkeypatch) -> None:
+    calls = []
+    get_type_hints = base.get_type_hints
+    monkeypatch.setattr(base, "_coercion_plans", {})
+    monkeypatch.setattr(base, "get_type_hints", lambda obj: calls.append(obj) or get_type_hints(obj))
+
+    books = [Book(title="1984", author="George Orwell", year=1949) for _ in range(3)]
+
+    assert len(calls) == 1
+    assert all(isinstance(book.year, Year) for book in books)
+
+
+def test_books_creating_raises_cast_exception_for_not_castable_value() -> None:
+    with pytest.raises(CastException):
+        Book(title="1984", author="George Orwell", year="nineteen")
+
+
+def test_books_restoring_skips_validation_and_fills_defaults() -> None:
+    book = Book.restore({"oid": "1", "title": "1984", "author": "George Orwell", "year": 1949})
+
+    assert book.to_dict() == Book(oid="1", title="1984", author="George Orwell", year=1949).to_dict()
+    assert Book.restore({"title": "", "author": "", "year": 1}).title == Title.restore("")
+
+    with pytest.raises(TypeError):
+        Book.restore({"title": "1984"})
+
+
+def test_books_are_slotted_and_share_statuses_and_author_names() -> None:
+    first_book = Book(title="1984", author="".join(["George", " ", "Orwell"]), year=1949, status="issued")
+    second_book = Book.restore({"title": "Animal Farm", "author": "".join(["George ", "Orwell"]), "year": 1945})
+    third_book = Book(title="Brave New World", author="Aldous Huxley", year=1932)
+
+    assert not hasattr(first_book, "__dict__")
+    assert not hasattr(first_book.title, "__dict__")
+    assert first_book.status is Status.shared("issued")
+    assert second_book.status is third_book.status is Status.restore("in stock")
+    assert first_book.author.value is second_book.author.value
+
+
+def test_books_to_dict_gives_primitives_in_order_of_fields_and_handles_exclude_and_include() -> None:
+    book = Book(oid="1", title="1984", author="George Orwell", year=1949, version=2)
+
+    assert list(book.to_dict().items()) == [
+        ("oid", "1"), ("version", 2), ("title", "1984"), ("author", "George Orwell"), ("year", 1949),
+        ("status", "in stock"),
+    ]
+    assert book.to_dict(exclude={"oid", "version"}, include={"old_oid": "0"}) == {
+        "title": "1984", "author": "George Orwell", "year": 1949, "status": "in stock", "old_oid": "0",
+    }
+
+
+def test_books_serializing_many_gives_the_same_dicts_which_are_restored_to_the_same_books() -> None:
+    books = [
+        Book(title="1984", author="George Orwell", year=1949),
+        Book(title="Brave New World", author="Aldous Huxley", year=1932, status="issued", version=3),
+    ]
+
+    dicts = list(Book.iter_dicts(books))
+
+    assert dicts == [book.to_dict() for book in books]
+    assert [Book.restore(data).to_dict() for data in dicts] == dicts
@@ -0,0 +1,89 @@
+import random
+import re
+import sys
+from typing import List
+
+import pytest
+from app.domain.values.obscenity import (
+    _CASE_FIXED_LETTERS_START,
+    obscenity_filter,
+    RUSSIAN_SWEAR_WORDS_PATTERN,
+    RUSSIAN_SWEAR_WORDS_ROOTS,
+)
+
+
+OBSCENE_WORDS: List[str] = [
+    "хуй", "блять", "пизда", "хупизда", "пиздюлина", "ебать", "мудак", "мудень", "манда", "малафья",
+    "елда", "похуй", "нах", "ипать", "блядь",
+]
+
+LETTERS: str = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+
+
+def _corpus(amount: int, seed: int) -> List[str]:
+    generator = random.Random(seed)
+    alphabet = LETTERS + LETTERS.upper() + "  -\t\nabcxyz.,!«»—ᲀᲁᲂᲃᲄᲅᲆ"
+    texts: List[str] = []
+
+    for _ in range(amount):
+        parts: List[str] = []
+        for _ in range(generator.randint(1, 4)):
+            if generator.random() < 0.3:
+                word = generator.choice(OBSCENE_WORDS)
+                parts.append(word[generator.randint(0, 2):] if generator.random() < 0.3 else word.upper())
+            else:
+                parts.append("".join(generator.choice(alphabet) for _ in range(generator.randint(0, 8))))
+        texts.append(" ".join(parts) if generator.random() < 0.5 else "".join(parts))
+
+    return texts
+
+
+@pytest.mark.parametrize("title", [
+    *OBSCENE_WORDS,
+    *(word.upper() for word in OBSCENE_WORDS),
+    "Хуй с ним",
+    "Нахуй всё",
+    "Распиздяй и компания",
+])
+def test_obscene_title_is_found(title: str) -> None:
+    assert obscenity_filter.is_obscene(title)
+
+
+@pytest.mark.parametrize("title", [
+    "Мастер и Маргарита",
+    "Преступление и наказание",
+    "The Great Gatsby",
+    " хуй",
+    "Мастер хуй",
+    "Оскорблять",
+    "",
+])
+def test_clean_title_is_not_found(title: str) -> None:
+    assert not obscenity_filter.is_obscene(title)
+
+
+def test_filter_gives_the_same_results_as_the_pattern() -> None:
+    pattern = re.compile(RUSSIAN_SWEAR_WORDS_PATTERN)
+
+    for text in _corpus(amount=20000, seed=13):
+        assert obscenity_filter.is_obscene(text) == (pattern.match(text) is not None), text
+
+
+def test_lowercase_of_every_letter_of_roots_is_what_the_pattern_ignores_case_to() -> None:
+    letters = set("".join(RUSSIAN_SWEAR_WORDS_ROOTS))
+    any_letter = re.compile(f"(?iu)[{''.join(letters)}]")
+    candidates = [
+        chr(code) for code in range(sys.maxunicode + 1)
+        if chr(code) < _CASE_FIXED_LETTERS_START and any_letter.fullmatch(chr(code))
+    ]
+
+    for letter in letters:
+        for candidate in candidates:
+            if re.fullmatch(f"(?iu){letter}", candidate):
+                assert candidate.lower() == letter
+
+
+def test_batch_keeps_order_of_texts() -> None:
+    titles = ["Мастер и Маргарита", "хуй", "Мастер и Маргарита", "блять", "1984"]
+
+    assert obscenity_filter.is_obscene_many(titles) == [False, True, False, True, False]
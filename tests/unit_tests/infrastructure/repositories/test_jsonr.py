@@ -0,0 +1,82 @@
+from app.domain.entities.books import Book
+from app.infrastructure.repositories.books.jsonr import JsonBooksRepository
+from app.infrastructure.repositories.identity_map import IdentityMap
+
+
+def test_json_repository_finds_books_by_title_and_author_after_adding() -> None:
+    repository = JsonBooksRepository(session={})
+    book = repository.add(Book(title="1984", author="George Orwell", year=1949))
+
+    assert repository.get(book.oid) is book
+    assert repository.get_by_title("1984") is book
+    assert repository.get_by_title_and_author("1984", "George Orwell") is book
+    assert repository.get_by_title_and_author("1984", "Aldous Huxley") is None
+
+
+def test_json_repository_builds_indexes_from_loaded_session() -> None:
+    book = Book(title="1984", author="George Orwell", year=1949)
+    repository = JsonBooksRepository(session={book.oid: book})
+
+    assert repository.get_by_title("1984") is book
+    assert repository.get_by_title_and_author("1984", "George Orwell") is book
+
+
+def test_json_repository_keeps_indexes_consistent_after_update() -> None:
+    repository = JsonBooksRepository(session={})
+    book = repository.add(Book(title="1984", author="George Orwell", year=1949))
+
+    updated_book = repository.update(
+        book.oid, Book(oid=book.oid, title="Animal Farm", author="George Orwell", year=1945)
+    )
+
+    assert repository.get(book.oid) is updated_book
+    assert repository.get_by_title("1984") is None
+    assert repository.get_by_title("Animal Farm") is updated_book
+    assert repository.get_by_title_and_author("Animal Farm", "George Orwell") is updated_book
+
+
+def test_json_repository_keeps_indexes_consistent_after_delete() -> None:
+    repository = JsonBooksRepository(session={})
+    first_book = repository.add(Book(title="1984", author="George Orwell", year=1949))
+    second_book = repository.add(Book(title="1984", author="Aldous Huxley", year=1950))
+
+    repository.delete(first_book.oid)
+
+    assert repository.get(first_book.oid) is None
+    assert repository.get_by_title("1984") is second_book
+    assert repository.get_by_title_and_author("1984", "George Orwell") is None
+    assert repository.list() == [second_book]
+
+
+def test_json_repository_does_not_change_session_and_tracks_changes_in_identity_map() -> None:
+    book = Book(title="1984", author="George Orwell", year=1949)
+    session = {book.oid: book}
+    identity_map: IdentityMap[Book] = IdentityMap()
+    repository = JsonBooksRepository(session=session, identity_map=identity_map)
+
+    new_book = repository.add(Book(title="Brave New World", author="Aldous Huxley", year=1932))
+    repository.delete(book.oid)
+
+    assert session == {book.oid: book}
+    assert identity_map.new == {new_book.oid: new_book}
+    assert identity_map.deleted == {book.oid}
+    assert repository.get_by_title("1984") is None
+    assert repository.list() == [new_book]
+
+
+def test_json_repository_searches_committed_and_changed_books_by_words() -> None:
+    war_and_peace = Book(title="Война и мир", author="Лев Толстой", year=1869)
+    anna_karenina = Book(title="Анна Каренина", author="Лев Толстой", year=1877)
+    session = {book.oid: book for book in (war_and_peace, anna_karenina)}
+    repository = JsonBooksRepository(session=session)
+
+    assert repository.search("войны", limit=10) == [war_and_peace]
+    assert repository.search("толстого", limit=10) == [war_and_peace, anna_karenina]
+    assert repository.search("ТОЛСТОЙ каренина", limit=10)[0] is anna_karenina
+    assert repository.search("толстой", limit=1) == [war_and_peace]
+
+    repository.delete(war_and_peace.oid)
+    resurrection = repository.add(Book(title="Воскресение", author="Лев Толстой", year=1899))
+
+    assert repository.search("толстой", limit=10) == [anna_karenina, resurrection]
+    assert repository.search("", limit=10) == []
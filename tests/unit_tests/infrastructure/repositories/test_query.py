@@ -0,0 +1,80 @@
+from typing import List
+
+import pytest
+from app.domain.entities.books import Book
+from app.infrastructure.exceptions import UnknownSortKeyException
+from app.infrastructure.repositories.books.attributes import AttributesIndex
+from app.infrastructure.repositories.books.query import (
+    AUTHOR,
+    BooksQuery,
+    SCAN,
+    STATUS,
+    YEAR,
+)
+
+
+def make_books() -> List[Book]:
+    books = [Book(title=f"Book {year}", author="George Orwell", year=year) for year in range(1900, 2000)]
+    books += [Book(title="1984", author="Aldous Huxley", year=1949, status="issued")]
+    return books
+
+
+def test_query_matches_all_given_predicates() -> None:
+    book = Book(title="Animal Farm", author="George Orwell", year=1945, status="issued")
+
+    assert BooksQuery().matches(book)
+    assert BooksQuery(
+        year_from=1945, year_to=1945, status="issued", author="George Orwell", title_prefix="Anim"
+    ).matches(book)
+    assert not BooksQuery(year_from=1946).matches(book)
+    assert not BooksQuery(title_prefix="anim").matches(book)
+
+
+def test_query_sorts_by_keys_in_both_directions_and_then_by_oid() -> None:
+    books = make_books()
+
+    by_year_descending = BooksQuery(order_by=("-year",), limit=3).sort(books)
+    assert [book.year.as_generic_type() for book in by_year_descending] == [1999, 1998, 1997]
+
+    by_author_and_year = BooksQuery(order_by=("author", "-year")).sort(books)
+    assert by_author_and_year[0].author.as_generic_type() == "Aldous Huxley"
+    assert [book.year.as_generic_type() for book in by_author_and_year[1:3]] == [1999, 1998]
+
+    equal_titles = [Book(title="1984", author="George Orwell", year=1949) for _ in range(5)]
+    assert BooksQuery(order_by=("title",), limit=3).sort(equal_titles) == sorted(
+        equal_titles, key=lambda book: book.oid
+    )[:3]
+
+
+def test_unknown_sort_key_is_rejected() -> None:
+    with pytest.raises(UnknownSortKeyException):
+        BooksQuery(order_by=("price",))
+
+
+def test_planner_picks_the_most_selective_index() -> None:
+    index = AttributesIndex()
+    for book in make_books():
+        index.add(book)
+
+    assert index.plan(BooksQuery()).index == SCAN
+    assert index.plan(BooksQuery(year_from=1990, year_to=1999, status="issued")).index == STATUS
+    assert index.plan(BooksQuery(year_from=1990, year_to=1999, status="in stock")).index == YEAR
+    assert index.plan(BooksQuery(author="Aldous Huxley", year_from=1900)).index == AUTHOR
+    assert index.plan(BooksQuery(year_from=1990, year_to=1999)).estimated == 10
+    assert index.candidates(BooksQuery(title_prefix="Book")) is None
+
+
+def test_attributes_index_forgets_removed_books() -> None:
+    index = AttributesIndex()
+    books = make_books()
+    for book in books:
+        index.add(book)
+
+    for book in books[:50]:
+        index.remove(book)
+
+    assert len(index) == 51
+    assert index.plan(BooksQuery(year_to=1949)).estimated == 1
+    assert sorted(index.candidates(BooksQuery(year_from=1940, year_to=1955)) or []) == sorted(
+        book.oid for book in books[50:56] + books[-1:]
+    )
@@ -0,0 +1,40 @@
+import pytest
+from app.infrastructure.search.analysis import (
+    analyze,
+    fold,
+    normalize,
+    transliterate,
+)
+
+
+def test_normalize_ignores_case_and_treats_yo_as_ye() -> None:
+    assert normalize("Фёдор ДОСТОЕВСКИЙ") == "федор достоевский"
+
+
+def test_transliterate_spells_russian_letters_by_latin_ones() -> None:
+    assert transliterate("федор достоевский, 1866") == "fedor dostoevskiy, 1866"
+
+
+def test_fold_gives_the_same_words_for_russian_and_latin_spelling() -> None:
+    assert fold("Фёдор Достоевский") == ["fedor", "dostoevskiy"]
+    assert fold("FEDOR Dostoevskiy!") == ["fedor", "dostoevskiy"]
+
+
+@pytest.mark.parametrize("first, second", [
+    ("Война", "войны"),
+    ("Маргарита", "Маргариты"),
+    ("Преступление", "преступления"),
+    ("Достоевский", "Достоевского"),
+    ("Булгаков", "Булгаковым"),
+    ("Ёлка", "елки"),
+    ("stories", "story"),
+    ("dogs", "dog"),
+    ("running", "run"),
+    ("Jumped", "jump"),
+])
+def test_different_forms_of_the_word_give_the_same_stem(first: str, second: str) -> None:
+    assert analyze(first) == analyze(second)
+
+
+def test_analyze_splits_text_into_words_and_keeps_numbers() -> None:
+    assert analyze("Мастер и Маргарита, 1984!") == ["мастер", "и", "маргарит", "1984"]
@@ -0,0 +1,25 @@
+from app.infrastructure.search.inverted_index import InvertedIndex
+
+
+def test_documents_with_rare_terms_are_ranked_higher() -> None:
+    index = InvertedIndex()
+    index.add("1", {"войн": 2.0, "и": 2.0, "мир": 2.0})
+    index.add("2", {"преступлен": 2.0, "и": 2.0, "наказан": 2.0})
+    index.add("3", {"мир": 1.0})
+
+    scores = index.search(["войн", "и"])
+
+    assert set(scores) == {"1", "2"}
+    assert scores["1"] > scores["2"]
+
+
+def test_removed_document_is_not_found() -> None:
+    index = InvertedIndex()
+    index.add("1", {"мир": 2.0})
+    index.add("2", {"мир": 1.0})
+
+    index.remove("1", {"мир": 2.0})
+
+    assert index.search(["мир"]).keys() == {"2"}
+    assert index.score({"мир": 2.0}, ["мир"]) > 0
+    assert index.score({"мир": 2.0}, ["войн"]) == 0
@@ -0,0 +1,98 @@
+import random
+from typing import (
+    List,
+    Tuple,
+)
+
+import pytest
+from app.infrastructure.search import prefixes
+from app.infrastructure.search.prefixes import (
+    complete,
+    completions,
+    PrefixIndex,
+)
+
+
+NAMES: Tuple[str, ...] = ("Фёдор Достоевский", "Лев Толстой", "Михаил Булгаков", "George Orwell", "Идиот")
+
+
+def brute_force(names: List[str], prefix: str, limit: int) -> List[Tuple[str, str]]:
+    completed: List[Tuple[str, str]] = [
+        (completion, name) for name in dict.fromkeys(names) if (completion := complete(prefix, (name,))) is not None
+    ]
+    return sorted(completed)[:limit]
+
+
+def test_completions_start_at_every_word_of_the_folded_name() -> None:
+    assert completions("Фёдор Достоевский") == ["fedor dostoevskiy", "dostoevskiy"]
+    assert completions("") == []
+
+
+@pytest.mark.parametrize("prefix", ["дост", "Dost", "Фёдор дос", "fedor  DOSTOEVSKIY", "ФЕДОР"])
+def test_name_is_completed_by_start_of_any_word(prefix: str) -> None:
+    index = PrefixIndex()
+    for number, name in enumerate(NAMES):
+        index.add(name, str(number))
+
+    assert [name for _, name in index.complete(prefix, limit=10)] == ["Фёдор Достоевский"]
+    assert index.documents("Фёдор Достоевский") == ("0",)
+
+
+def test_names_are_completed_in_order_of_completions_up_to_limit() -> None:
+    index = PrefixIndex.build((name, str(number)) for number, name in enumerate(NAMES))
+
+    assert index.complete("", limit=10) == []
+    assert index.complete("л", limit=10) == [("lev tolstoy", "Лев Толстой")]
+    assert [name for _, name in index.complete("o", limit=10)] == ["George Orwell"]
+    assert index.complete("i", limit=1) == [("idiot", "Идиот")]
+
+
+def test_name_is_removed_with_its_last_document() -> None:
+    index = PrefixIndex()
+    index.add("Лев Толстой", "1")
+    index.add("Лев Толстой", "2")
+
+    index.remove("Лев Толстой", "1")
+    assert [name for _, name in index.complete("толс", limit=10)] == ["Лев Толстой"]
+
+    index.remove("Лев Толстой", "2")
+    assert index.complete("толс", limit=10) == []
+    assert len(index) == 0
+
+
+def test_only_the_first_words_of_long_names_are_completed() -> None:
+    name = " ".join(f"word{number}" for number in range(prefixes.MAX_INDEXED_WORDS + 2))
+    index = PrefixIndex()
+    index.add(name, "1")
+
+    assert index.complete(f"word{prefixes.MAX_INDEXED_WORDS - 1}", limit=10) != []
+    assert index.complete(f"word{prefixes.MAX_INDEXED_WORDS}", limit=10) == []
+
+
+def test_incremental_changes_give_the_same_completions_as_brute_force(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Small blocks, so they are split and emptied many times
+    monkeypatch.setattr(prefixes, "BLOCK_SIZE", 4)
+    generator = random.Random(18)
+    syllables = ("до", "сто", "ев", "тол", "бул", "or", "well", "a")
+    names: List[str] = [
+        " ".join(
+            "".join(generator.choice(syllables) for _ in range(generator.randint(1, 3)))
+            for _ in range(generator.randint(1, 3))
+        )
+        for _ in range(300)
+    ]
+
+    index = PrefixIndex.build((name, str(number)) for number, name in enumerate(names[:100]))
+    for number, name in enumerate(names[100:], start=100):
+        index.add(name, str(number))
+    for number in generator.sample(range(len(names)), 150):
+        index.remove(names[number], str(number))
+        names[number] = ""
+
+    alive: List[str] = [name for name in names if name]
+    for prefix in ("д", "до", "тол", "or", "a", "до ев", "welld", "b"):
+        assert sorted(index.complete(prefix, limit=len(alive))) == brute_force(alive, prefix, limit=len(alive))
+        # Different names may give equal completions, so only completions are compared at the limit
+        assert [completion for completion, _ in index.complete(prefix, limit=20)] == [
+            completion for completion, _ in brute_force(alive, prefix, limit=20)
+        ]
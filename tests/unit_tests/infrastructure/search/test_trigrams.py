@@ -0,0 +1,93 @@
+import random
+from typing import (
+    List,
+    Tuple,
+)
+
+import pytest
+from app.infrastructure.search.trigrams import (
+    NamesIndex,
+    score,
+    TrigramIndex,
+)
+
+
+FIRST_NAMES: Tuple[str, ...] = ("Фёдор", "Лев", "Михаил", "Анна", "George", "Aldous", "Frank", "Ray")
+SYLLABLES: Tuple[str, ...] = ("до", "сто", "ев", "ский", "тол", "бул", "га", "ков", "or", "well", "hux", "ley", "her")
+
+
+def make_names(amount: int) -> List[str]:
+    generator: random.Random = random.Random(amount)
+    return [
+        f"{generator.choice(FIRST_NAMES)} "
+        f"{''.join(generator.choice(SYLLABLES) for _ in range(generator.randint(1, 4))).capitalize()}"
+        for _ in range(amount)
+    ]
+
+
+@pytest.mark.parametrize("query", ["Dostoevsky", "Достоевскии", "Федор Достаевский", "достоевский ф"])
+def test_misspelled_name_is_found(query: str) -> None:
+    index = NamesIndex()
+    for number, name in enumerate(["Фёдор Достоевский", "Лев Толстой", "Михаил Булгаков", "George Orwell"]):
+        index.add(name, str(number))
+
+    found = index.find_similar(query, threshold=0.5, limit=10)
+
+    assert [name for name, _ in found] == ["Фёдор Достоевский"]
+    assert index.documents("Фёдор Достоевский") == ["0"]
+
+
+def test_names_with_all_words_of_the_query_are_the_first() -> None:
+    index = NamesIndex()
+    for number, name in enumerate(["Лев Толстой", "Алексей Толстой", "Лев Гумилёв"]):
+        index.add(name, str(number))
+
+    found = index.find_similar("Лев Толстой", threshold=0.3, limit=10)
+
+    assert found[0] == ("Лев Толстой", pytest.approx(1.0))
+    assert {name for name, _ in found[1:]} == {"Алексей Толстой", "Лев Гумилёв"}
+    assert [name_score for _, name_score in found[1:]] == pytest.approx([0.5, 0.5])
+
+
+def test_removed_name_is_not_found_until_all_its_documents_are_removed() -> None:
+    index = NamesIndex()
+    index.add("Лев Толстой", "1")
+    index.add("Лев Толстой", "2")
+
+    index.remove("Лев Толстой", "1")
+    assert [name for name, _ in index.find_similar("Толстой", threshold=0.5, limit=10)] == ["Лев Толстой"]
+
+    index.remove("Лев Толстой", "2")
+    assert index.find_similar("Толстой", threshold=0.5, limit=10) == []
+    assert len(index) == 0
+
+
+def test_removed_word_frees_its_id_for_the_next_word() -> None:
+    index = TrigramIndex()
+    index.add("tolstoy", "1")
+    index.remove("tolstoy", "1")
+    index.add("bulgakov", "2")
+
+    assert index.find_similar("tolstoy", threshold=0.3) == {}
+    assert index.find_similar("bulgakof", threshold=0.3).keys() == {"bulgakov"}
+    assert index.documents("bulgakov") == ["2"]
+
+
+@pytest.mark.parametrize("threshold", [0.3, 0.5, 0.7])
+@pytest.mark.parametrize("limit", [1, 5, 20])
+def test_index_finds_the_same_scores_as_scoring_of_every_name(threshold: float, limit: int) -> None:
+    names = make_names(1_000)
+    index = NamesIndex()
+    for number, name in enumerate(names):
+        index.add(name, str(number))
+
+    generator = random.Random(limit)
+    for _ in range(20):
+        letters = list(generator.choice(names))
+        letters[generator.randrange(len(letters))] = generator.choice("аоеи ")
+        query = "".join(letters)
+
+        expected = sorted((score(query, name, threshold) for name in set(names)), reverse=True)[:limit]
+        found = [name_score for _, name_score in index.find_similar(query, threshold, limit)]
+
+        assert found == pytest.approx([value for value in expected if value > 0])
@@ -0,0 +1,87 @@
+import io
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+import pytest
+from app.infrastructure.exceptions import UnknownStorageFormatException
+from app.infrastructure.serialization.binary import (
+    pack,
+    Unpacker,
+)
+from app.infrastructure.serialization.codecs import (
+    CODECS,
+    get_storage_format,
+    load_records,
+)
+
+
+RECORDS: List[Dict[str, Any]] = [
+    {"oid": "1", "title": "Мастер и Маргарита", "author": "Михаил Булгаков", "year": 1967, "status": "in stock"},
+    {"oid": "2", "title": "1984", "author": "George Orwell", "year": 1949, "status": "issued"},
+    {"oid": "3", "title": "x" * 70000, "extra": [None, True, False, -1.5, {"nested": []}]},
+    {"oid": "4", "title": "", "author": "", "year": -2 ** 40, "status": "in stock"},
+]
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+@pytest.mark.parametrize("compression", [None, "gzip", "lzma"])
+def test_records_are_read_back_in_any_storage_format(name: str, compression: Optional[str]) -> None:
+    f = io.BytesIO()
+    get_storage_format(name, compression).dump(f, iter(RECORDS))
+
+    f.seek(0)
+
+    assert list(load_records(f)) == RECORDS
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_empty_storage_is_read_back(name: str) -> None:
+    f = io.BytesIO()
+    get_storage_format(name).dump(f, [])
+
+    f.seek(0)
+
+    assert list(load_records(f)) == []
+
+
+def test_pretty_and_minified_json_are_the_same_as_json_dump() -> None:
+    pretty = io.BytesIO()
+    minified = io.BytesIO()
+
+    get_storage_format("pretty-json").dump(pretty, RECORDS)
+    get_storage_format("json").dump(minified, RECORDS)
+
+    assert pretty.getvalue().decode("utf-8") == json.dumps(RECORDS, ensure_ascii=False, indent=4)
+    assert minified.getvalue().decode("utf-8") == json.dumps(RECORDS, ensure_ascii=False, separators=(",", ":"))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0, 127, 128, 255, 256, 65535, 65536, 2 ** 32, 2 ** 64 - 1, -1, -32, -33, -128, -129, -2 ** 31 - 1, -2 ** 63],
+)
+def test_binary_integers_are_packed_into_msgpack_format(value: int) -> None:
+    assert Unpacker(io.BytesIO(pack(value))).unpack() == value
+
+
+def test_binary_pack_uses_msgpack_encoding() -> None:
+    assert pack({"a": [1, None, True]}) == b"\x81\xa1a\x93\x01\xc0\xc3"
+    assert pack(1.5) == b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00"
+
+
+@pytest.mark.parametrize("data", [b"LBK\x01\x93\x01", b"LBK\x01\xc1", b"\x1f\x8b\x08\x00broken"])
+def test_broken_binary_storage_raises_value_error(data: bytes) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        list(load_records(io.BytesIO(data)))
+
+
+def test_unknown_storage_format_is_rejected() -> None:
+    with pytest.raises(UnknownStorageFormatException):
+        get_storage_format("xml")
+
+    with pytest.raises(UnknownStorageFormatException):
+        get_storage_format("json", "zip")
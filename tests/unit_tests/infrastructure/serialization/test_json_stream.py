@@ -0,0 +1,56 @@
+import io
+import json
+from typing import (
+    Any,
+    List,
+)
+
+import pytest
+from app.infrastructure.serialization.json_stream import (
+    iter_json_array,
+    write_json_array,
+)
+
+
+ITEMS: List[Any] = [
+    {"oid": "1", "title": "Мастер и Маргарита", "author": "Михаил Булгаков", "year": 1967, "status": "in stock"},
+    {"oid": "2", "title": "Title with \"quotes\", [brackets] and {braces}", "year": 12345678901234567890},
+    [],
+    {},
+    -1.5e10,
+    "string",
+    None,
+    True,
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 65536])
+def test_iter_json_array_yields_the_same_items_as_json_load(chunk_size: int) -> None:
+    for text in (json.dumps(ITEMS), json.dumps(ITEMS, indent=4, ensure_ascii=False), " [ ] ", "[1]", "[ 12 , 345 ]"):
+        assert list(iter_json_array(io.StringIO(text), chunk_size=chunk_size)) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ["", "{}", "[1, 2", "[1 2]", "[1,]", "[1] 2", "[{\"title\": }]"])
+def test_iter_json_array_raises_on_broken_array(text: str) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO(text), chunk_size=2))
+
+
+def test_iter_json_array_is_lazy() -> None:
+    items = iter_json_array(io.StringIO('[{"oid": "1"}, {"oid": '), chunk_size=4)
+
+    assert next(items) == {"oid": "1"}
+
+    with pytest.raises(json.JSONDecodeError):
+        next(items)
+
+
+@pytest.mark.parametrize("items", [[], ITEMS[:2], [{"nested": {"list": [1, 2, {"a": "b"}]}}]])
+def test_write_json_array_writes_the_same_text_as_json_dump(items: List[Any]) -> None:
+    expected = io.StringIO()
+    json.dump(items, expected, ensure_ascii=False, indent=4)
+
+    actual = io.StringIO()
+    write_json_array(actual, iter(items), indent=4)
+
+    assert actual.getvalue() == expected.getvalue()
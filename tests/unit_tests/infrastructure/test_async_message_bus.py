@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import (
+    Any,
+    List,
+)
+
+from app.infrastructure.message_bus import AsyncMessageBus
+from app.infrastructure.uow.base import (
+    AbstractUnitOfWork,
+    AsyncUnitOfWork,
+)
+from app.logic.commands.base import AbstractCommand
+from app.logic.events.base import AbstractEvent
+from app.logic.handlers.base import (
+    AbstractAsyncCommandHandler,
+    AbstractAsyncEventHandler,
+)
+
+
+class FakeUnitOfWork(AbstractUnitOfWork):
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class PingCommand(AbstractCommand):
+    pass
+
+
+@dataclass(frozen=True)
+class PingedEvent(AbstractEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class ReportedEvent(AbstractEvent):
+    pass
+
+
+class PingCommandHandler(AbstractAsyncCommandHandler[PingCommand]):
+    def __init__(self, uow: AsyncUnitOfWork) -> None:
+        self._uow = uow
+
+    async def __call__(self, command: PingCommand) -> Any:
+        self._uow.add_event(PingedEvent())
+        return "pong"
+
+
+class WaitingEventHandler(AbstractAsyncEventHandler[PingedEvent]):
+    """
+    Every handler waits for all handlers of the event, so they complete only if they run concurrently.
+    """
+
+    def __init__(self, uow: AsyncUnitOfWork, barrier: asyncio.Barrier, log: List[str]) -> None:
+        self._uow = uow
+        self._barrier = barrier
+        self._log = log
+
+    async def __call__(self, event: PingedEvent) -> None:
+        await self._barrier.wait()
+        self._uow.add_event(ReportedEvent())
+        self._log.append("pinged")
+
+
+class ReportedEventHandler(AbstractAsyncEventHandler[ReportedEvent]):
+    def __init__(self, log: List[str]) -> None:
+        self._log = log
+
+    async def __call__(self, event: ReportedEvent) -> None:
+        self._log.append("reported")
+
+
+def test_event_handlers_run_concurrently_and_their_events_are_handled_after_them() -> None:
+    async def scenario() -> None:
+        log: List[str] = []
+        uow: AsyncUnitOfWork = AsyncUnitOfWork(uow=FakeUnitOfWork())
+        barrier: asyncio.Barrier = asyncio.Barrier(3)
+        messagebus: AsyncMessageBus = AsyncMessageBus(
+            uow=uow,
+            event_handlers={
+                PingedEvent: [WaitingEventHandler(uow, barrier, log) for _ in range(3)],
+                ReportedEvent: [ReportedEventHandler(log)],
+            },
+            command_handlers={PingCommand: PingCommandHandler(uow)},
+        )
+
+        await asyncio.wait_for(messagebus.handle(PingCommand()), timeout=5)
+
+        assert messagebus.command_result == "pong"
+        assert log == ["pinged"] * 3 + ["reported"] * 3
+
+    asyncio.run(scenario())
+
+
+def test_blocking_function_runs_outside_of_the_event_loop_thread() -> None:
+    async def scenario() -> None:
+        uow: AsyncUnitOfWork = AsyncUnitOfWork(uow=FakeUnitOfWork())
+        assert await uow.run(threading.get_ident) != threading.get_ident()
+
+    asyncio.run(scenario())
@@ -0,0 +1,127 @@
+import inspect
+from dataclasses import dataclass
+from typing import (
+    Any,
+    List,
+)
+
+import pytest
+from app.infrastructure.container import Container
+from app.infrastructure.uow.base import AbstractUnitOfWork
+from app.logic.commands.base import AbstractCommand
+from app.logic.events.base import AbstractEvent
+from app.logic.handlers.base import (
+    AbstractCommandHandler,
+    AbstractEventHandler,
+)
+
+
+class FakeUnitOfWork(AbstractUnitOfWork):
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class PingCommand(AbstractCommand):
+    pass
+
+
+@dataclass(frozen=True)
+class PongCommand(AbstractCommand):
+    pass
+
+
+@dataclass(frozen=True)
+class PingedEvent(AbstractEvent):
+    pass
+
+
+created: List[type] = []
+handled: List[Any] = []
+
+
+class PingCommandHandler(AbstractCommandHandler[PingCommand]):
+    def __init__(self, uow: AbstractUnitOfWork, clock: str) -> None:
+        created.append(type(self))
+        self._uow = uow
+        self._clock = clock
+
+    def __call__(self, command: PingCommand) -> Any:
+        self._uow.add_event(PingedEvent())
+        return self._uow, self._clock
+
+
+class PongCommandHandler(AbstractCommandHandler[PongCommand]):
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
+        created.append(type(self))
+
+    def __call__(self, command: PongCommand) -> Any:
+        return None
+
+
+class PingedEventHandler(AbstractEventHandler[PingedEvent]):
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
+        created.append(type(self))
+        self._uow = uow
+
+    def __call__(self, event: PingedEvent) -> None:
+        handled.append(self._uow)
+
+
+@pytest.fixture
+def container() -> Container:
+    created.clear()
+    handled.clear()
+    return Container(
+        uow_factory=FakeUnitOfWork,
+        events_handlers_for_injection={PingedEvent: [PingedEventHandler]},
+        commands_handlers_for_injection={PingCommand: PingCommandHandler, PongCommand: PongCommandHandler},
+        dependencies={"clock": "system clock", "unused": object()},
+    )
+
+
+def test_every_message_bus_has_its_own_unit_of_work(container: Container) -> None:
+    first_messagebus = container.get_messagebus()
+    second_messagebus = container.get_messagebus()
+
+    first_messagebus.handle(PingCommand())
+    second_messagebus.handle(PingCommand())
+
+    first_uow, clock = first_messagebus.command_result
+    second_uow, _ = second_messagebus.command_result
+    assert first_uow is not second_uow
+    assert clock == "system clock"
+    assert handled == [first_uow, second_uow]
+
+
+def test_only_handlers_of_handled_messages_are_created(container: Container) -> None:
+    messagebus = container.get_messagebus()
+    assert created == []
+
+    messagebus.handle(PingCommand())
+    messagebus.handle(PingCommand())
+
+    assert created == [PingCommandHandler, PingedEventHandler]
+
+
+def test_handlers_are_not_inspected_per_message_bus(container: Container, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("signature must be inspected only once")
+
+    monkeypatch.setattr(inspect, "signature", fail)
+
+    messagebus = container.get_messagebus()
+    messagebus.handle(PongCommand())
+    messagebus.handle(PingCommand())
+
+
+def test_unknown_command_is_not_handled(container: Container) -> None:
+    @dataclass(frozen=True)
+    class UnknownCommand(AbstractCommand):
+        pass
+
+    with pytest.raises(KeyError):
+        container.get_messagebus().handle(UnknownCommand())
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import (
+    Any,
+    List,
+)
+
+import pytest
+from app.infrastructure.exceptions import MessageBusMessageException
+from app.infrastructure.message_bus import MessageBus
+from app.infrastructure.uow.base import AbstractUnitOfWork
+from app.logic.commands.base import AbstractCommand
+from app.logic.events.base import AbstractEvent
+from app.logic.handlers.base import (
+    AbstractCommandHandler,
+    AbstractEventHandler,
+)
+
+
+class FakeUnitOfWork(AbstractUnitOfWork):
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class CountCommand(AbstractCommand):
+    amount: int
+
+
+@dataclass(frozen=True)
+class CountDownCommand(CountCommand):
+    pass
+
+
+@dataclass(frozen=True)
+class CountedEvent(AbstractEvent):
+    left: int
+
+
+@dataclass(frozen=True)
+class LastCountedEvent(CountedEvent):
+    pass
+
+
+class CountCommandHandler(AbstractCommandHandler[CountCommand]):
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
+        self._uow = uow
+
+    def __call__(self, command: CountCommand) -> Any:
+        self._uow.add_event(CountedEvent(left=command.amount))
+        return type(command).__name__
+
+
+class CountedEventHandler(AbstractEventHandler[CountedEvent]):
+    def __init__(self, uow: AbstractUnitOfWork, log: List[Any]) -> None:
+        self._uow = uow
+        self._log = log
+
+    def __call__(self, event: CountedEvent) -> None:
+        self._log.append(event)
+        if event.left > 1:
+            self._uow.add_event(CountedEvent(left=event.left - 1))
+        elif event.left == 1:
+            self._uow.add_event(LastCountedEvent(left=0))
+
+
+class LastCountedEventHandler(AbstractEventHandler[LastCountedEvent]):
+    def __init__(self, log: List[Any]) -> None:
+        self._log = log
+
+    def __call__(self, event: LastCountedEvent) -> None:
+        self._log.append("last")
+
+
+def _messagebus(log: List[Any]) -> MessageBus:
+    uow = FakeUnitOfWork()
+    return MessageBus(
+        uow=uow,
+        event_handlers={
+            CountedEvent: [CountedEventHandler(uow, log), CountedEventHandler(FakeUnitOfWork(), log)],
+            LastCountedEvent: [LastCountedEventHandler(log)],
+        },
+        command_handlers={CountCommand: CountCommandHandler(uow)},
+    )
+
+
+def test_command_without_own_handler_is_handled_by_handler_of_its_base_class() -> None:
+    messagebus = _messagebus([])
+
+    messagebus.handle(CountDownCommand(amount=0))
+    assert messagebus.command_result == "CountDownCommand"
+
+
+def test_long_chain_of_events_is_handled_in_order_and_base_handlers_receive_subclasses() -> None:
+    log: List[Any] = []
+    _messagebus(log).handle(CountCommand(amount=10_000))
+
+    # Every event is received by both its handlers, even when the first one raises new events
+    counted: List[int] = [event.left for event in log if isinstance(event, CountedEvent)]
+    assert counted == [left for left in range(10_000, -1, -1) for _ in range(2)]
+    # Handlers of the event class go before handlers of its base classes
+    assert log[-3:] == ["last", LastCountedEvent(left=0), LastCountedEvent(left=0)]
+
+
+def test_message_of_unknown_type_is_not_handled() -> None:
+    @dataclass(frozen=True)
+    class UnknownCommand(AbstractCommand):
+        pass
+
+    messagebus = _messagebus([])
+    with pytest.raises(KeyError):
+        messagebus.handle(UnknownCommand())
+    with pytest.raises(MessageBusMessageException):
+        messagebus.handle("message")  # type: ignore[arg-type]